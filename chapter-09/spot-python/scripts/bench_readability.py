@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Readability benchmark - no API calls required
+Usage: python scripts/bench_readability.py [--sizes 10000,100000,1000000] [--repeat 5]
+Example: python scripts/bench_readability.py --file content/article.md
+
+Times the Flesch-Kincaid grade of documents of the given sizes (in
+characters), comparing the original implementation (three regex passes
+and per-word syllable regexes) with the single-pass ReadabilityStats,
+which also computes Reading Ease, Gunning Fog, SMOG and Coleman-Liau.
+Uses a document made from the bundled templates and style pack, or
+--file, repeated up to each size.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the spot package to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from spot.utils.readability import ReadabilityStats, word_syllables
+
+
+def legacy_flesch_kincaid_grade(text):
+    """The original flesch_kincaid_grade and count_syllables."""
+    sentences = max(1, len(re.findall(r'[.!?]+', text)))
+    words = max(1, len(re.findall(r'\b\w+\b', text)))
+    syllables = 0
+    for word in re.findall(r'[a-z]+', text.lower()):
+        syllable_word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
+        syllable_word = re.sub(r'^y', '', syllable_word)
+        vowel_matches = re.findall(r'[aeiouy]{1,2}', syllable_word)
+        syllables += len(vowel_matches) if vowel_matches else 1
+    grade = 0.39 * (words / sentences) + 11.8 * (syllables / words) - 15.59
+    return max(0.0, round(grade, 1))
+
+
+def sample_text():
+    """Prose-like text from the repository's templates and style pack."""
+    root = Path(__file__).parent.parent
+    parts = [path.read_text(encoding="utf-8") for path in sorted((root / "templates").glob("*.json"))]
+    parts.append((root / "style" / "stylepack.json").read_text(encoding="utf-8"))
+    return re.sub(r'[{}\[\]":,]+', " ", "\n".join(parts))
+
+
+def best_of(repeat, func, *args):
+    """Best seconds per call over ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated document sizes in characters")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    parser.add_argument("--file", type=Path, help="Text to repeat instead of the bundled sample")
+    args = parser.parse_args()
+    
+    base = args.file.read_text(encoding="utf-8") if args.file else sample_text()
+    
+    print(f"{'chars':>10} {'legacy ms':>10} {'engine ms':>10} {'cold ms':>8} {'speedup':>8}  FK")
+    for size in (int(value) for value in args.sizes.split(",")):
+        text = (base * (size // len(base) + 1))[:size]
+        word_syllables.cache_clear()
+        cold = best_of(1, ReadabilityStats.from_text, text)
+        legacy = best_of(args.repeat, legacy_flesch_kincaid_grade, text)
+        engine = best_of(args.repeat, ReadabilityStats.from_text, text)
+        grade = ReadabilityStats.from_text(text).flesch_kincaid_grade()
+        assert grade == legacy_flesch_kincaid_grade(text)
+        print(
+            f"{size:>10} {legacy * 1000:>10.1f} {engine * 1000:>10.1f} {cold * 1000:>8.1f} "
+            f"{legacy / engine:>7.1f}x  {grade}"
+        )
+
+
+if __name__ == "__main__":
+    main()
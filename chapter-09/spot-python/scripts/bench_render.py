@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Template render micro-benchmark - no API calls required
+Usage: python scripts/bench_render.py [--sizes 1000,1000000,5000000] [--variables 20]
+Example: python scripts/bench_render.py --template repurpose_pack@1.0.0 --sizes 4000000
+
+Renders a template with a large injected input (``markdown`` for
+repurpose_pack) plus a number of extra variables, comparing the old
+per-variable ``str.replace`` loop with the compiled template.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the spot package to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from spot.core.template_engine import CompiledTemplate
+
+
+def legacy_render(text, variables):
+    """The old approach: one str.replace pass over the prompt per variable."""
+    for key, value in variables.items():
+        text = text.replace(f"{{{key}}}", str(value))
+    return text
+
+
+def best_of(repeat, func, *args):
+    """Fastest of ``repeat`` timed calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--template", default="repurpose_pack@1.0.0", help="Template to render")
+    parser.add_argument("--sizes", default="1000,1000000,5000000", help="Comma-separated sizes of the large input in characters")
+    parser.add_argument("--variables", type=int, default=20, help="Extra variables passed with each render")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed renders per size (best is reported)")
+    args = parser.parse_args()
+    
+    templates_dir = Path(__file__).parent.parent / "templates"
+    with open(templates_dir / f"{args.template}.json", "r", encoding="utf-8") as f:
+        template = json.load(f)
+    text = template.get("prompt", template.get("user"))
+    
+    started = time.perf_counter()
+    compiled = CompiledTemplate.compile(template)
+    compile_ms = (time.perf_counter() - started) * 1000
+    print(f"Compiled {args.template} in {compile_ms:.3f} ms ({len(compiled.prompt.names)} placeholders)")
+    
+    large_input = compiled.prompt.placeholders[0]
+    print(f"{'input chars':>12} {'legacy ms':>10} {'compiled ms':>12} {'speedup':>8}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        variables = {name: f"value for {name}" for name in compiled.inputs}
+        variables[large_input] = ("Lorem ipsum dolor sit amet. " * (size // 28 + 1))[:size]
+        # Variables the template does not use still cost the legacy loop a full pass
+        variables.update({f"extra_{index}": index for index in range(args.variables)})
+        
+        assert compiled.render(variables) == legacy_render(text, variables)
+        legacy = best_of(args.repeat, legacy_render, text, variables)
+        fast = best_of(args.repeat, compiled.render, variables)
+        print(f"{size:>12} {legacy * 1000:>10.3f} {fast * 1000:>12.3f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
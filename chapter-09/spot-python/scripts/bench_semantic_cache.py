@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Semantic cache lookup benchmark - no API calls required
+Usage: python scripts/bench_semantic_cache.py [--sizes 10000,100000,1000000] [--dimensions 256]
+Example: python scripts/bench_semantic_cache.py --sizes 10000,100000 --queries 500
+
+Fills a SemanticCache with random unit vectors and times top-k lookups.
+The 1M entry index at 256 dimensions needs about 1 GB of memory. For the
+smallest size the per-entry Python loop from chapter-07/listing0707.py is
+timed as well for comparison.
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the spot package to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from spot.providers.semantic_cache import HashingEmbedder, SemanticCache
+
+
+def linear_scan(entries, query, threshold):
+    """The listing0707 approach: Python loop of cosine similarity per entry."""
+    for embedding, response in entries:
+        dot = sum(a * b for a, b in zip(query, embedding))
+        norm = math.sqrt(sum(a * a for a in query)) * math.sqrt(sum(b * b for b in embedding))
+        if norm and dot / norm > threshold:
+            return response
+    return None
+
+
+def build_cache(size, dimensions, rng):
+    """Fill a cache with ``size`` random normalized rows."""
+    cache = SemanticCache(HashingEmbedder(dimensions), capacity=size, threshold=0.9)
+    vectors = rng.standard_normal((size, dimensions), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    for index, vector in enumerate(vectors):
+        cache.insert(vector, index)
+    return cache, vectors
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated index sizes")
+    parser.add_argument("--dimensions", type=int, default=256, help="Embedding dimensions")
+    parser.add_argument("--queries", type=int, default=200, help="Lookups per size")
+    parser.add_argument("--k", type=int, default=5, help="Neighbours per lookup")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(0)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(f"{'entries':>10} {'k':>3} {'mean ms':>10} {'p95 ms':>10} {'lookups/s':>10}")
+    
+    for size in sizes:
+        cache, vectors = build_cache(size, args.dimensions, rng)
+        # Half the queries are near-duplicates of cached rows, half are random
+        queries = []
+        for index in range(args.queries):
+            if index % 2:
+                query = rng.standard_normal(args.dimensions, dtype=np.float32)
+            else:
+                query = vectors[rng.integers(size)] + 0.05 * rng.standard_normal(args.dimensions, dtype=np.float32)
+            queries.append(cache.normalize(query))
+        
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            cache.search(query, k=args.k)
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        mean = sum(timings) / len(timings)
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{size:>10} {args.k:>3} {mean * 1000:>10.3f} {p95 * 1000:>10.3f} {1 / mean:>10.0f}")
+        
+        if size == min(sizes):
+            entries = [(vector.tolist(), index) for index, vector in enumerate(vectors)]
+            sample = [query.tolist() for query in queries[1:20:2]]
+            started = time.perf_counter()
+            for query in sample:
+                linear_scan(entries, query, cache.threshold)
+            scan = (time.perf_counter() - started) / len(sample)
+            print(f"{'':>10} listing0707 linear scan (misses): {scan * 1000:.1f} ms per lookup")
+        
+        del cache, vectors
+
+
+if __name__ == "__main__":
+    main()
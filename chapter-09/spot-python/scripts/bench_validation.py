@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Output validation benchmark - no API calls required
+Usage: python scripts/bench_validation.py [--template draft_scaffold@1.0.0] [--sizes 1000,10000,100000,1000000]
+Example: python scripts/bench_validation.py --sizes 2000,50000 --repeat 200
+
+Builds responses of roughly the given sizes (in bytes) that match the
+template's output_schema and times parsing plus validation per response,
+comparing a compiled OutputValidator with calling jsonschema.validate on
+every response (which re-checks the schema and builds a validator each time).
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import jsonschema
+
+# Add the spot package to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from spot.core.validation import OutputValidator, extract_json
+
+
+def scaffold_response(size):
+    """A valid draft_scaffold response of about ``size`` bytes."""
+    bullet_length = max(8, size // 20)
+    bullet = ("idea " * (bullet_length // 5 + 1))[:bullet_length]
+    sections = [{"heading": f"Section {index}", "bullets": [bullet] * 4} for index in range(5)]
+    return json.dumps({"title": "Benchmark", "sections": sections})
+
+
+def per_call(repeat, func, content):
+    """Mean seconds per call over ``repeat`` calls."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(content)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--template", default="draft_scaffold@1.0.0", help="Template whose output_schema is used")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="Comma-separated response sizes in bytes")
+    parser.add_argument("--repeat", type=int, default=100, help="Validations per size")
+    args = parser.parse_args()
+    
+    templates_dir = Path(__file__).parent.parent / "templates"
+    with open(templates_dir / f"{args.template}.json", "r", encoding="utf-8") as f:
+        schema = json.load(f)["output_schema"]
+    
+    validator = OutputValidator(schema)
+    
+    def uncompiled(content):
+        jsonschema.validate(extract_json(content), schema)
+    
+    print(f"{'bytes':>10} {'compiled us':>12} {'validate() us':>14} {'responses/s':>12}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        content = scaffold_response(size)
+        assert validator.validate(content).valid
+        compiled = per_call(args.repeat, validator.validate, content)
+        baseline = per_call(args.repeat, uncompiled, content)
+        print(f"{len(content):>10} {compiled * 1e6:>12.1f} {baseline * 1e6:>14.1f} {1 / compiled:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
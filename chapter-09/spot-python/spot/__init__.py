@@ -8,9 +8,23 @@ __version__ = "1.0.0"
 __author__ = "Chris Minnick"
 __email__ = "chris@minnick.com"
 
-from .core.spot import SPOT
-from .core.config import Config
-from .providers.manager import ProviderManager
-from .utils.logger import get_logger
+from importlib import import_module
 
-__all__ = ["SPOT", "Config", "ProviderManager", "get_logger"]
\ No newline at end of file
+__all__ = ["SPOT", "Config", "ProviderManager", "get_logger"]
+
+# Exports are imported on first access so that ``import spot`` (and the CLI)
+# does not pay for pydantic, structlog and the provider modules up front.
+_EXPORTS = {
+    "SPOT": ".core.spot",
+    "Config": ".core.config",
+    "ProviderManager": ".providers.manager",
+    "get_logger": ".utils.logger",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,14 +11,22 @@ from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 
-from .core.spot import SPOT
-from .core.config import Config, get_config
-from .utils.logger import configure_logging, get_logger
-
 
 console = Console()
 
 
+def _get_spot(ctx):
+    """Get the SPOT instance, building it on first use.
+    
+    Only commands that talk to providers or templates need it, so ``--help``
+    and style-only commands skip constructing it.
+    """
+    if 'spot' not in ctx.obj:
+        from .core.spot import SPOT
+        ctx.obj['spot'] = SPOT(ctx.obj['config'])
+    return ctx.obj['spot']
+
+
 @click.group()
 @click.option('--config', '-c', type=click.Path(exists=True), help='Config file path')
 @click.option('--log-level', default='info', help='Log level')
@@ -26,6 +34,10 @@ console = Console()
 @click.pass_context
 def cli(ctx, config, log_level, provider):
     """SPOT - Structured Prompt Output Toolkit."""
+    # Imported here so ``spot --help`` stays fast
+    from .core.config import get_config
+    from .utils.logger import configure_logging
+    
     # Initialize configuration
     if config:
         # Load custom config if provided
@@ -50,7 +62,6 @@ def cli(ctx, config, log_level, provider):
     # Store config in context
     ctx.ensure_object(dict)
     ctx.obj['config'] = spot_config
-    ctx.obj['spot'] = SPOT(spot_config)
 
 
 @cli.command()
@@ -58,7 +69,7 @@ def cli(ctx, config, log_level, provider):
 def health(ctx):
     """Check system health and component status."""
     async def run_health_check():
-        spot = ctx.obj['spot']
+        spot = _get_spot(ctx)
         try:
             result = await spot.health_check()
             
@@ -73,9 +84,12 @@ def health(ctx):
             table.add_row("Overall", f"[{status_color}]{result['status'].upper()}[/{status_color}]", "")
             
             # Provider status
+            breakers = result.get("circuit_breakers", {})
             for provider, healthy in result["providers"].items():
                 status_text = "[green]HEALTHY[/green]" if healthy else "[red]UNHEALTHY[/red]"
-                table.add_row(f"Provider: {provider}", status_text, "")
+                breaker = breakers.get(provider)
+                details = f"circuit: {breaker['state']}" if breaker else ""
+                table.add_row(f"Provider: {provider}", status_text, details)
             
             # Templates
             template_status = "[green]AVAILABLE[/green]" if result["templates_available"] else "[red]MISSING[/red]"
@@ -100,17 +114,19 @@ def health(ctx):
 @click.option('--provider', help='AI provider to use')
 @click.option('--max-tokens', type=int, help='Maximum tokens to generate')
 @click.option('--temperature', type=float, help='Generation temperature')
+@click.option('--no-cache', is_flag=True, help='Bypass the response cache')
+@click.option('--refresh-cache', is_flag=True, help='Regenerate and overwrite the cached response')
 @click.pass_context
-def generate(ctx, template, input_file, output_file, provider, max_tokens, temperature):
+def generate(ctx, template, input_file, output_file, provider, max_tokens, temperature, no_cache, refresh_cache):
     """Generate content using a template."""
     async def run_generate():
-        spot = ctx.obj['spot']
+        spot = _get_spot(ctx)
         
         try:
             kwargs = {}
             if max_tokens:
                 kwargs['max_tokens'] = max_tokens
-            if temperature:
+            if temperature is not None:
                 kwargs['temperature'] = temperature
             
             with console.status(f"Generating content with template {template}..."):
@@ -119,10 +135,14 @@ def generate(ctx, template, input_file, output_file, provider, max_tokens, tempe
                     input_data=input_file,
                     output_file=output_file,
                     provider=provider,
+                    use_cache=not no_cache,
+                    refresh_cache=refresh_cache,
                     **kwargs
                 )
             
             rprint(f"[green]✓[/green] Content generated successfully!")
+            if result.get('cached'):
+                rprint(f"Served from {result.get('cache_tier', 'response')} cache")
             rprint(f"Provider: {result.get('provider', 'unknown')}")
             rprint(f"Model: {result.get('model', 'unknown')}")
             
@@ -130,6 +150,12 @@ def generate(ctx, template, input_file, output_file, provider, max_tokens, tempe
                 usage = result['usage']
                 rprint(f"Tokens: {usage.get('total_tokens', 0)} total")
             
+            validation = result.get('validation')
+            if validation and not validation['valid']:
+                rprint(f"[yellow]⚠ Output does not match the template schema: {validation['errors'][0]}[/yellow]")
+            elif result.get('repaired'):
+                rprint("Output repaired to match the template schema")
+            
             if output_file:
                 rprint(f"Output saved to: [cyan]{output_file}[/cyan]")
             else:
@@ -152,7 +178,7 @@ def generate(ctx, template, input_file, output_file, provider, max_tokens, tempe
 def evaluate(ctx, template, provider):
     """Run evaluation tests."""
     async def run_evaluate():
-        spot = ctx.obj['spot']
+        spot = _get_spot(ctx)
         
         try:
             with console.status("Running evaluation..."):
@@ -190,7 +216,7 @@ def evaluate(ctx, template, provider):
 def validate(ctx):
     """Validate all templates and configurations."""
     async def run_validate():
-        spot = ctx.obj['spot']
+        spot = _get_spot(ctx)
         
         try:
             with console.status("Validating templates..."):
@@ -206,7 +232,7 @@ def validate(ctx):
             for result in results:
                 template_id = result.get("templateId", "unknown")
                 status = result.get("status", "unknown")
-                error = result.get("error", "")
+                error = result.get("error") or "; ".join(result.get("warnings", []))
                 
                 if status == "valid":
                     status_text = "[green]VALID[/green]"
@@ -237,7 +263,7 @@ def validate(ctx):
 def interactive(ctx):
     """Start interactive mode."""
     config = ctx.obj['config']
-    spot = ctx.obj['spot']
+    spot = _get_spot(ctx)
     
     async def run_interactive():
         rprint("[cyan]🚀 SPOT Interactive Mode[/cyan]")
@@ -320,43 +346,78 @@ def web(ctx, host, port, reload):
 
 
 @cli.command()
-@click.argument('content_file', type=click.Path(exists=True))
-@click.option('--format', 'output_format', type=click.Choice(['console', 'json']), default='console', help='Output format')
+@click.argument('paths', nargs=-1, required=True)
+@click.option('--format', 'output_format', type=click.Choice(['console', 'json', 'jsonl', 'sarif']), default='console', help='Output format')
+@click.option('--workers', type=int, help='Worker processes (default: CPU count)')
 @click.pass_context
-def lint(ctx, content_file, output_format):
-    """Lint content against style pack rules."""
-    async def run_lint():
-        spot = ctx.obj['spot']
-        
-        try:
-            with console.status(f"Linting {content_file}..."):
-                result = await spot.lint_file(content_file)
-            
-            if output_format == 'json':
-                print(json.dumps(result, indent=2))
+def lint(ctx, paths, output_format, workers):
+    """Lint files, directories and glob patterns against style pack rules.
+    
+    Exits with 0 when every file is compliant, 1 when any file has
+    violations and 2 when a file or pattern could not be linted.
+    """
+    from spot.utils.batch_lint import EXIT_ERROR, collect_paths, exit_code, lint_paths, sarif_report
+    from spot.utils.style_linter import format_style_report, load_style_pack
+    
+    try:
+        style_pack = load_style_pack()
+    except Exception as e:
+        rprint(f"[red]✗ Linting failed: {e}[/red]")
+        sys.exit(EXIT_ERROR)
+    
+    files, unmatched = collect_paths(paths)
+    for pattern in unmatched:
+        click.echo(f"No files to lint for: {pattern}", err=True)
+    
+    # Results stream out as worker chunks finish, except for formats that
+    # need the whole set (json, sarif)
+    results = []
+    for result in lint_paths(files, style_pack, workers=workers):
+        results.append(result)
+        if output_format == 'jsonl':
+            print(json.dumps(result), flush=True)
+        elif output_format == 'console' and len(files) > 1:
+            _print_lint_summary(result)
+    
+    if output_format == 'json':
+        output = results[0] if len(paths) == 1 and len(results) == 1 else sorted(results, key=lambda r: r["file_path"])
+        print(json.dumps(output, indent=2))
+    elif output_format == 'sarif':
+        print(json.dumps(sarif_report(sorted(results, key=lambda r: r["file_path"]), style_pack), indent=2))
+    elif output_format == 'console':
+        if len(files) == 1 and "error" not in results[0]:
+            result = results[0]
+            rprint(format_style_report(result["report"], style_pack, Path(result["file_path"]).name))
+            if not result["compliant"]:
+                rprint(f"\n[yellow]Style compliance score: {result['score']:.2f}/1.00[/yellow]")
             else:
-                from spot.utils.style_linter import format_style_report
-                
-                file_name = Path(content_file).name
-                report_text = format_style_report(
-                    result["report"], 
-                    result["stylepack"], 
-                    file_name
-                )
-                
-                rprint(report_text)
-                
-                if not result["compliant"]:
-                    rprint(f"\n[yellow]Style compliance score: {result['score']:.2f}/1.00[/yellow]")
-                    sys.exit(1)
-                else:
-                    rprint(f"\n[green]✓ Content is style compliant (score: {result['score']:.2f}/1.00)[/green]")
-        
-        except Exception as e:
-            rprint(f"[red]✗ Linting failed: {e}[/red]")
-            sys.exit(1)
+                rprint(f"\n[green]✓ Content is style compliant (score: {result['score']:.2f}/1.00)[/green]")
+        elif len(files) == 1:
+            _print_lint_summary(results[0])
+        failed = sum(1 for result in results if "error" in result)
+        compliant = sum(1 for result in results if result.get("compliant"))
+        if len(files) > 1:
+            rprint(
+                f"\nLinted {len(results)} file(s): {compliant} compliant, "
+                f"{len(results) - compliant - failed} with violations, {failed} failed"
+            )
     
-    asyncio.run(run_lint())
+    code = exit_code(results)
+    if unmatched or not files:
+        code = EXIT_ERROR
+    sys.exit(code)
+
+
+def _print_lint_summary(result):
+    """Print one line (plus violations) for a file in a batch lint."""
+    if "error" in result:
+        rprint(f"[red]✗ {result['file_path']}: {result['error']}[/red]")
+    elif result["compliant"]:
+        rprint(f"[green]✓ {result['file_path']}[/green] (score: {result['score']:.2f})")
+    else:
+        rprint(f"[yellow]✗ {result['file_path']}[/yellow] (score: {result['score']:.2f})")
+        for violation in result["violations"]:
+            rprint(f"    {violation['message']}")
 
 
 @cli.command()
@@ -366,59 +427,55 @@ def lint(ctx, content_file, output_format):
 @click.pass_context
 def style_check(ctx, content, content_file, output_format):
     """Check content against style pack rules."""
-    async def run_style_check():
-        spot = ctx.obj['spot']
+    from spot.utils.style_linter import format_style_report, lint_style, load_style_pack, style_result
+    
+    try:
+        # Get content from various sources
+        if content == '-':
+            # Read from stdin
+            text_content = sys.stdin.read()
+        elif content:
+            text_content = content
+        elif content_file:
+            with open(content_file, 'r', encoding='utf-8') as f:
+                text_content = f.read()
+        else:
+            rprint("[red]Error: Provide content via --content, --file, or stdin[/red]")
+            sys.exit(1)
         
-        try:
-            # Get content from various sources
-            if content == '-':
-                # Read from stdin
-                text_content = sys.stdin.read()
-            elif content:
-                text_content = content
-            elif content_file:
-                with open(content_file, 'r', encoding='utf-8') as f:
-                    text_content = f.read()
-            else:
-                rprint("[red]Error: Provide content via --content, --file, or stdin[/red]")
-                sys.exit(1)
+        with console.status("Checking style compliance..."):
+            style_pack = load_style_pack()
+            result = style_result(lint_style(text_content, style_pack), style_pack)
+        
+        if output_format == 'json':
+            # Convert violations for JSON serialization
+            json_result = {
+                "violations": result["violations"],
+                "compliant": result["compliant"],
+                "score": result["score"],
+                "report": result["report"]
+            }
+            print(json.dumps(json_result, indent=2))
+        else:
+            file_name = content_file or "content"
+            report_text = format_style_report(
+                result["report"], 
+                style_pack, 
+                file_name
+            )
             
-            with console.status("Checking style compliance..."):
-                result = await spot.check_style(text_content)
+            rprint(report_text)
             
-            if output_format == 'json':
-                # Convert violations for JSON serialization
-                json_result = {
-                    "violations": result["violations"],
-                    "compliant": result["compliant"],
-                    "score": result["score"],
-                    "report": result["report"]
-                }
-                print(json.dumps(json_result, indent=2))
+            if not result["compliant"]:
+                rprint(f"\n[yellow]Style compliance score: {result['score']:.2f}/1.00[/yellow]")
+                rprint(f"[red]Found {len(result['violations'])} violation(s)[/red]")
+                sys.exit(1)
             else:
-                from spot.utils.style_linter import format_style_report
-                
-                file_name = content_file or "content"
-                report_text = format_style_report(
-                    result["report"], 
-                    result["stylepack"], 
-                    file_name
-                )
-                
-                rprint(report_text)
-                
-                if not result["compliant"]:
-                    rprint(f"\n[yellow]Style compliance score: {result['score']:.2f}/1.00[/yellow]")
-                    rprint(f"[red]Found {len(result['violations'])} violation(s)[/red]")
-                    sys.exit(1)
-                else:
-                    rprint(f"\n[green]✓ Content is style compliant (score: {result['score']:.2f}/1.00)[/green]")
-        
-        except Exception as e:
-            rprint(f"[red]✗ Style check failed: {e}[/red]")
-            sys.exit(1)
+                rprint(f"\n[green]✓ Content is style compliant (score: {result['score']:.2f}/1.00)[/green]")
     
-    asyncio.run(run_style_check())
+    except Exception as e:
+        rprint(f"[red]✗ Style check failed: {e}[/red]")
+        sys.exit(1)
 
 
 @cli.command()
@@ -0,0 +1,203 @@
+"""Multi-tier response cache for SPOT generations."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config import CacheConfig
+from ..utils.logger import get_logger
+
+
+def normalize_variables(variables: Dict[str, Any]) -> Dict[str, str]:
+    """Normalize template variables the way they are rendered (as trimmed strings)."""
+    return {str(key): str(value).strip() for key, value in sorted(variables.items())}
+
+
+def hash_json(value: Any) -> str:
+    """Stable SHA-256 of a JSON-serializable value."""
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(
+    template_id: str,
+    variables: Dict[str, Any],
+    style_pack: Optional[Dict[str, Any]],
+    provider: str,
+    model: Optional[str],
+    params: Dict[str, Any],
+) -> str:
+    """Build the cache key for a generation request."""
+    return hash_json({
+        "template": template_id,
+        "variables": normalize_variables(variables),
+        "style_pack": hash_json(style_pack or {}),
+        "provider": provider,
+        "model": model,
+        "params": params,
+    })
+
+
+class MemoryCache:
+    """Bounded in-process LRU with a per-entry TTL."""
+    
+    def __init__(self, max_entries: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh entry, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used ones."""
+        self._entries[key] = (self._clock() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+class SQLiteCache:
+    """Persistent cache tier in a SQLite file shared by all workers on a host.
+    
+    The database runs in WAL mode so readers in other processes are not
+    blocked by a writer. Methods are blocking; call them from a thread.
+    """
+    
+    PURGE_EVERY = 256
+    
+    def __init__(self, path: Path, ttl: float):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh entry, or None. Also returns its remaining TTL."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"value": json.loads(row[0]), "ttl": row[1] - time.time()}
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry, occasionally purging expired ones."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + self.ttl),
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ResponseCache:
+    """Memory LRU in front of an optional SQLite tier.
+    
+    Disk hits are promoted to memory. Cache errors are logged and treated
+    as misses so a broken cache never fails a generation.
+    """
+    
+    def __init__(self, config: CacheConfig):
+        self.config = config
+        self.logger = get_logger("response_cache")
+        self.memory = MemoryCache(config.max_entries, config.ttl)
+        self.disk = SQLiteCache(Path(config.path), config.ttl) if config.path else None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "errors": 0}
+    
+    def is_cacheable(self, temperature: Optional[float]) -> bool:
+        """Only cache (near-)deterministic generations."""
+        return self.config.enabled and temperature is not None and temperature <= self.config.max_temperature
+    
+    async def get(self, key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Look a key up in each tier; returns the value and the tier it came from."""
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats["memory_hits"] += 1
+            return dict(value), "memory"
+        
+        if self.disk is not None:
+            try:
+                entry = await asyncio.to_thread(self.disk.get, key)
+            except sqlite3.Error as e:
+                self.stats["errors"] += 1
+                self.logger.warning(f"Response cache read failed: {e}")
+                entry = None
+            if entry is not None:
+                self.stats["disk_hits"] += 1
+                self.memory.set(key, entry["value"], ttl=entry["ttl"])
+                return dict(entry["value"]), "disk"
+        
+        self.stats["misses"] += 1
+        return None
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value in every tier."""
+        self.memory.set(key, dict(value))
+        self.stats["writes"] += 1
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, value)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                self.stats["errors"] += 1
+                self.logger.warning(f"Response cache write failed: {e}")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return cache counters for status reporting."""
+        return {
+            "enabled": self.config.enabled,
+            "memory_entries": len(self.memory),
+            "disk_path": self.config.path,
+            **self.stats,
+        }
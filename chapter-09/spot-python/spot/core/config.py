@@ -1,10 +1,12 @@
 """Configuration management for SPOT."""
 
+import json
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,6 +18,14 @@ class ProviderConfig(BaseModel):
     temperature: float = 0.7
     timeout: float = 30.0
     retry_attempts: int = 3
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    pool_max_connections: int = 20
+    pool_max_keepalive: int = 10
+    pool_keepalive_expiry: float = 30.0
+    pool_warm_connections: int = 2
+    http2: bool = False
+    executor_workers: int = 4
 
 
 class CircuitBreakerConfig(BaseModel):
@@ -26,6 +36,77 @@ class CircuitBreakerConfig(BaseModel):
     reset_timeout: float = 30.0
 
 
+class HedgingConfig(BaseModel):
+    """Configuration for hedged provider requests."""
+    
+    enabled: bool = False
+    max_hedges: int = 1
+    percentile: float = 0.95
+    delay: float = 2.0
+    min_samples: int = 20
+    budget_ratio: float = 0.1
+
+
+class FailoverConfig(BaseModel):
+    """Configuration for provider failover chains."""
+    
+    default: List[str] = Field(default_factory=list)
+    environments: Dict[str, List[str]] = Field(default_factory=dict)
+    templates: Dict[str, List[str]] = Field(default_factory=dict)
+    ewma_alpha: float = 0.2
+    max_error_rate: float = 0.5
+
+
+class ConcurrencyConfig(BaseModel):
+    """Configuration for adaptive per-provider concurrency limits."""
+    
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1.0
+    backoff: float = 0.5
+    max_queue: int = 100
+
+
+class RetryConfig(BaseModel):
+    """Configuration for provider call retries."""
+    
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    budget_ratio: float = 0.2
+    budget_max: float = 10.0
+
+
+class DeadlineConfig(BaseModel):
+    """Configuration for per-request deadlines."""
+    
+    default: Optional[float] = None
+    max: Optional[float] = None
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the generation response cache."""
+    
+    enabled: bool = True
+    max_entries: int = 512
+    ttl: float = 86400.0
+    path: Optional[str] = None
+    max_temperature: float = 0.0
+
+
+class SemanticCacheConfig(BaseModel):
+    """Configuration for the embedding-based semantic cache."""
+    
+    enabled: bool = False
+    capacity: int = 10000
+    threshold: float = 0.92
+    top_k: int = 5
+    embedder: str = "hashing"
+    model: str = "text-embedding-3-small"
+    dimensions: int = 512
+    lookup_timeout: float = 0.5
+
+
 class HealthCheckConfig(BaseModel):
     """Configuration for health checks."""
     
@@ -52,6 +133,9 @@ class TemplateConfig(BaseModel):
     
     cache_ttl: float = 3600.0
     validation_on_load: bool = True
+    validate_output: bool = True
+    repair_output: bool = False
+    watch: bool = False
 
 
 class WebConfig(BaseModel):
@@ -90,6 +174,57 @@ class Config(BaseSettings):
     circuit_breaker_timeout: float = Field(default=60.0, alias="CIRCUIT_BREAKER_TIMEOUT")
     circuit_breaker_reset_timeout: float = Field(default=30.0, alias="CIRCUIT_BREAKER_RESET_TIMEOUT")
     
+    # Hedging settings
+    hedge_enabled: bool = Field(default=False, alias="HEDGE_ENABLED")
+    hedge_max_hedges: int = Field(default=1, alias="HEDGE_MAX_HEDGES")
+    hedge_percentile: float = Field(default=0.95, alias="HEDGE_PERCENTILE")
+    hedge_delay: float = Field(default=2.0, alias="HEDGE_DELAY")
+    hedge_min_samples: int = Field(default=20, alias="HEDGE_MIN_SAMPLES")
+    hedge_budget_ratio: float = Field(default=0.1, alias="HEDGE_BUDGET_RATIO")
+    
+    # Concurrency limit settings
+    concurrency_initial_limit: int = Field(default=4, alias="CONCURRENCY_INITIAL_LIMIT")
+    concurrency_min_limit: int = Field(default=1, alias="CONCURRENCY_MIN_LIMIT")
+    concurrency_max_limit: int = Field(default=64, alias="CONCURRENCY_MAX_LIMIT")
+    concurrency_increase: float = Field(default=1.0, alias="CONCURRENCY_INCREASE")
+    concurrency_backoff: float = Field(default=0.5, alias="CONCURRENCY_BACKOFF")
+    concurrency_max_queue: int = Field(default=100, alias="CONCURRENCY_MAX_QUEUE")
+    
+    # Retry settings
+    retry_base_delay: float = Field(default=0.5, alias="RETRY_BASE_DELAY")
+    retry_max_delay: float = Field(default=20.0, alias="RETRY_MAX_DELAY")
+    retry_budget_ratio: float = Field(default=0.2, alias="RETRY_BUDGET_RATIO")
+    retry_budget_max: float = Field(default=10.0, alias="RETRY_BUDGET_MAX")
+    
+    # Request deadline settings
+    request_timeout: Optional[float] = Field(default=None, alias="REQUEST_TIMEOUT")
+    request_timeout_max: Optional[float] = Field(default=None, alias="REQUEST_TIMEOUT_MAX")
+    
+    # Request coalescing settings
+    coalesce_enabled: bool = Field(default=True, alias="COALESCE_ENABLED")
+    
+    # Response cache settings
+    cache_enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    cache_max_entries: int = Field(default=512, alias="CACHE_MAX_ENTRIES")
+    cache_ttl: float = Field(default=86400.0, alias="CACHE_TTL")
+    cache_disk_enabled: bool = Field(default=True, alias="CACHE_DISK_ENABLED")
+    cache_path: Optional[str] = Field(default=None, alias="CACHE_PATH")
+    cache_max_temperature: float = Field(default=0.0, alias="CACHE_MAX_TEMPERATURE")
+    
+    # Semantic cache settings
+    semantic_cache_enabled: bool = Field(default=False, alias="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_capacity: int = Field(default=10000, alias="SEMANTIC_CACHE_CAPACITY")
+    semantic_cache_threshold: float = Field(default=0.92, alias="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_top_k: int = Field(default=5, alias="SEMANTIC_CACHE_TOP_K")
+    semantic_cache_embedder: str = Field(default="hashing", alias="SEMANTIC_CACHE_EMBEDDER")
+    semantic_cache_model: str = Field(default="text-embedding-3-small", alias="SEMANTIC_CACHE_MODEL")
+    semantic_cache_dimensions: int = Field(default=512, alias="SEMANTIC_CACHE_DIMENSIONS")
+    semantic_cache_lookup_timeout: float = Field(default=0.5, alias="SEMANTIC_CACHE_LOOKUP_TIMEOUT")
+    
+    # Failover settings
+    failover_ewma_alpha: float = Field(default=0.2, alias="FAILOVER_EWMA_ALPHA")
+    failover_max_error_rate: float = Field(default=0.5, alias="FAILOVER_MAX_ERROR_RATE")
+    
     # Health check settings
     health_check_interval: float = Field(default=60.0, alias="HEALTH_CHECK_INTERVAL")
     health_check_timeout: float = Field(default=5.0, alias="HEALTH_CHECK_TIMEOUT")
@@ -105,6 +240,9 @@ class Config(BaseSettings):
     # Template settings
     template_cache_ttl: float = Field(default=3600.0, alias="TEMPLATE_CACHE_TTL")
     template_validation_on_load: bool = Field(default=True, alias="TEMPLATE_VALIDATION_ON_LOAD")
+    template_validate_output: bool = Field(default=True, alias="TEMPLATE_VALIDATE_OUTPUT")
+    template_repair_output: bool = Field(default=False, alias="TEMPLATE_REPAIR_OUTPUT")
+    template_watch: bool = Field(default=False, alias="TEMPLATE_WATCH")
     
     # Web server settings
     web_host: str = Field(default="0.0.0.0", alias="WEB_HOST")
@@ -116,6 +254,8 @@ class Config(BaseSettings):
     dev_enable_debug_logs: bool = Field(default=False, alias="DEV_ENABLE_DEBUG_LOGS")
     dev_skip_health_checks: bool = Field(default=False, alias="DEV_SKIP_HEALTH_CHECKS")
     
+    _providers_file: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
     @property
     def project_root(self) -> Path:
         """Get the project root directory."""
@@ -162,6 +302,82 @@ class Config(BaseSettings):
             reset_timeout=self.circuit_breaker_reset_timeout,
         )
     
+    @property
+    def hedging(self) -> HedgingConfig:
+        """Get hedging configuration."""
+        return HedgingConfig(
+            enabled=self.hedge_enabled,
+            max_hedges=self.hedge_max_hedges,
+            percentile=self.hedge_percentile,
+            delay=self.hedge_delay,
+            min_samples=self.hedge_min_samples,
+            budget_ratio=self.hedge_budget_ratio,
+        )
+    
+    @property
+    def concurrency(self) -> ConcurrencyConfig:
+        """Get concurrency limit configuration."""
+        return ConcurrencyConfig(
+            initial_limit=self.concurrency_initial_limit,
+            min_limit=self.concurrency_min_limit,
+            max_limit=self.concurrency_max_limit,
+            increase=self.concurrency_increase,
+            backoff=self.concurrency_backoff,
+            max_queue=self.concurrency_max_queue,
+        )
+    
+    @property
+    def retry(self) -> RetryConfig:
+        """Get retry configuration."""
+        return RetryConfig(
+            base_delay=self.retry_base_delay,
+            max_delay=self.retry_max_delay,
+            budget_ratio=self.retry_budget_ratio,
+            budget_max=self.retry_budget_max,
+        )
+    
+    @property
+    def failover(self) -> FailoverConfig:
+        """Get failover chain configuration from configs/providers.json."""
+        return FailoverConfig(
+            **self.providers_file.get("failover", {}),
+            ewma_alpha=self.failover_ewma_alpha,
+            max_error_rate=self.failover_max_error_rate,
+        )
+    
+    @property
+    def deadline(self) -> DeadlineConfig:
+        """Get per-request deadline configuration."""
+        return DeadlineConfig(default=self.request_timeout, max=self.request_timeout_max)
+    
+    @property
+    def cache(self) -> CacheConfig:
+        """Get response cache configuration."""
+        path = None
+        if self.cache_disk_enabled:
+            path = self.cache_path or str(self.project_root / "cache" / "responses.sqlite3")
+        return CacheConfig(
+            enabled=self.cache_enabled,
+            max_entries=self.cache_max_entries,
+            ttl=self.cache_ttl,
+            path=path,
+            max_temperature=self.cache_max_temperature,
+        )
+    
+    @property
+    def semantic_cache(self) -> SemanticCacheConfig:
+        """Get semantic cache configuration."""
+        return SemanticCacheConfig(
+            enabled=self.semantic_cache_enabled,
+            capacity=self.semantic_cache_capacity,
+            threshold=self.semantic_cache_threshold,
+            top_k=self.semantic_cache_top_k,
+            embedder=self.semantic_cache_embedder,
+            model=self.semantic_cache_model,
+            dimensions=self.semantic_cache_dimensions,
+            lookup_timeout=self.semantic_cache_lookup_timeout,
+        )
+    
     @property
     def health_check(self) -> HealthCheckConfig:
         """Get health check configuration."""
@@ -192,6 +408,9 @@ class Config(BaseSettings):
         return TemplateConfig(
             cache_ttl=self.template_cache_ttl,
             validation_on_load=self.template_validation_on_load,
+            validate_output=self.template_validate_output,
+            repair_output=self.template_repair_output,
+            watch=self.template_watch,
         )
     
     @property
@@ -203,17 +422,59 @@ class Config(BaseSettings):
             reload=self.web_reload,
         )
     
+    @property
+    def providers_file(self) -> Dict[str, Any]:
+        """Get the parsed configs/providers.json (empty if missing)."""
+        if self._providers_file is None:
+            path = self.configs_dir / "providers.json"
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._providers_file = json.load(f)
+            except FileNotFoundError:
+                self._providers_file = {}
+        return self._providers_file
+    
     def get_provider_config(self, provider_name: str) -> Optional[ProviderConfig]:
         """Get configuration for a specific provider."""
-        # This would load from configs/providers.json in a real implementation
-        # For now, return default configuration
         default_configs = {
             "openai": ProviderConfig(model="gpt-4"),
             "anthropic": ProviderConfig(model="claude-3-sonnet-20240229"),
             "gemini": ProviderConfig(model="gemini-1.5-pro"),
             "mock": ProviderConfig(model="mock-model"),
         }
-        return default_configs.get(provider_name)
+        provider_config = default_configs.get(provider_name)
+        
+        # Values from configs/providers.json (camelCase keys) override defaults
+        overrides = self.providers_file.get("providers", {}).get(provider_name)
+        if overrides:
+            values = provider_config.model_dump() if provider_config else {}
+            for key, value in overrides.items():
+                values[re.sub(r'(?<!^)(?=[A-Z])', '_', key).lower()] = value
+            provider_config = ProviderConfig(**values)
+        
+        return provider_config
+    
+    def get_failover_chain(self, template: Optional[str] = None) -> List[str]:
+        """Get the configured failover chain for a template and environment.
+        
+        A chain configured for the template (by ``id@version`` or ``id``) wins
+        over one configured for the current environment, which wins over the
+        default chain. The mock provider is only appended when
+        ``dev_mock_providers`` is set.
+        """
+        failover = self.failover
+        chain = None
+        if template:
+            for key in (template, template.split("@")[0]):
+                if key in failover.templates:
+                    chain = list(failover.templates[key])
+                    break
+        if chain is None:
+            chain = list(failover.environments.get(self.environment, failover.default))
+        
+        if self.dev_mock_providers and "mock" not in chain:
+            chain.append("mock")
+        return chain
     
     def get_api_key(self, provider_name: str) -> Optional[str]:
         """Get API key for a specific provider."""
@@ -2,43 +2,216 @@
 
 import asyncio
 import json
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from .config import Config, get_config
+from jsonschema.exceptions import SchemaError
+
+from .cache import ResponseCache, cache_key
+from .config import Config, TemplateConfig, get_config
+from .streaming_json import StreamingJSONParser
+from .template_engine import CompiledTemplate
+from .validation import OutputValidator, compile_output_schema, repair_prompt
+from ..providers.deadline import Deadline
 from ..providers.manager import ProviderManager
+from ..providers.messages import Message, Prompt, as_messages, prompt_text
+from ..providers.single_flight import SingleFlight
 from ..utils.logger import get_logger
-from ..utils.style_linter import load_style_pack, lint_style, calculate_style_score
+from ..utils.metrics import OUTPUT_VALIDATIONS, TEMPLATE_CACHE_LOOKUPS
+from ..utils.incremental_lint import IncrementalLinter
+from ..utils.stream_lint import STREAM_THRESHOLD, lint_file_streaming
+from ..utils.style_linter import load_style_pack, lint_style, style_result
+
+
+class TemplateStamp(NamedTuple):
+    """When a cached template was last checked and its file's mtime and size."""
+    checked_at: float
+    mtime_ns: int
+    size: int
 
 
 class TemplateManager:
-    """Manages prompt templates."""
+    """Manages prompt templates.
+    
+    Loaded templates are served from memory for ``cache_ttl`` seconds.
+    After that the file's mtime and size are checked and the template is
+    reloaded only if they changed. With ``watch`` enabled, file changes
+    under the templates directory invalidate entries immediately.
+    """
+    
+    LOOKUP_RESULTS = {"hits": "hit", "misses": "miss", "reloads": "reload"}
     
-    def __init__(self, templates_dir: Path):
+    def __init__(self, templates_dir: Path, config: Optional[TemplateConfig] = None):
         self.templates_dir = templates_dir
+        self.config = config or TemplateConfig()
         self.logger = get_logger("template_manager")
         self._cache: Dict[str, Dict] = {}
+        self._stamps: Dict[str, TemplateStamp] = {}
+        self._compiled: Dict[str, CompiledTemplate] = {}
+        self._validators: Dict[str, Optional[OutputValidator]] = {}
+        self._loads = SingleFlight()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._clock = time.monotonic
+        self.stats = {"hits": 0, "misses": 0, "reloads": 0, "revalidations": 0}
+    
+    def _count(self, stat: str) -> None:
+        self.stats[stat] += 1
+        if stat in self.LOOKUP_RESULTS:
+            TEMPLATE_CACHE_LOOKUPS.labels(result=self.LOOKUP_RESULTS[stat]).inc()
     
     async def load_template(self, template_name: str) -> Dict[str, Any]:
-        """Load a template by name."""
-        if template_name in self._cache:
-            return self._cache[template_name]
+        """Load a template by name.
         
-        template_path = self.templates_dir / f"{template_name}.json"
+        Concurrent loads of the same template share one file read, which
+        runs off the event loop.
+        """
+        template = self._cache.get(template_name)
+        if template is not None and self._clock() - self._stamps[template_name].checked_at < self.config.cache_ttl:
+            self._count("hits")
+            return template
         
-        if not template_path.exists():
+        template, _ = await self._loads.do(template_name, lambda: self._revalidate(template_name))
+        return template
+    
+    async def _revalidate(self, template_name: str) -> Dict[str, Any]:
+        """Check a template file and (re)load it if it is new or has changed."""
+        template_path = self.templates_dir / f"{template_name}.json"
+        try:
+            stat = await asyncio.to_thread(template_path.stat)
+        except FileNotFoundError:
+            self.invalidate(template_name, drop=True)
             raise FileNotFoundError(f"Template {template_name} not found")
         
-        try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = json.load(f)
-            
-            self._cache[template_name] = template
-            return template
+        cached = self._cache.get(template_name)
+        stamp = self._stamps.get(template_name)
+        if cached is not None and (stamp.mtime_ns, stamp.size) == (stat.st_mtime_ns, stat.st_size):
+            self._stamps[template_name] = stamp._replace(checked_at=self._clock())
+            self._count("revalidations")
+            self._count("hits")
+            return cached
         
+        try:
+            template = await asyncio.to_thread(self._read_template, template_path)
         except Exception as e:
             self.logger.error(f"Failed to load template {template_name}: {e}")
             raise
+        
+        if cached is not None:
+            self.logger.info(f"Reloaded changed template {template_name}")
+            self._forget_compiled(cached)
+        self._forget_compiled(template)
+        self._count("reloads" if cached is not None else "misses")
+        
+        self._cache[template_name] = template
+        self._stamps[template_name] = TemplateStamp(self._clock(), stat.st_mtime_ns, stat.st_size)
+        if "prompt" in template or "user" in template:
+            self.compile_template(template)
+        if self.config.validation_on_load:
+            self.get_validator(template)
+        return template
+    
+    def _forget_compiled(self, template: Dict[str, Any]) -> None:
+        key = f"{template.get('id')}@{template.get('version')}"
+        self._compiled.pop(key, None)
+        self._validators.pop(key, None)
+    
+    @staticmethod
+    def _read_template(template_path: Path) -> Dict[str, Any]:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def invalidate(self, template_name: Optional[str] = None, drop: bool = False) -> None:
+        """Make the next load of a template (or of all templates) check its file.
+        
+        With ``drop`` the cached copy is discarded instead.
+        """
+        names = [template_name] if template_name else list(self._stamps)
+        for name in names:
+            if drop:
+                self._cache.pop(name, None)
+                self._stamps.pop(name, None)
+            elif name in self._stamps:
+                self._stamps[name] = self._stamps[name]._replace(checked_at=float("-inf"))
+    
+    def start_watching(self) -> bool:
+        """Invalidate cached templates as soon as their files change.
+        
+        Needs the optional ``watchfiles`` package; returns False without it.
+        """
+        if self._watch_task is not None:
+            return True
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            self.logger.warning("Template watching needs watchfiles (pip install watchfiles); using TTL revalidation")
+            return False
+        
+        async def watch() -> None:
+            async for changes in awatch(self.templates_dir):
+                for _, path in changes:
+                    self.invalidate(Path(path).stem)
+        
+        self._watch_task = asyncio.ensure_future(watch())
+        self.logger.info(f"Watching {self.templates_dir} for template changes")
+        return True
+    
+    async def stop_watching(self) -> None:
+        """Stop watching the templates directory."""
+        if self._watch_task is None:
+            return
+        self._watch_task.cancel()
+        try:
+            await self._watch_task
+        except asyncio.CancelledError:
+            pass
+        self._watch_task = None
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return template cache counters for status reporting."""
+        return {
+            "templates": len(self._cache),
+            "ttl": self.config.cache_ttl,
+            "watching": self._watch_task is not None,
+            "coalesced": self._loads.hits,
+            **self.stats,
+        }
+    
+    def compile_template(self, template: Dict[str, Any]) -> CompiledTemplate:
+        """Get a template's compiled prompt, compiling it on first use.
+        
+        Compiled templates are cached by ``id@version``; input declaration
+        problems are logged when a template is compiled.
+        """
+        key = f"{template.get('id')}@{template.get('version')}"
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CompiledTemplate.compile(template)
+            for warning in compiled.warnings():
+                self.logger.warning(f"Template {key}: {warning}")
+            if "id" in template and "version" in template:
+                self._compiled[key] = compiled
+        return compiled
+    
+    def get_validator(self, template: Dict[str, Any]) -> Optional[OutputValidator]:
+        """Get the compiled validator for a template's ``output_schema``.
+        
+        Validators are built once per template (at load time when
+        ``validation_on_load`` is set) and cached like compiled prompts.
+        Returns None for templates without an ``output_schema`` or with an
+        invalid one, which is logged.
+        """
+        key = f"{template.get('id')}@{template.get('version')}"
+        if key in self._validators:
+            return self._validators[key]
+        try:
+            validator = compile_output_schema(template)
+        except SchemaError as e:
+            self.logger.error(f"Template {key} has an invalid output_schema: {e.message}")
+            validator = None
+        if "id" in template and "version" in template:
+            self._validators[key] = validator
+        return validator
     
     async def validate_template(self, template: Dict[str, Any]) -> bool:
         """Validate template structure."""
@@ -55,47 +228,62 @@ class TemplateManager:
         
         return True
     
+    async def render_messages(
+        self,
+        template: Dict[str, Any],
+        variables: Dict[str, Any],
+        style_pack: Optional[Dict[str, Any]] = None
+    ) -> List[Message]:
+        """Render a template as chat messages, stable parts first.
+        
+        The template's system text and the style guidelines come first as
+        system messages, the last of them marked as a prompt-cache
+        breakpoint; the rendered prompt with its variables comes last. This
+        keeps a stable prefix across requests for provider prompt caching.
+        """
+        # Handles both the 'prompt' and the 'user' template formats
+        prompt = self.compile_template(template).render(variables)
+        
+        messages: List[Message] = []
+        if "prompt" not in template and template.get("system"):
+            messages.append({"role": "system", "content": template["system"]})
+        
+        # Add style pack instructions if provided
+        style_guidelines = self._style_guidelines(style_pack)
+        if style_guidelines:
+            messages.append({"role": "system", "content": style_guidelines})
+        
+        if messages:
+            messages[-1]["cache"] = True
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
     async def render_template(self, template: Dict[str, Any], variables: Dict[str, Any], style_pack: Optional[Dict[str, Any]] = None) -> str:
         """Render template with variables and optional style pack integration."""
-        # Get the prompt content - handle both old and new formats
-        if "prompt" in template:
-            prompt = template["prompt"]
-        elif "user" in template:
-            # For SPOT templates, combine system and user prompts
-            system_prompt = template.get("system", "")
-            user_prompt = template["user"]
-            if system_prompt:
-                prompt = f"{system_prompt}\n\n{user_prompt}"
-            else:
-                prompt = user_prompt
-        else:
-            raise ValueError("Template must contain either 'prompt' or 'user' field")
+        return prompt_text(await self.render_messages(template, variables, style_pack))
+    
+    @staticmethod
+    def _style_guidelines(style_pack: Optional[Dict[str, Any]]) -> str:
+        """Style pack rules as prompt instructions."""
+        if not style_pack:
+            return ""
+        style_instructions = []
         
-        # Simple variable substitution
-        for key, value in variables.items():
-            placeholder = f"{{{key}}}"
-            prompt = prompt.replace(placeholder, str(value))
+        if style_pack.get("brand_voice"):
+            style_instructions.append(f"Brand voice: {style_pack['brand_voice']}")
         
-        # Add style pack instructions if provided
-        if style_pack:
-            style_instructions = []
-            
-            if style_pack.get("brand_voice"):
-                style_instructions.append(f"Brand voice: {style_pack['brand_voice']}")
-            
-            if style_pack.get("reading_level"):
-                style_instructions.append(f"Target reading level: {style_pack['reading_level']}")
-            
-            if style_pack.get("must_use"):
-                style_instructions.append(f"Must use these terms: {', '.join(style_pack['must_use'])}")
-            
-            if style_pack.get("must_avoid"):
-                style_instructions.append(f"Avoid these terms: {', '.join(style_pack['must_avoid'])}")
-            
-            if style_instructions:
-                prompt += "\n\nStyle Guidelines:\n" + "\n".join(f"- {instruction}" for instruction in style_instructions)
+        if style_pack.get("reading_level"):
+            style_instructions.append(f"Target reading level: {style_pack['reading_level']}")
+        
+        if style_pack.get("must_use"):
+            style_instructions.append(f"Must use these terms: {', '.join(style_pack['must_use'])}")
+        
+        if style_pack.get("must_avoid"):
+            style_instructions.append(f"Avoid these terms: {', '.join(style_pack['must_avoid'])}")
         
-        return prompt
+        if not style_instructions:
+            return ""
+        return "Style Guidelines:\n" + "\n".join(f"- {instruction}" for instruction in style_instructions)
 
 
 class EvaluationManager:
@@ -146,65 +334,123 @@ class SPOT:
         
         # Initialize managers
         self.provider_manager = ProviderManager(self.config)
-        self.template_manager = TemplateManager(self.config.templates_dir)
+        self.template_manager = TemplateManager(self.config.templates_dir, self.config.templates)
         self.evaluation_manager = EvaluationManager(self.config.golden_set_dir)
+        self.response_cache = ResponseCache(self.config.cache)
+        self.style_sessions = IncrementalLinter()
         
         self.logger.info("SPOT initialized successfully")
     
+    async def _prepare_prompt(
+        self,
+        template: str,
+        input_data: Union[Dict[str, Any], str, Path]
+    ) -> Prompt:
+        """Load a template and its inputs and render the prompt messages."""
+        template_data, variables, style_pack = await self._prepare_inputs(template, input_data)
+        return await self.template_manager.render_messages(template_data, variables, style_pack)
+    
+    async def _prepare_inputs(
+        self,
+        template: str,
+        input_data: Union[Dict[str, Any], str, Path]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Load a template, the style pack and the template variables."""
+        # Load template
+        template_data = await self.template_manager.load_template(template)
+        
+        # Load style pack
+        try:
+            style_pack = load_style_pack()
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Could not load style pack: {e}")
+            style_pack = None
+        
+        # Prepare input data
+        if isinstance(input_data, (str, Path)):
+            # Load from file
+            input_path = Path(input_data)
+            if input_path.suffix.lower() == '.json':
+                with open(input_path, 'r', encoding='utf-8') as f:
+                    variables = json.load(f)
+            else:
+                with open(input_path, 'r', encoding='utf-8') as f:
+                    variables = {"content": f.read()}
+        else:
+            variables = input_data
+        
+        # For templates that expect style pack variables, add them
+        if style_pack and template_data.get("inputs"):
+            template_inputs = template_data["inputs"]
+            if "style_pack_rules" in template_inputs:
+                variables["style_pack_rules"] = json.dumps(style_pack)
+            if "must_use" in template_inputs:
+                variables["must_use"] = json.dumps(style_pack.get("must_use", []))
+            if "must_avoid" in template_inputs:
+                variables["must_avoid"] = json.dumps(style_pack.get("must_avoid", []))
+        
+        return template_data, variables, style_pack
+    
     async def generate(
         self,
         template: str,
         input_data: Union[Dict[str, Any], str, Path],
         output_file: Optional[Union[str, Path]] = None,
         provider: Optional[str] = None,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        deadline: Optional[Deadline] = None,
         **kwargs
     ) -> Dict[str, Any]:
-        """Generate content using a template."""
+        """Generate content using a template.
+        
+        Deterministic generations (temperature at or below
+        ``cache_max_temperature``) are served from the response cache,
+        keyed on the requested provider or, when none is named, the one
+        routing tries first. Answers from a fallback provider are not cached.
+        ``use_cache=False`` bypasses it entirely; ``refresh_cache=True``
+        regenerates and overwrites the cached entry. Without a ``deadline``
+        the configured ``request_timeout`` applies, if any.
+        """
+        if deadline is None:
+            deadline = Deadline.resolve(None, self.config.deadline)
         try:
             self.logger.info(f"Starting content generation with template: {template}")
             
-            # Load template
-            template_data = await self.template_manager.load_template(template)
-            
-            # Load style pack
-            try:
-                style_pack = load_style_pack()
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                self.logger.warning(f"Could not load style pack: {e}")
-                style_pack = None
-            
-            # Prepare input data
-            if isinstance(input_data, (str, Path)):
-                # Load from file
-                input_path = Path(input_data)
-                if input_path.suffix.lower() == '.json':
-                    with open(input_path, 'r', encoding='utf-8') as f:
-                        variables = json.load(f)
-                else:
-                    with open(input_path, 'r', encoding='utf-8') as f:
-                        variables = {"content": f.read()}
-            else:
-                variables = input_data
-            
-            # For templates that expect style pack variables, add them
-            if style_pack and template_data.get("inputs"):
-                template_inputs = template_data["inputs"]
-                if "style_pack_rules" in template_inputs:
-                    variables["style_pack_rules"] = json.dumps(style_pack)
-                if "must_use" in template_inputs:
-                    variables["must_use"] = json.dumps(style_pack.get("must_use", []))
-                if "must_avoid" in template_inputs:
-                    variables["must_avoid"] = json.dumps(style_pack.get("must_avoid", []))
-            
-            # Render template with style pack integration
-            prompt = await self.template_manager.render_template(template_data, variables, style_pack)
-            
-            # Generate content
-            result = await self.provider_manager.generate(
-                prompt=prompt,
-                provider_name=provider,
-                **kwargs
-            )
+            template_data, variables, style_pack = await self._prepare_inputs(template, input_data)
+            prompt = await self.template_manager.render_messages(template_data, variables, style_pack)
+            
+            key = None
+            result = None
+            routed = provider
+            if use_cache:
+                if routed is None:
+                    chain = self.provider_manager.resolve_chain(None, kwargs.get("fallback_providers"), template)
+                    routed = chain[0] if chain else None
+                key = self._cache_key(template_data, variables, style_pack, routed, kwargs)
+            if key and not refresh_cache:
+                hit = await self.response_cache.get(key)
+                if hit is not None:
+                    result, tier = hit
+                    result.update(cached=True, cache_tier=tier)
+                    self.logger.info(f"Served generation from {tier} cache")
+            
+            if result is None:
+                # Generate content
+                result = await self.provider_manager.generate(
+                    prompt=prompt,
+                    provider_name=provider,
+                    template=template,
+                    deadline=deadline,
+                    variables=variables,
+                    **kwargs
+                )
+                result = await self._check_output(template_data, prompt, result, deadline, **kwargs)
+                # The key names the provider expected to answer, so a
+                # fallback's answer is not cached under it
+                if key and result.get("provider") == (routed or self.config.provider):
+                    await self.response_cache.set(key, result)
+                result["cached"] = False
             
             # Save output if specified
             if output_file:
@@ -225,6 +471,131 @@ class SPOT:
             self.logger.error(f"Content generation failed: {e}")
             raise
     
+    async def _check_output(
+        self,
+        template_data: Dict[str, Any],
+        prompt: Prompt,
+        result: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Validate a result against the template's ``output_schema``.
+        
+        Adds a ``validation`` summary. With ``repair_output`` enabled, an
+        invalid response gets one re-prompt to the same provider listing
+        the schema errors; the repaired answer is used if it validates.
+        """
+        validator = self.template_manager.get_validator(template_data)
+        if validator is None or not self.config.templates.validate_output:
+            return result
+        
+        template_id = f"{template_data.get('id')}@{template_data.get('version')}"
+        outcome = validator.validate(result["content"])
+        status = "valid" if outcome.valid else "invalid"
+        if not outcome.valid and self.config.templates.repair_output:
+            self.logger.warning(f"Output of {template_id} failed validation, re-prompting: {outcome.errors[0]}")
+            repair_messages = as_messages(prompt) + [
+                {"role": "assistant", "content": result["content"]},
+                {"role": "user", "content": repair_prompt(outcome.errors)},
+            ]
+            try:
+                repaired = await self.provider_manager.generate(
+                    prompt=repair_messages,
+                    provider_name=result["provider"],
+                    fallback_providers=[],
+                    deadline=deadline,
+                    **kwargs
+                )
+            except Exception as e:
+                self.logger.warning(f"Repair re-prompt for {template_id} failed: {e}")
+            else:
+                repaired_outcome = validator.validate(repaired["content"])
+                if repaired_outcome.valid:
+                    result, outcome, status = {**repaired, "repaired": True}, repaired_outcome, "repaired"
+        
+        if not outcome.valid:
+            self.logger.warning(f"Output of {template_id} does not match its output_schema: {outcome.errors[0]}")
+        OUTPUT_VALIDATIONS.labels(template=template_id, result=status).inc()
+        result["validation"] = outcome.to_dict()
+        return result
+    
+    def _cache_key(
+        self,
+        template_data: Dict[str, Any],
+        variables: Dict[str, Any],
+        style_pack: Optional[Dict[str, Any]],
+        provider: Optional[str],
+        params: Dict[str, Any]
+    ) -> Optional[str]:
+        """Get the response cache key, or None if the request is not cacheable."""
+        provider_name = provider or self.config.provider
+        registered = self.provider_manager.providers.get(provider_name)
+        provider_config = registered.config if registered else {}
+        temperature = params.get("temperature")
+        if temperature is None:
+            temperature = provider_config.get("temperature")
+        if not self.response_cache.is_cacheable(temperature):
+            return None
+        
+        template_id = f"{template_data.get('id')}@{template_data.get('version')}"
+        return cache_key(
+            template_id,
+            variables,
+            style_pack,
+            provider_name,
+            provider_config.get("model"),
+            {**params, "temperature": temperature},
+        )
+    
+    async def stream_generate(
+        self,
+        template: str,
+        input_data: Union[Dict[str, Any], str, Path],
+        provider: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Generate content using a template, yielding events as text arrives.
+        
+        See ``ProviderManager.stream`` for the event format. When the
+        template has an ``output_schema`` (and ``validate_output`` is on),
+        the stream is parsed as it arrives: it is aborted with
+        ``StreamingJSONError`` once the output cannot match the schema and
+        stops when the JSON document closes. The ``done`` event then carries
+        the full ``validation`` summary.
+        """
+        self.logger.info(f"Starting streaming generation with template: {template}")
+        template_data, variables, style_pack = await self._prepare_inputs(template, input_data)
+        prompt = await self.template_manager.render_messages(template_data, variables, style_pack)
+        
+        validator = self.template_manager.get_validator(template_data)
+        if not self.config.templates.validate_output:
+            validator = None
+        output_parser = StreamingJSONParser(validator.schema) if validator else None
+        content: List[str] = []
+        
+        try:
+            async for event in self.provider_manager.stream(
+                prompt=prompt,
+                provider_name=provider,
+                template=template,
+                output_parser=output_parser,
+                **kwargs
+            ):
+                if validator is not None:
+                    if event["type"] == "delta":
+                        content.append(event["content"])
+                    else:
+                        outcome = validator.validate("".join(content))
+                        template_id = f"{template_data.get('id')}@{template_data.get('version')}"
+                        OUTPUT_VALIDATIONS.labels(template=template_id, result="valid" if outcome.valid else "invalid").inc()
+                        event["validation"] = outcome.to_dict()
+                yield event
+        except Exception as e:
+            self.logger.error(f"Streaming generation failed: {e}")
+            raise
+        
+        self.logger.info("Streaming generation completed successfully")
+    
     async def evaluate(
         self,
         template: Optional[str] = None,
@@ -266,6 +637,7 @@ class SPOT:
             result = {
                 "status": "healthy" if all_healthy else "unhealthy",
                 "providers": provider_health,
+                "circuit_breakers": self.provider_manager.get_provider_status(),
                 "templates_available": templates_available,
                 "config": {
                     "provider": self.config.provider,
@@ -297,10 +669,15 @@ class SPOT:
                     template_data = await self.template_manager.load_template(template_name)
                     is_valid = await self.template_manager.validate_template(template_data)
                     
-                    results.append({
+                    result = {
                         "templateId": template_name,
                         "status": "valid" if is_valid else "invalid"
-                    })
+                    }
+                    if is_valid:
+                        warnings = self.template_manager.compile_template(template_data).warnings()
+                        if warnings:
+                            result["warnings"] = warnings
+                    results.append(result)
                 
                 except Exception as e:
                     results.append({
@@ -316,11 +693,13 @@ class SPOT:
             self.logger.error(f"Template validation failed: {e}")
             raise
     
-    async def check_style(self, content: str) -> Dict[str, Any]:
+    async def check_style(self, content: str, document_id: Optional[str] = None) -> Dict[str, Any]:
         """Check content against style pack rules.
         
         Args:
             content: Text content to analyze
+            document_id: Identifies a document that is checked repeatedly
+                (e.g. from an editor); only its changed paragraphs are re-linted
             
         Returns:
             Style checking report with violations and compliance info
@@ -332,45 +711,13 @@ class SPOT:
             style_pack = load_style_pack()
             
             # Run style analysis
-            report = lint_style(content, style_pack)
-            
-            # Calculate overall score
-            score = calculate_style_score(report)
-            
-            # Create violations list for API compatibility
-            violations = []
-            
-            # Add banned term violations
-            for term in report.get("banned", []):
-                violations.append({
-                    "type": "must_avoid",
-                    "term": term,
-                    "message": f'Content contains prohibited term: "{term}"'
-                })
-            
-            # Add missing required term violations
-            for term in report.get("missing_required", []):
-                violations.append({
-                    "type": "must_use",
-                    "term": term,
-                    "message": f'Content missing required term: "{term}"'
-                })
-            
-            # Add reading level violation
-            if not report.get("reading_level_ok", True):
-                violations.append({
-                    "type": "reading_level",
-                    "term": f"Grade {report['reading_level']}",
-                    "message": f"Reading level {report['reading_level']} outside target range: {style_pack.get('reading_level', 'Grade 8-10')}"
-                })
+            if document_id is not None:
+                report = self.style_sessions.lint(document_id, content, style_pack)
+            else:
+                report = lint_style(content, style_pack)
             
-            result = {
-                "violations": violations,
-                "compliant": len(violations) == 0,
-                "score": score,
-                "report": report,
-                "stylepack": style_pack
-            }
+            # Violations and score, plus the rules used
+            result = {**style_result(report, style_pack), "stylepack": style_pack}
             
             self.logger.info(f"Style check completed: {'compliant' if result['compliant'] else 'violations found'}")
             return result
@@ -394,12 +741,18 @@ class SPOT:
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Run style check
-            result = await self.check_style(content)
+            if file_path.stat().st_size > STREAM_THRESHOLD:
+                # Lint large files in chunks instead of reading them whole
+                style_pack = load_style_pack()
+                report = await asyncio.to_thread(lint_file_streaming, file_path, style_pack)
+                result = {**style_result(report, style_pack), "stylepack": style_pack}
+            else:
+                # Read file content
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                
+                # Run style check
+                result = await self.check_style(content)
             result["file_path"] = str(file_path)
             
             return result
@@ -0,0 +1,276 @@
+"""Incremental JSON parsing of streamed model output against a schema.
+
+``StreamingJSONParser`` is fed text chunks as they arrive and raises
+``StreamingJSONError`` as soon as the output can no longer be valid JSON
+matching the schema, so the upstream request can be cancelled instead of
+paying for the rest of a broken answer. Once the root value has closed it
+reports ``complete`` so the stream can be stopped early.
+
+Only constraints that can be decided while streaming are checked: JSON
+syntax, ``type``, ``maxItems``, ``required`` and ``minItems`` (when the
+container closes) and ``additionalProperties: false``. The full
+``output_schema`` is still validated on the finished text.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+
+WHITESPACE = " \t\r\n"
+STRING_SPECIAL = re.compile(r'["\\]')
+LITERAL_PATTERN = re.compile(r"[0-9A-Za-z+\-.]+")
+
+# Expected next token
+VALUE = "value"
+VALUE_OR_END = "value or end"
+KEY_OR_END = "key or end"
+KEY = "key"
+COLON = "colon"
+COMMA_OR_END = "comma or end"
+DONE = "done"
+
+
+class StreamingJSONError(ValueError):
+    """Raised when streamed output can no longer match the schema."""
+    
+    def __init__(self, message: str, path: str = "(root)"):
+        super().__init__(f"{path}: {message}")
+        self.path = path
+
+
+class _Frame:
+    """An open object or array."""
+    
+    __slots__ = ("kind", "schema", "path", "count", "keys", "key")
+    
+    def __init__(self, kind: str, schema: Dict[str, Any], path: List[str]):
+        self.kind = kind
+        self.schema = schema
+        self.path = path
+        self.count = 0
+        self.keys: List[str] = []
+        self.key: Optional[str] = None
+
+
+def _types(schema: Dict[str, Any]) -> Optional[List[str]]:
+    declared = schema.get("type")
+    if declared is None:
+        return None
+    return [declared] if isinstance(declared, str) else list(declared)
+
+
+class StreamingJSONParser:
+    """Push parser checking one streamed JSON document against a schema.
+    
+    Text before the root value (prose, a Markdown code fence) is skipped,
+    up to ``max_preamble`` characters.
+    """
+    
+    def __init__(self, schema: Optional[Dict[str, Any]] = None, max_preamble: int = 256):
+        self.schema = schema or {}
+        self.max_preamble = max_preamble
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget everything fed so far."""
+        self.stack: List[_Frame] = []
+        self.complete = False
+        self._preamble = 0
+        self._expect = VALUE
+        self._started = False
+        self._string: Optional[List[str]] = None
+        self._string_is_key = False
+        self._escape = False
+        self._literal: Optional[List[str]] = None
+        self._literal_schema: Dict[str, Any] = {}
+        self._literal_path: List[str] = []
+    
+    @staticmethod
+    def _format_path(path: List[str]) -> str:
+        return "/".join(path) or "(root)"
+    
+    def feed(self, text: str) -> None:
+        """Parse the next chunk of output.
+        
+        Raises ``StreamingJSONError`` on the first violation. Text after
+        the root value has closed is ignored.
+        """
+        index, length = 0, len(text)
+        while index < length and not self.complete:
+            if self._string is not None:
+                index = self._scan_string(text, index)
+                continue
+            if self._literal is not None:
+                match = LITERAL_PATTERN.match(text, index)
+                if match:
+                    self._literal.append(match.group())
+                    index = match.end()
+                    if index == length:
+                        break
+                self._end_literal()
+                continue
+            
+            char = text[index]
+            if char in WHITESPACE:
+                index += 1
+                continue
+            if not self._started:
+                if char not in "{[":
+                    self._preamble += 1
+                    if self._preamble > self.max_preamble:
+                        raise StreamingJSONError(f"no JSON value in the first {self.max_preamble} characters")
+                    index += 1
+                    continue
+                self._started = True
+            self._token(char)
+            index += 1
+    
+    def _scan_string(self, text: str, index: int) -> int:
+        """Consume string content; returns the index after what was consumed."""
+        if self._escape:
+            self._escape = False
+            if self._string_is_key:
+                self._string.append(text[index])
+            return index + 1
+        match = STRING_SPECIAL.search(text, index)
+        end = match.start() if match else len(text)
+        if self._string_is_key:
+            self._string.append(text[index:end])
+        if match is None:
+            return end
+        if match.group() == "\\":
+            self._escape = True
+            if self._string_is_key:
+                self._string.append("\\")
+            return match.end()
+        self._end_string()
+        return match.end()
+    
+    def _token(self, char: str) -> None:
+        expect = self._expect
+        frame = self.stack[-1] if self.stack else None
+        
+        if expect in (VALUE, VALUE_OR_END):
+            if char == "]" and expect == VALUE_OR_END:
+                self._close(frame, "array")
+                return
+            self._start_value(char, frame)
+        elif expect in (KEY, KEY_OR_END):
+            if char == "}" and expect == KEY_OR_END:
+                self._close(frame, "object")
+            elif char == '"':
+                self._string, self._string_is_key = [], True
+            else:
+                self._fail(f"expected a property name, got {char!r}", frame.path)
+        elif expect == COLON:
+            if char != ":":
+                self._fail(f"expected ':', got {char!r}", frame.path)
+            self._expect = VALUE
+        elif expect == COMMA_OR_END:
+            closing = "}" if frame.kind == "object" else "]"
+            if char == ",":
+                self._expect = KEY if frame.kind == "object" else VALUE
+            elif char == closing:
+                self._close(frame, frame.kind)
+            else:
+                self._fail(f"expected ',' or {closing!r}, got {char!r}", frame.path)
+    
+    def _child(self, frame: Optional[_Frame]) -> tuple:
+        """Schema and path for the value about to start in ``frame``."""
+        if frame is None:
+            return self.schema, []
+        if frame.kind == "array":
+            frame.count += 1
+            path = frame.path + [str(frame.count - 1)]
+            max_items = frame.schema.get("maxItems")
+            if max_items is not None and frame.count > max_items:
+                self._fail(f"more than {max_items} items", frame.path)
+            items = frame.schema.get("items")
+            return (items if isinstance(items, dict) else {}), path
+        properties = frame.schema.get("properties", {})
+        schema = properties.get(frame.key)
+        if schema is None:
+            additional = frame.schema.get("additionalProperties")
+            schema = additional if isinstance(additional, dict) else {}
+        return schema, frame.path + [frame.key]
+    
+    def _start_value(self, char: str, frame: Optional[_Frame]) -> None:
+        schema, path = self._child(frame)
+        if char == "{":
+            kind = "object"
+        elif char == "[":
+            kind = "array"
+        elif char == '"':
+            kind = "string"
+        elif char in "-0123456789":
+            kind = "number"
+        elif char in "tf":
+            kind = "boolean"
+        elif char == "n":
+            kind = "null"
+        else:
+            self._fail(f"unexpected character {char!r}", path)
+        
+        allowed = _types(schema)
+        if allowed is not None:
+            matches = kind in allowed or (kind == "number" and "integer" in allowed)
+            if not matches:
+                self._fail(f"expected {' or '.join(allowed)}, got {kind}", path)
+        
+        if kind in ("object", "array"):
+            self.stack.append(_Frame(kind, schema, path))
+            self._expect = KEY_OR_END if kind == "object" else VALUE_OR_END
+        elif kind == "string":
+            self._string, self._string_is_key = [], False
+        else:
+            self._literal = [char]
+            self._literal_schema, self._literal_path = schema, path
+    
+    def _end_string(self) -> None:
+        raw, is_key = self._string, self._string_is_key
+        self._string = None
+        if not is_key:
+            self._value_done()
+            return
+        frame = self.stack[-1]
+        key = json.loads('"' + "".join(raw) + '"')
+        if frame.schema.get("additionalProperties") is False and key not in frame.schema.get("properties", {}):
+            self._fail(f"unexpected property {key!r}", frame.path)
+        frame.key = key
+        frame.keys.append(key)
+        self._expect = COLON
+    
+    def _end_literal(self) -> None:
+        literal = "".join(self._literal)
+        self._literal = None
+        try:
+            value = json.loads(literal)
+        except json.JSONDecodeError:
+            self._fail(f"invalid literal {literal!r}", self._literal_path)
+        allowed = _types(self._literal_schema)
+        if allowed is not None and isinstance(value, float) and "number" not in allowed:
+            self._fail("expected integer, got number", self._literal_path)
+        self._value_done()
+    
+    def _close(self, frame: _Frame, kind: str) -> None:
+        if kind == "object":
+            missing = [key for key in frame.schema.get("required", []) if key not in frame.keys]
+            if missing:
+                self._fail(f"missing required properties: {', '.join(missing)}", frame.path)
+        else:
+            min_items = frame.schema.get("minItems")
+            if min_items is not None and frame.count < min_items:
+                self._fail(f"fewer than {min_items} items", frame.path)
+        self.stack.pop()
+        self._value_done()
+    
+    def _value_done(self) -> None:
+        if self.stack:
+            self._expect = COMMA_OR_END
+        else:
+            self._expect = DONE
+            self.complete = True
+    
+    def _fail(self, message: str, path: List[str]) -> None:
+        raise StreamingJSONError(message, self._format_path(path))
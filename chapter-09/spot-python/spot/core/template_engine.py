@@ -0,0 +1,96 @@
+"""Compiled prompt templates.
+
+A template's prompt text is parsed once into alternating literal and
+placeholder segments, so rendering is one ``str.join`` instead of a
+``str.replace`` pass over the whole prompt per variable.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+@dataclass(frozen=True)
+class CompiledText:
+    """Text split into literals around ``{name}`` placeholders.
+    
+    ``literals`` always has one more item than ``names``: the text before
+    the first placeholder, between each pair, and after the last.
+    """
+    
+    literals: Tuple[str, ...]
+    names: Tuple[str, ...]
+    
+    @classmethod
+    def compile(cls, text: str) -> "CompiledText":
+        """Parse text into literal and placeholder segments."""
+        parts = PLACEHOLDER_PATTERN.split(text)
+        return cls(literals=tuple(parts[0::2]), names=tuple(parts[1::2]))
+    
+    @property
+    def placeholders(self) -> List[str]:
+        """Placeholder names in order of first use."""
+        return list(dict.fromkeys(self.names))
+    
+    def render(self, values: Dict[str, str]) -> str:
+        """Substitute values in one pass.
+        
+        Placeholders without a value are kept as ``{name}``, and
+        substituted values are never themselves scanned for placeholders.
+        """
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            value = values.get(name)
+            parts.append(f"{{{name}}}" if value is None else value)
+            parts.append(literal)
+        return "".join(parts)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template's prompt, compiled, with its input declarations checked."""
+    
+    prompt: CompiledText
+    inputs: Tuple[str, ...]
+    undeclared: Tuple[str, ...] = field(default=())
+    unused: Tuple[str, ...] = field(default=())
+    
+    @classmethod
+    def compile(cls, template: Dict[str, Any]) -> "CompiledTemplate":
+        """Compile a template's ``prompt`` (or ``user``) text.
+        
+        ``undeclared`` lists placeholders missing from the template's
+        ``inputs``; ``unused`` lists declared inputs no placeholder uses.
+        """
+        if "prompt" in template:
+            text = template["prompt"]
+        elif "user" in template:
+            text = template["user"]
+        else:
+            raise ValueError("Template must contain either 'prompt' or 'user' field")
+        
+        prompt = CompiledText.compile(text)
+        inputs = tuple(template.get("inputs") or ())
+        placeholders = prompt.placeholders
+        return cls(
+            prompt=prompt,
+            inputs=inputs,
+            undeclared=tuple(name for name in placeholders if name not in inputs),
+            unused=tuple(name for name in inputs if name not in placeholders),
+        )
+    
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Render the prompt with variables (converted with ``str``)."""
+        return self.prompt.render({key: str(value) for key, value in variables.items()})
+    
+    def warnings(self) -> List[str]:
+        """Describe input declaration problems found at compile time."""
+        warnings = []
+        if self.undeclared:
+            warnings.append(f"placeholders not declared in inputs: {', '.join(self.undeclared)}")
+        if self.unused:
+            warnings.append(f"inputs not used by the prompt: {', '.join(self.unused)}")
+        return warnings
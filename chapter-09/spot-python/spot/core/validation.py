@@ -0,0 +1,123 @@
+"""Validation of generated content against a template's ``output_schema``.
+
+Uses fastjsonschema, when installed (``pip install spot-python[validation]``),
+to compile schemas into Python code for the common valid case; jsonschema
+reports the errors of invalid responses.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from jsonschema.validators import validator_for
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
+
+
+FENCE_PATTERN = re.compile(r"^```(?:json)?\s*\n(.*?)\n?```\s*$", re.DOTALL)
+
+
+def extract_json(content: str) -> Any:
+    """Parse model output as JSON.
+    
+    Accepts a bare JSON document, one wrapped in a Markdown code fence, or
+    one surrounded by prose (the outermost ``{...}`` or ``[...]`` is used).
+    Raises ``ValueError`` if no JSON document is found.
+    """
+    text = content.strip()
+    fenced = FENCE_PATTERN.match(text)
+    if fenced:
+        text = fenced.group(1).strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        error = e
+    
+    for opening, closing in (("{", "}"), ("[", "]")):
+        start, end = text.find(opening), text.rfind(closing)
+        if 0 <= start < end:
+            try:
+                return json.loads(text[start:end + 1])
+            except json.JSONDecodeError:
+                continue
+    raise ValueError(f"Output is not valid JSON: {error}")
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one response."""
+    
+    valid: bool
+    errors: List[str] = field(default_factory=list)
+    data: Any = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for API responses (without the parsed data)."""
+        return {"valid": self.valid, "errors": self.errors}
+
+
+class OutputValidator:
+    """A template's ``output_schema`` compiled into a reusable validator.
+    
+    The schema is checked and compiled once, so validating a response
+    only parses and walks the response itself.
+    """
+    
+    MAX_ERRORS = 5
+    
+    def __init__(self, schema: Dict[str, Any]):
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.schema = schema
+        self._validator = validator_class(schema)
+        self._fast = None
+        if fastjsonschema is not None:
+            try:
+                self._fast = fastjsonschema.compile(schema)
+            except fastjsonschema.JsonSchemaDefinitionException:
+                # Schema uses something fastjsonschema does not support
+                pass
+    
+    def validate_data(self, data: Any) -> ValidationResult:
+        """Validate an already parsed document."""
+        if self._fast is not None:
+            try:
+                self._fast(data)
+                return ValidationResult(valid=True, data=data)
+            except fastjsonschema.JsonSchemaException:
+                pass
+        errors = []
+        for error in self._validator.iter_errors(data):
+            path = "/".join(str(part) for part in error.absolute_path) or "(root)"
+            errors.append(f"{path}: {error.message}")
+            if len(errors) >= self.MAX_ERRORS:
+                break
+        return ValidationResult(valid=not errors, errors=errors, data=data)
+    
+    def validate(self, content: str) -> ValidationResult:
+        """Parse and validate generated content."""
+        try:
+            data = extract_json(content)
+        except ValueError as e:
+            return ValidationResult(valid=False, errors=[str(e)])
+        return self.validate_data(data)
+
+
+def repair_prompt(errors: List[str]) -> str:
+    """Follow-up instruction asking the model to fix an invalid response."""
+    problems = "\n".join(f"- {error}" for error in errors)
+    return (
+        "Your previous response does not match the required JSON schema:\n"
+        f"{problems}\n"
+        "Return only the corrected JSON, with no other text."
+    )
+
+
+def compile_output_schema(template: Dict[str, Any]) -> Optional[OutputValidator]:
+    """Build the validator for a template, or None if it declares no ``output_schema``."""
+    schema = template.get("output_schema")
+    return OutputValidator(schema) if schema else None
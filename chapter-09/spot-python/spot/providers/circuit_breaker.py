@@ -0,0 +1,122 @@
+"""Per-provider circuit breaker for SPOT."""
+
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from ..core.config import CircuitBreakerConfig
+from ..utils.logger import get_logger
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker.
+    
+    ``threshold`` failures within ``timeout`` seconds open the circuit. While
+    open, calls are rejected without touching the provider. Once
+    ``reset_timeout`` seconds have passed, a single trial call is let through
+    (half-open): success closes the circuit, failure re-opens it.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self.logger = get_logger(f"circuit_breaker.{name}")
+        self._clock = clock
+        
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.first_failure_at: Optional[float] = None
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.rejected = 0
+        self._trial_in_flight = False
+    
+    def allow_request(self) -> bool:
+        """Return True if a call may be sent to the provider now."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        
+        if self.state == CircuitState.OPEN:
+            if self._clock() - self.opened_at < self.config.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self.logger.info(f"Circuit for {self.name} half-open, sending trial request")
+        
+        # Half-open: only one trial request at a time
+        if self._trial_in_flight:
+            self.rejected += 1
+            return False
+        self._trial_in_flight = True
+        return True
+    
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state != CircuitState.CLOSED:
+            self.logger.info(f"Circuit for {self.name} closed")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.first_failure_at = None
+        self.opened_at = None
+        self._trial_in_flight = False
+    
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """Record a failed call."""
+        now = self._clock()
+        self.last_error = str(error) if error else None
+        
+        if self.state == CircuitState.HALF_OPEN:
+            self._open(now)
+            return
+        
+        # Failures older than the window no longer count towards the threshold
+        if self.first_failure_at is None or now - self.first_failure_at > self.config.timeout:
+            self.failures = 0
+            self.first_failure_at = now
+        
+        self.failures += 1
+        if self.failures >= self.config.threshold:
+            self._open(now)
+    
+    def release(self) -> None:
+        """Release a half-open trial slot without recording an outcome."""
+        self._trial_in_flight = False
+    
+    def _open(self, now: float) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+        self._trial_in_flight = False
+        self.logger.error(
+            f"Circuit for {self.name} opened after {self.failures} failures: {self.last_error}"
+        )
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state for health and status reporting."""
+        retry_in = None
+        if self.state == CircuitState.OPEN:
+            retry_in = max(0.0, self.config.reset_timeout - (self._clock() - self.opened_at))
+        
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retry_in": retry_in,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,117 @@
+"""Adaptive (AIMD) concurrency limiting for outbound provider calls."""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict
+
+from ..core.config import ConcurrencyConfig
+from ..utils.logger import get_logger
+from ..utils.metrics import CONCURRENCY_IN_FLIGHT, CONCURRENCY_LIMIT, CONCURRENCY_QUEUE_WAIT
+from .errors import is_overload
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a provider's wait queue is at its depth limit."""
+
+
+class AdaptiveConcurrencyLimiter:
+    """Per-provider concurrency limit tuned by additive increase / multiplicative decrease.
+    
+    Every successful call raises the limit by ``increase / limit`` (about
+    ``increase`` per full window of calls); a 429 or timeout multiplies it by
+    ``backoff``. Callers over the limit wait in FIFO order, up to
+    ``max_queue`` of them.
+    """
+    
+    def __init__(self, name: str, config: ConcurrencyConfig):
+        self.name = name
+        self.config = config
+        self.logger = get_logger(f"concurrency.{name}")
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._publish()
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+    
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            self._publish()
+            CONCURRENCY_QUEUE_WAIT.labels(provider=self.name).observe(0.0)
+            return
+        
+        if len(self._waiters) >= self.config.max_queue:
+            raise QueueFullError(
+                f"Provider {self.name} queue is full ({self.config.max_queue} waiting)"
+            )
+        
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        CONCURRENCY_QUEUE_WAIT.labels(provider=self.name).observe(time.monotonic() - started)
+    
+    def release(self, outcome: str) -> None:
+        """Free a slot and adapt the limit ("success", "overload" or "error")."""
+        self.in_flight -= 1
+        if outcome == "success":
+            self.limit = min(
+                float(self.config.max_limit),
+                self.limit + self.config.increase / max(self.limit, 1.0),
+            )
+        elif outcome == "overload":
+            self.limit = max(float(self.config.min_limit), self.limit * self.config.backoff)
+            self.logger.warning(f"Provider {self.name} overloaded, concurrency limit now {int(self.limit)}")
+        self._wake()
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a call, classifying its outcome."""
+        await self.acquire()
+        outcome = "error"
+        try:
+            yield
+            outcome = "success"
+        except Exception as e:
+            if is_overload(e):
+                outcome = "overload"
+            raise
+        finally:
+            self.release(outcome)
+    
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+        self._publish()
+    
+    def _publish(self) -> None:
+        CONCURRENCY_LIMIT.labels(provider=self.name).set(int(self.limit))
+        CONCURRENCY_IN_FLIGHT.labels(provider=self.name).set(self.in_flight)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return limiter state for status reporting."""
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": self.queue_depth,
+        }
@@ -0,0 +1,52 @@
+"""Per-request deadlines carried down to provider calls."""
+
+import time
+from typing import Callable, Optional
+
+from ..core.config import DeadlineConfig
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a request's deadline passes before a provider answers."""
+    pass
+
+
+class Deadline:
+    """Point in time by which a request must be answered.
+    
+    Each provider attempt is bounded by the time remaining, and fallbacks
+    that typically take longer than that are not started.
+    """
+    
+    def __init__(self, timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.timeout = timeout
+        self._clock = clock
+        self.expires_at = clock() + timeout
+    
+    @classmethod
+    def resolve(cls, timeout: Optional[float], config: DeadlineConfig) -> Optional["Deadline"]:
+        """Build a deadline from a requested timeout, the configured default and cap."""
+        if timeout is None or timeout <= 0:
+            timeout = config.default
+        if config.max is not None and (timeout is None or timeout > config.max):
+            timeout = config.max
+        return cls(timeout) if timeout else None
+    
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - self._clock())
+    
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0.0
+    
+    def bound(self, timeout: Optional[float]) -> float:
+        """Shorten ``timeout`` to the time remaining."""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+    
+    def allows(self, expected: Optional[float]) -> bool:
+        """Whether a call expected to take ``expected`` seconds can still finish in time."""
+        remaining = self.remaining()
+        return remaining > 0.0 and (expected is None or expected <= remaining)
@@ -0,0 +1,79 @@
+"""Classification of provider SDK errors."""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def get_status_code(error: BaseException) -> Optional[int]:
+    """Return the HTTP status code carried by an SDK error, if any."""
+    for candidate in (error, getattr(error, "response", None)):
+        status = getattr(candidate, "status_code", None)
+        if isinstance(status, int):
+            return status
+    # google.api_core exceptions expose the HTTP status as ``code``
+    code = getattr(error, "code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Return True for 429 / quota exhaustion errors."""
+    return get_status_code(error) == 429 or "RateLimit" in type(error).__name__
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Return True for client or server side timeouts."""
+    return (
+        isinstance(error, (asyncio.TimeoutError, TimeoutError))
+        or "Timeout" in type(error).__name__
+        or get_status_code(error) in (408, 504)
+    )
+
+
+def is_overload(error: BaseException) -> bool:
+    """Return True for errors that signal the provider is over capacity."""
+    return is_rate_limited(error) or is_timeout(error)
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Return True for network-level failures (no HTTP response)."""
+    return isinstance(error, ConnectionError) or "Connection" in type(error).__name__
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Return True if retrying the same call may succeed.
+    
+    Rate limits, timeouts, connection failures and 5xx responses are
+    transient; other 4xx responses and local errors are not.
+    """
+    if is_overload(error) or is_connection_error(error):
+        return True
+    status = get_status_code(error)
+    return status is not None and 500 <= status < 600
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Return the server's requested wait in seconds, if it sent one."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,55 @@
+"""Dedicated thread pools for blocking provider SDK calls."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from ..utils.metrics import EXECUTOR_QUEUE_DEPTH, EXECUTOR_QUEUE_WAIT
+
+
+class BlockingExecutor:
+    """Bounded thread pool for one provider's blocking SDK calls.
+    
+    Keeps slow sync SDK calls off the default executor that ``to_thread``
+    and the rest of the app share, and reports how long calls queue for
+    a worker.
+    """
+    
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.queued = 0
+        self.running = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"spot-{name}")
+    
+    def _adjust(self, queued: int, running: int) -> None:
+        with self._lock:
+            self.queued += queued
+            self.running += running
+            EXECUTOR_QUEUE_DEPTH.labels(executor=self.name).set(self.queued)
+    
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` on the pool and await its result."""
+        submitted = time.monotonic()
+        self._adjust(1, 0)
+        
+        def call() -> Any:
+            EXECUTOR_QUEUE_WAIT.labels(executor=self.name).observe(time.monotonic() - submitted)
+            self._adjust(-1, 1)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._adjust(0, -1)
+        
+        return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish."""
+        self._pool.shutdown(wait=False)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return pool usage for status reporting."""
+        return {"workers": self.max_workers, "running": self.running, "queued": self.queued}
@@ -0,0 +1,137 @@
+"""Background provider health monitoring."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from ..core.config import HealthCheckConfig
+from ..utils.logger import get_logger
+from ..utils.metrics import PROVIDER_HEALTHY
+from .errors import get_status_code, is_retryable
+
+if TYPE_CHECKING:
+    from .manager import ProviderManager
+
+
+class HealthMonitor:
+    """Keeps an in-memory snapshot of provider health.
+    
+    A background task probes providers concurrently every ``interval``
+    seconds, each probe bounded by ``timeout``. Live traffic also updates
+    the snapshot, and a provider that served traffic within the last
+    interval is not probed at all. Readers never wait on a provider.
+    """
+    
+    def __init__(
+        self,
+        manager: "ProviderManager",
+        config: HealthCheckConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.manager = manager
+        self.config = config
+        self.logger = get_logger("health_monitor")
+        self._clock = clock
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background probe loop is running."""
+        return self._task is not None and not self._task.done()
+    
+    def _update(self, name: str, healthy: bool, source: str, error: Optional[str] = None, latency: Optional[float] = None) -> None:
+        self._status[name] = {
+            "healthy": healthy,
+            "source": source,
+            "checked_at": self._clock(),
+            "latency": latency,
+            "error": error,
+        }
+        PROVIDER_HEALTHY.labels(provider=name).set(1 if healthy else 0)
+    
+    def record_outcome(self, name: str, error: Optional[BaseException] = None) -> None:
+        """Update health passively from a live call.
+        
+        Only errors that say something about the provider (transient or
+        auth failures) mark it unhealthy; a bad request does not.
+        """
+        if error is None:
+            self._update(name, True, "traffic")
+        elif is_retryable(error) or get_status_code(error) in (401, 403):
+            self._update(name, False, "traffic", error=f"{type(error).__name__}: {error}")
+    
+    async def _probe(self, name: str) -> None:
+        provider = self.manager.providers.get(name)
+        if provider is None:
+            return
+        started = self._clock()
+        try:
+            healthy = await asyncio.wait_for(provider.health_check(), self.config.timeout)
+            error = None if healthy else "health check failed"
+        except asyncio.TimeoutError:
+            healthy, error = False, f"health check timed out after {self.config.timeout}s"
+        except Exception as e:
+            healthy, error = False, f"{type(e).__name__}: {e}"
+        self._update(name, healthy, "probe", error=error, latency=self._clock() - started)
+    
+    async def refresh(self, max_age: Optional[float] = None) -> None:
+        """Probe, concurrently, every provider whose status is older than ``max_age``.
+        
+        With no ``max_age`` every provider is probed.
+        """
+        now = self._clock()
+        stale = [
+            name for name in self.manager.providers
+            if max_age is None
+            or name not in self._status
+            or now - self._status[name]["checked_at"] >= max_age
+        ]
+        if stale:
+            await asyncio.gather(*(self._probe(name) for name in stale))
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh(max_age=self.config.interval)
+            except Exception as e:
+                self.logger.error(f"Health probe round failed: {e}")
+            await asyncio.sleep(self.config.interval)
+    
+    def start(self) -> None:
+        """Start the background probe loop."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+            self.logger.info(f"Health monitor started (every {self.config.interval}s)")
+    
+    async def stop(self) -> None:
+        """Stop the background probe loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    def snapshot(self) -> Dict[str, bool]:
+        """Return the last known health of each provider."""
+        return {
+            name: self._status.get(name, {}).get("healthy", False)
+            for name in self.manager.providers
+        }
+    
+    def details(self) -> Dict[str, Dict[str, Any]]:
+        """Return the last check of each provider with its age in seconds."""
+        now = self._clock()
+        details = {}
+        for name, status in self._status.items():
+            details[name] = {
+                "healthy": status["healthy"],
+                "source": status["source"],
+                "age": round(now - status["checked_at"], 3),
+                "latency": status["latency"],
+                "error": status["error"],
+            }
+        return details
@@ -0,0 +1,73 @@
+"""Latency tracking and hedging policy for SPOT providers."""
+
+import math
+from collections import deque
+from typing import Any, Dict, Optional
+
+from ..core.config import HedgingConfig
+
+
+class LatencyWindow:
+    """Sliding window of recent successful call latencies for one provider."""
+    
+    def __init__(self, size: int = 200):
+        self._samples = deque(maxlen=size)
+    
+    def record(self, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        self._samples.append(seconds)
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the p-th percentile (0-1) of recorded latencies."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(p * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgePolicy:
+    """Decides when a hedge may be fired and keeps hedge counts.
+    
+    Each request earns ``budget_ratio`` hedge credits (capped), and each hedge
+    spends one, so hedging never adds more than ``budget_ratio`` extra load on
+    top of regular traffic.
+    """
+    
+    def __init__(self, config: HedgingConfig):
+        self.config = config
+        self._credits = 1.0
+        self._max_credits = max(1.0, 10 * config.budget_ratio)
+        self.fired = 0
+        self.won = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether hedging is switched on."""
+        return self.config.enabled and self.config.max_hedges > 0
+    
+    def delay_for(self, window: Optional[LatencyWindow]) -> float:
+        """Return how long to wait on a provider before hedging it."""
+        if window is None or len(window) < self.config.min_samples:
+            return self.config.delay
+        return window.percentile(self.config.percentile)
+    
+    def record_request(self) -> None:
+        """Credit the hedge budget for a new request."""
+        self._credits = min(self._max_credits, self._credits + self.config.budget_ratio)
+    
+    def can_hedge(self) -> bool:
+        """Whether a hedge credit is available."""
+        return self._credits >= 1.0
+    
+    def record_hedge(self) -> None:
+        """Spend a hedge credit on a backup call that was started."""
+        self._credits -= 1.0
+        self.fired += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return hedge counters."""
+        return {"enabled": self.enabled, "fired": self.fired, "won": self.won}
@@ -1,11 +1,73 @@
 """Provider management for SPOT."""
 
 import asyncio
-from typing import Dict, List, Optional, Any
+import inspect
+import time
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 
 from ..core.config import Config, get_config
+from ..core.streaming_json import StreamingJSONError, StreamingJSONParser
 from ..utils.logger import get_logger
+from ..utils.metrics import HEDGES_FIRED, HEDGES_WON, PROMPT_TOKENS_CACHED, REQUESTS_COALESCED, STREAMS_STOPPED
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .concurrency import AdaptiveConcurrencyLimiter, QueueFullError
+from .deadline import Deadline, DeadlineExceededError
+from .errors import is_retryable
+from .executor import BlockingExecutor
+from .health import HealthMonitor
+from .messages import Prompt, anthropic_request, as_messages, cached_tokens, openai_messages, prompt_text
+from .hedging import HedgePolicy, LatencyWindow
+from .rate_limit import RateLimiter, estimate_tokens, get_rate_limiter, parse_rate_limit_headers
+from .retry import RetryBudget, RetryPolicy
+from .scoring import ProviderScore
+from .single_flight import SingleFlight, request_key
+from .transport import HTTPTransport
+
+
+def total_tokens(usage: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Total tokens from a usage dict in OpenAI or Anthropic shape."""
+    if not usage:
+        return None
+    if usage.get("total_tokens"):
+        return usage["total_tokens"]
+    counted = (usage.get("input_tokens") or 0) + (usage.get("output_tokens") or 0)
+    return counted or None
+
+
+def gemini_usage(metadata: Any) -> Dict[str, int]:
+    """Usage dict from a Gemini response's ``usage_metadata``."""
+    prompt_tokens = getattr(metadata, "prompt_token_count", 0) or 0
+    completion_tokens = getattr(metadata, "candidates_token_count", 0) or 0
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": getattr(metadata, "total_token_count", 0) or prompt_tokens + completion_tokens,
+        "cached_tokens": getattr(metadata, "cached_content_token_count", 0) or 0,
+    }
+
+
+def with_cached_tokens(usage: Dict[str, Any]) -> Dict[str, Any]:
+    """Add a provider-neutral ``cached_tokens`` count to an SDK usage dict."""
+    usage["cached_tokens"] = cached_tokens(usage)
+    return usage
+
+
+async def parse_raw_response(raw: Any) -> Any:
+    """Parse an SDK ``with_raw_response`` result (sync or async ``parse``)."""
+    response = raw.parse()
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+
+async def close_stream(stream: Any) -> None:
+    """Close an SDK response stream, releasing its connection."""
+    close = getattr(stream, "close", None) or getattr(getattr(stream, "response", None), "aclose", None)
+    if close is not None:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
 
 
 class Provider(ABC):
@@ -15,11 +77,62 @@ class Provider(ABC):
         self.config = config
         self.api_key = api_key
         self.logger = get_logger(f"provider.{self.__class__.__name__.lower()}")
+        self._client: Any = None
+        self._client_unavailable = False
+        self.transport: Optional[HTTPTransport] = None
+        self.executor: Optional[BlockingExecutor] = None
+        self._upstream: Optional[str] = None
+    
+    def _lazy_client(self, build: Callable[[], Any], package: str) -> Any:
+        """Build the SDK client on first use.
+        
+        SDK imports are slow, so they happen here rather than at startup.
+        Returns None without an API key or when the SDK is not installed.
+        """
+        if self._client is None and self.api_key and not self._client_unavailable:
+            try:
+                self._client = build()
+            except ImportError:
+                self._client_unavailable = True
+                self.logger.warning(f"{package} package not installed")
+        return self._client
+    
+    def _http_client(self, upstream: str, sdk: Any) -> Any:
+        """Get the shared pooled HTTP client for an SDK, if a transport is attached."""
+        if self.transport is None:
+            return None
+        self._upstream = upstream
+        return self.transport.client(upstream, self.config, getattr(sdk, "DefaultAsyncHttpxClient", None))
+    
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking SDK call on this provider's own thread pool.
+        
+        For SDK calls with no async variant. The pool is sized by the
+        ``executor_workers`` config so slow calls cannot starve the
+        default executor shared with the rest of the app.
+        """
+        if self.executor is None:
+            name = self.__class__.__name__.lower().removesuffix("provider")
+            self.executor = BlockingExecutor(name, self.config.get("executor_workers", 4))
+        return await self.executor.run(func, *args, **kwargs)
+    
+    async def warm_up(self) -> None:
+        """Pre-open pooled connections to the provider's API.
+        
+        Providers whose SDK client does not use the shared transport skip this.
+        """
+        client = getattr(self, "client", None)
+        if client is None or self._upstream is None:
+            return
+        opened = await self.transport.warm_up(
+            self._upstream, str(client.base_url), self.config.get("pool_warm_connections", 0)
+        )
+        self.logger.info(f"Warmed {opened} connection(s) to {self._upstream}")
     
     @abstractmethod
     async def generate(
         self,
-        prompt: str,
+        prompt: Prompt,
         max_tokens: int = None,
         temperature: float = None,
         **kwargs
@@ -27,9 +140,33 @@ class Provider(ABC):
         """Generate content using the provider."""
         pass
     
+    async def stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int = None,
+        temperature: float = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream content as ``delta`` events followed by one ``done`` event.
+        
+        Providers without native streaming send the whole answer as one delta.
+        """
+        result = await self.generate(prompt, max_tokens=max_tokens, temperature=temperature, **kwargs)
+        yield {"type": "delta", "content": result["content"]}
+        yield {
+            "type": "done",
+            "usage": result.get("usage", {}),
+            "model": result.get("model"),
+            "provider": result.get("provider"),
+        }
+    
     @abstractmethod
     async def health_check(self) -> bool:
-        """Check if the provider is healthy."""
+        """Check if the provider is healthy.
+        
+        Runs periodically in the background, so it should be a cheap call
+        (e.g. fetching model metadata), not a generation.
+        """
         pass
 
 
@@ -38,19 +175,34 @@ class MockProvider(Provider):
     
     async def generate(
         self,
-        prompt: str,
+        prompt: Prompt,
         max_tokens: int = None,
         temperature: float = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Generate mock content."""
         return {
-            "content": f"Mock response for prompt: {prompt[:50]}...",
+            "content": f"Mock response for prompt: {prompt_text(prompt)[:50]}...",
             "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
             "model": self.config.get("model", "mock-model"),
             "provider": "mock"
         }
     
+    async def stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int = None,
+        temperature: float = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream mock content word by word."""
+        result = await self.generate(prompt, max_tokens=max_tokens, temperature=temperature, **kwargs)
+        words = result["content"].split(" ")
+        for index, word in enumerate(words):
+            yield {"type": "delta", "content": word if index == 0 else f" {word}"}
+            await asyncio.sleep(0)
+        yield {"type": "done", "usage": result["usage"], "model": result["model"], "provider": "mock"}
+    
     async def health_check(self) -> bool:
         """Mock health check always returns True."""
         return True
@@ -59,19 +211,20 @@ class MockProvider(Provider):
 class OpenAIProvider(Provider):
     """OpenAI provider implementation."""
     
-    def __init__(self, config: Dict[str, Any], api_key: Optional[str] = None):
-        super().__init__(config, api_key)
-        self.client = None
-        if api_key:
-            try:
-                import openai
-                self.client = openai.AsyncOpenAI(api_key=api_key)
-            except ImportError:
-                self.logger.warning("OpenAI package not installed")
+    @property
+    def client(self) -> Any:
+        """OpenAI client, created on first use."""
+        return self._lazy_client(self._create_client, "OpenAI")
+    
+    def _create_client(self) -> Any:
+        import openai
+        return openai.AsyncOpenAI(
+            api_key=self.api_key, http_client=self._http_client("openai", openai)
+        )
     
     async def generate(
         self,
-        prompt: str,
+        prompt: Prompt,
         max_tokens: int = None,
         temperature: float = None,
         **kwargs
@@ -81,31 +234,67 @@ class OpenAIProvider(Provider):
             raise ValueError("OpenAI client not available")
         
         try:
-            response = await self.client.chat.completions.create(
+            raw = await self.client.chat.completions.with_raw_response.create(
                 model=self.config.get("model", "gpt-4"),
-                messages=[{"role": "user", "content": prompt}],
+                messages=openai_messages(prompt),
                 max_tokens=max_tokens or self.config.get("max_tokens", 2000),
-                temperature=temperature or self.config.get("temperature", 0.7),
+                temperature=temperature if temperature is not None else self.config.get("temperature", 0.7),
                 **kwargs
             )
+            response = await parse_raw_response(raw)
             
             return {
                 "content": response.choices[0].message.content,
-                "usage": response.usage.model_dump(),
+                "usage": with_cached_tokens(response.usage.model_dump()),
                 "model": response.model,
-                "provider": "openai"
+                "provider": "openai",
+                "rate_limit": parse_rate_limit_headers(raw.headers)
             }
         except Exception as e:
             self.logger.error(f"OpenAI generation failed: {e}")
             raise
     
+    async def stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int = None,
+        temperature: float = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream content from OpenAI."""
+        if not self.client:
+            raise ValueError("OpenAI client not available")
+        
+        stream = await self.client.chat.completions.create(
+            model=self.config.get("model", "gpt-4"),
+            messages=openai_messages(prompt),
+            max_tokens=max_tokens or self.config.get("max_tokens", 2000),
+            temperature=temperature if temperature is not None else self.config.get("temperature", 0.7),
+            stream=True,
+            stream_options={"include_usage": True},
+            **kwargs
+        )
+        usage: Dict[str, Any] = {}
+        model = self.config.get("model", "gpt-4")
+        try:
+            async for chunk in stream:
+                model = chunk.model or model
+                if chunk.usage:
+                    usage = with_cached_tokens(chunk.usage.model_dump())
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield {"type": "delta", "content": chunk.choices[0].delta.content}
+        finally:
+            await close_stream(stream)
+        
+        yield {"type": "done", "usage": usage, "model": model, "provider": "openai"}
+    
     async def health_check(self) -> bool:
         """Check OpenAI health."""
         if not self.client:
             return False
         
         try:
-            await self.client.models.list()
+            await self.client.models.retrieve(self.config.get("model", "gpt-4"))
             return True
         except Exception:
             return False
@@ -114,19 +303,20 @@ class OpenAIProvider(Provider):
 class AnthropicProvider(Provider):
     """Anthropic provider implementation."""
     
-    def __init__(self, config: Dict[str, Any], api_key: Optional[str] = None):
-        super().__init__(config, api_key)
-        self.client = None
-        if api_key:
-            try:
-                import anthropic
-                self.client = anthropic.AsyncAnthropic(api_key=api_key)
-            except ImportError:
-                self.logger.warning("Anthropic package not installed")
+    @property
+    def client(self) -> Any:
+        """Anthropic client, created on first use."""
+        return self._lazy_client(self._create_client, "Anthropic")
+    
+    def _create_client(self) -> Any:
+        import anthropic
+        return anthropic.AsyncAnthropic(
+            api_key=self.api_key, http_client=self._http_client("anthropic", anthropic)
+        )
     
     async def generate(
         self,
-        prompt: str,
+        prompt: Prompt,
         max_tokens: int = None,
         temperature: float = None,
         **kwargs
@@ -135,38 +325,75 @@ class AnthropicProvider(Provider):
         if not self.client:
             raise ValueError("Anthropic client not available")
         
+        system, messages = anthropic_request(prompt)
+        if system:
+            kwargs["system"] = system
         try:
-            response = await self.client.messages.create(
+            raw = await self.client.messages.with_raw_response.create(
                 model=self.config.get("model", "claude-3-sonnet-20240229"),
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 max_tokens=max_tokens or self.config.get("max_tokens", 2000),
-                temperature=temperature or self.config.get("temperature", 0.7),
+                temperature=temperature if temperature is not None else self.config.get("temperature", 0.7),
                 **kwargs
             )
+            response = await parse_raw_response(raw)
             
             return {
                 "content": response.content[0].text,
-                "usage": response.usage.model_dump(),
+                "usage": with_cached_tokens(response.usage.model_dump()),
                 "model": response.model,
-                "provider": "anthropic"
+                "provider": "anthropic",
+                "rate_limit": parse_rate_limit_headers(raw.headers)
             }
         except Exception as e:
             self.logger.error(f"Anthropic generation failed: {e}")
             raise
     
+    async def stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int = None,
+        temperature: float = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream content from Anthropic."""
+        if not self.client:
+            raise ValueError("Anthropic client not available")
+        
+        system, messages = anthropic_request(prompt)
+        if system:
+            kwargs["system"] = system
+        stream = await self.client.messages.create(
+            model=self.config.get("model", "claude-3-sonnet-20240229"),
+            messages=messages,
+            max_tokens=max_tokens or self.config.get("max_tokens", 2000),
+            temperature=temperature if temperature is not None else self.config.get("temperature", 0.7),
+            stream=True,
+            **kwargs
+        )
+        usage: Dict[str, Any] = {}
+        model = self.config.get("model", "claude-3-sonnet-20240229")
+        try:
+            async for event in stream:
+                if event.type == "message_start":
+                    model = event.message.model
+                    usage = with_cached_tokens(event.message.usage.model_dump())
+                elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield {"type": "delta", "content": event.delta.text}
+                elif event.type == "message_delta" and event.usage:
+                    usage["output_tokens"] = event.usage.output_tokens
+        finally:
+            await close_stream(stream)
+        
+        yield {"type": "done", "usage": usage, "model": model, "provider": "anthropic"}
+    
     async def health_check(self) -> bool:
         """Check Anthropic health."""
         if not self.client:
             return False
         
         try:
-            # Anthropic doesn't have a simple health check endpoint
-            # We'll use a minimal message as health check
-            await self.client.messages.create(
-                model=self.config.get("model", "claude-3-sonnet-20240229"),
-                messages=[{"role": "user", "content": "Hello"}],
-                max_tokens=1
-            )
+            await self.client.models.list(limit=1)
             return True
         except Exception:
             return False
@@ -175,22 +402,21 @@ class AnthropicProvider(Provider):
 class GeminiProvider(Provider):
     """Google Gemini provider implementation."""
     
-    def __init__(self, config: Dict[str, Any], api_key: Optional[str] = None):
-        super().__init__(config, api_key)
-        self.model = None
-        if api_key:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel(
-                    model_name=self.config.get("model", "gemini-1.5-pro")
-                )
-            except ImportError:
-                self.logger.warning("Google GenerativeAI package not installed")
+    @property
+    def model(self) -> Any:
+        """Gemini model client, created on first use."""
+        return self._lazy_client(self._create_client, "Google GenerativeAI")
+    
+    def _create_client(self) -> Any:
+        import google.generativeai as genai
+        genai.configure(api_key=self.api_key)
+        return genai.GenerativeModel(
+            model_name=self.config.get("model", "gemini-1.5-pro")
+        )
     
     async def generate(
         self,
-        prompt: str,
+        prompt: Prompt,
         max_tokens: int = None,
         temperature: float = None,
         **kwargs
@@ -203,18 +429,17 @@ class GeminiProvider(Provider):
             # Configure generation parameters
             generation_config = {
                 "max_output_tokens": max_tokens or self.config.get("max_tokens", 2000),
-                "temperature": temperature or self.config.get("temperature", 0.7),
+                "temperature": temperature if temperature is not None else self.config.get("temperature", 0.7),
             }
             
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt,
+            response = await self.model.generate_content_async(
+                prompt_text(prompt),
                 generation_config=generation_config
             )
             
             return {
                 "content": response.text,
-                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},  # Gemini doesn't provide usage stats
+                "usage": gemini_usage(response.usage_metadata),
                 "model": self.config.get("model", "gemini-1.5-pro"),
                 "provider": "gemini"
             }
@@ -222,15 +447,49 @@ class GeminiProvider(Provider):
             self.logger.error(f"Gemini generation failed: {e}")
             raise
     
+    async def stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int = None,
+        temperature: float = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream content from Gemini."""
+        if not self.model:
+            raise ValueError("Gemini model not available")
+        
+        generation_config = {
+            "max_output_tokens": max_tokens or self.config.get("max_tokens", 2000),
+            "temperature": temperature if temperature is not None else self.config.get("temperature", 0.7),
+        }
+        response = await self.model.generate_content_async(
+            prompt_text(prompt),
+            generation_config=generation_config,
+            stream=True
+        )
+        usage_metadata = None
+        async for chunk in response:
+            if chunk.parts:
+                yield {"type": "delta", "content": chunk.text}
+            # Each chunk reports the running totals; the last one is final
+            usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
+        
+        yield {
+            "type": "done",
+            "usage": gemini_usage(usage_metadata),
+            "model": self.config.get("model", "gemini-1.5-pro"),
+            "provider": "gemini"
+        }
+    
     async def health_check(self) -> bool:
         """Check Gemini health."""
         if not self.model:
             return False
         
         try:
-            await asyncio.to_thread(
-                self.model.generate_content, "Hello"
-            )
+            import google.generativeai as genai
+            # get_model has no async variant
+            await self.run_blocking(genai.get_model, self.model.model_name)
             return True
         except Exception:
             return False
@@ -243,6 +502,24 @@ class ProviderManager:
         self.config = config or get_config()
         self.logger = get_logger("provider_manager")
         self.providers: Dict[str, Provider] = {}
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyWindow] = {}
+        self.scores: Dict[str, ProviderScore] = {}
+        self.limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.hedge_policy = HedgePolicy(self.config.hedging)
+        self.retry_policy = RetryPolicy(self.config.retry)
+        self.retry_budget = RetryBudget(self.config.retry.budget_ratio, self.config.retry.budget_max)
+        self.single_flight = SingleFlight(REQUESTS_COALESCED)
+        self.transport = HTTPTransport()
+        self.health_monitor = HealthMonitor(self, self.config.health_check)
+        self.semantic_cache = None
+        if self.config.semantic_cache.enabled:
+            # Imported here so numpy is only loaded when the cache is used
+            from .semantic_cache import create_semantic_cache
+            self.semantic_cache = create_semantic_cache(
+                self.config.semantic_cache, self.config.get_api_key("openai")
+            )
         self._initialize_providers()
     
     def _initialize_providers(self):
@@ -264,7 +541,7 @@ class ProviderManager:
                         config=provider_config.model_dump() if provider_config else {},
                         api_key=api_key
                     )
-                    self.providers[name] = provider
+                    self.register_provider(name, provider)
                     self.logger.info(f"Initialized {name} provider")
                 else:
                     self.logger.warning(f"No API key found for {name} provider")
@@ -272,6 +549,21 @@ class ProviderManager:
             except Exception as e:
                 self.logger.error(f"Failed to initialize {name} provider: {e}")
     
+    def register_provider(self, name: str, provider: Provider) -> None:
+        """Register a provider along with its circuit breaker and score."""
+        provider.transport = self.transport
+        self.providers[name] = provider
+        self.circuit_breakers[name] = CircuitBreaker(name, self.config.circuit_breaker)
+        failover = self.config.failover
+        self.scores[name] = ProviderScore(failover.ewma_alpha, failover.max_error_rate)
+        self.limiters[name] = AdaptiveConcurrencyLimiter(name, self.config.concurrency)
+        self.rate_limiters[name] = get_rate_limiter(
+            name,
+            provider.api_key,
+            provider.config.get("requests_per_minute"),
+            provider.config.get("tokens_per_minute"),
+        )
+    
     async def get_provider(self, name: str) -> Provider:
         """Get a provider by name."""
         provider = self.providers.get(name)
@@ -281,45 +573,582 @@ class ProviderManager:
     
     async def generate(
         self,
-        prompt: str,
+        prompt: Prompt,
         provider_name: str = None,
         fallback_providers: List[str] = None,
+        template: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+        variables: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> Dict[str, Any]:
-        """Generate content with automatic fallback."""
-        provider_name = provider_name or self.config.provider
-        fallback_providers = fallback_providers or ["mock"]
+        """Generate content with automatic fallback.
         
-        # Try primary provider
-        try:
-            provider = await self.get_provider(provider_name)
-            return await provider.generate(prompt, **kwargs)
-        except Exception as e:
-            self.logger.warning(f"Primary provider {provider_name} failed: {e}")
+        Identical concurrent requests (same provider, model, prompt and
+        parameters) share one provider call when coalescing is enabled.
+        Requests with a ``deadline`` are not coalesced, so no caller is
+        bound by another caller's deadline.
+        With the semantic cache enabled, the answer to a similar enough
+        earlier prompt with the same provider, parameters and system
+        messages (which carry the style pack) is reused. For a template
+        render, pass its ``variables``: only they are compared, since the
+        template text around them would make renders that differ in one
+        variable (e.g. the topic) embed as near duplicates.
+        With a ``deadline`` each attempt only gets the time remaining and
+        ``DeadlineExceededError`` is raised once it passes.
+        """
+        provider = self.providers.get(provider_name) if provider_name else None
+        model = provider.config.get("model") if provider else None
+        params = {"fallback_providers": fallback_providers, "template": template, **kwargs}
+        
+        scope = embedding = None
+        if self.semantic_cache is not None:
+            messages = as_messages(prompt)
+            system = [message for message in messages if message["role"] == "system"]
+            scope = request_key(provider_name, model, prompt_text(system), params)
+            if variables is not None:
+                query = "\n".join(f"{name}: {value}" for name, value in sorted(variables.items()))
+            else:
+                query = prompt_text([message for message in messages if message["role"] != "system"])
+            try:
+                matches, embedding = await asyncio.wait_for(
+                    self.semantic_cache.lookup(query, k=self.config.semantic_cache.top_k, scope=scope),
+                    self._semantic_lookup_timeout(deadline),
+                )
+            except Exception as e:
+                # The cache is an optimization: an embedder that is down or
+                # slow must not fail the request
+                self.logger.warning(f"Semantic cache lookup skipped ({type(e).__name__}: {e})")
+                matches = []
+            if matches:
+                similarity, cached = matches[0]
+                return {**cached, "semantic_similarity": round(similarity, 4)}
+        
+        shared = False
+        if self.config.coalesce_enabled and deadline is None:
+            key = request_key(provider_name, model, prompt_text(prompt), params)
+            result, shared = await self.single_flight.do(
+                key,
+                lambda: self._generate(prompt, provider_name, fallback_providers, template, **kwargs),
+            )
+            if shared:
+                self.logger.debug(f"Coalesced request onto in-flight call {key[:12]}")
+            # Callers may mutate their result, so each gets its own copy
+            result = dict(result)
+        else:
+            result = await self._generate(prompt, provider_name, fallback_providers, template, deadline, **kwargs)
         
-        # Try fallback providers
-        for fallback_name in fallback_providers:
+        if embedding is not None and not shared:
             try:
-                provider = await self.get_provider(fallback_name)
-                result = await provider.generate(prompt, **kwargs)
-                self.logger.info(f"Used fallback provider: {fallback_name}")
+                self.semantic_cache.insert(embedding, dict(result), scope)
+            except Exception as e:
+                self.logger.warning(f"Semantic cache insert skipped ({type(e).__name__}: {e})")
+        return result
+    
+    def _semantic_lookup_timeout(self, deadline: Optional[Deadline]) -> float:
+        """Time the semantic cache lookup may take.
+        
+        ``lookup_timeout``, but never more than half of what is left before
+        ``deadline``, so providers still get most of it.
+        """
+        timeout = self.config.semantic_cache.lookup_timeout
+        if deadline is None:
+            return timeout
+        return min(timeout, deadline.remaining() / 2)
+    
+    async def _generate(
+        self,
+        prompt: Prompt,
+        provider_name: Optional[str],
+        fallback_providers: Optional[List[str]],
+        template: Optional[str],
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Route one request through the provider chain."""
+        chain = self.resolve_chain(provider_name, fallback_providers, template)
+        if self.hedge_policy.enabled:
+            return await self._generate_hedged(chain, prompt, deadline, **kwargs)
+        
+        errors = []
+        for index, name in enumerate(chain):
+            if index > 0 and not self._fits_deadline(name, deadline):
+                errors.append(f"{name}: skipped, {deadline.remaining():.2f}s left")
+                continue
+            try:
+                result = await self._call_provider(name, prompt, deadline, **kwargs)
+                if index > 0:
+                    self.logger.info(f"Used fallback provider: {name}")
                 return result
+            except DeadlineExceededError:
+                raise
+            except CircuitOpenError as e:
+                self.logger.info(str(e))
+                errors.append(f"{name}: circuit open")
             except Exception as e:
-                self.logger.warning(f"Fallback provider {fallback_name} failed: {e}")
+                role = "Primary" if index == 0 else "Fallback"
+                self.logger.warning(f"{role} provider {name} failed: {e}")
+                errors.append(f"{name}: {e}")
         
-        raise RuntimeError("All providers failed")
+        self._raise_exhausted(errors, deadline)
     
-    async def health_check_all(self) -> Dict[str, bool]:
-        """Check health of all providers."""
-        results = {}
-        for name, provider in self.providers.items():
+    async def stream(
+        self,
+        prompt: Prompt,
+        provider_name: str = None,
+        fallback_providers: List[str] = None,
+        template: Optional[str] = None,
+        output_parser: Optional[StreamingJSONParser] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream content with automatic fallback.
+        
+        Yields ``delta`` events and a final ``done`` event carrying usage and
+        ``timings`` (``ttft_ms``, ``total_ms``). A provider that fails before
+        its first token is skipped for the next one in the chain; once text
+        has been sent the error is raised to the caller.
+        
+        With an ``output_parser`` every delta is checked before it is sent:
+        the upstream request is cancelled with ``StreamingJSONError`` as soon
+        as the output can no longer match the schema, and reading stops once
+        the JSON document is complete (``done`` then has ``stopped_early``).
+        """
+        chain = self.resolve_chain(provider_name, fallback_providers, template)
+        errors = []
+        for index, name in enumerate(chain):
+            provider = self.providers.get(name)
+            if provider is None:
+                errors.append(f"{name}: not available")
+                continue
+            
+            breaker = self.circuit_breakers[name]
+            if not breaker.allow_request():
+                self.logger.info(f"Circuit for provider {name} is open, skipping")
+                errors.append(f"{name}: circuit open")
+                continue
+            
+            rate_limiter = self.rate_limiters[name]
+            max_tokens = kwargs.get("max_tokens") or provider.config.get("max_tokens", 2000)
+            estimated_tokens = estimate_tokens(prompt_text(prompt)) + max_tokens
+            started = time.monotonic()
+            first_token_at: Optional[float] = None
+            done: Dict[str, Any] = {"type": "done", "provider": name}
+            if output_parser is not None:
+                output_parser.reset()
             try:
-                results[name] = await provider.health_check()
+                await rate_limiter.acquire(estimated_tokens)
+                async with self.limiters[name].slot():
+                    started = time.monotonic()
+                    events = provider.stream(prompt, **kwargs)
+                    try:
+                        async for event in events:
+                            if event["type"] != "delta":
+                                done.update(event)
+                                continue
+                            if output_parser is not None:
+                                output_parser.feed(event["content"])
+                            if first_token_at is None:
+                                first_token_at = time.monotonic()
+                            yield event
+                            if output_parser is not None and output_parser.complete:
+                                # Closing the stream cancels the rest of the upstream request
+                                done["stopped_early"] = True
+                                STREAMS_STOPPED.labels(provider=name, reason="complete").inc()
+                                break
+                    finally:
+                        await events.aclose()
+            except QueueFullError as e:
+                breaker.release()
+                errors.append(f"{name}: {e}")
+                continue
+            except StreamingJSONError as e:
+                # The provider answered; the output is what is wrong
+                breaker.record_success()
+                self.health_monitor.record_outcome(name)
+                STREAMS_STOPPED.labels(provider=name, reason="invalid").inc()
+                self.logger.warning(f"Aborted stream from provider {name}: {e}")
+                if first_token_at is not None:
+                    raise
+                errors.append(f"{name}: invalid output ({e})")
+                continue
             except Exception as e:
-                self.logger.error(f"Health check failed for {name}: {e}")
-                results[name] = False
-        return results
+                self._record_failure(name, e)
+                self.scores[name].record(time.monotonic() - started, success=False)
+                if first_token_at is not None:
+                    self.logger.error(f"Provider {name} failed mid-stream: {e}")
+                    raise
+                role = "Primary" if index == 0 else "Fallback"
+                self.logger.warning(f"{role} provider {name} failed: {e}")
+                errors.append(f"{name}: {e}")
+                continue
+            except BaseException:
+                # Cancelled or closed by the consumer: no verdict on the provider
+                breaker.release()
+                raise
+            
+            elapsed = time.monotonic() - started
+            breaker.record_success()
+            self.health_monitor.record_outcome(name)
+            rate_limiter.reconcile(estimated_tokens, total_tokens(done.get("usage")))
+            self._record_cached_tokens(name, done.get("usage"))
+            self.scores[name].record(elapsed, success=True)
+            self.latencies.setdefault(name, LatencyWindow()).record(elapsed)
+            if index > 0:
+                self.logger.info(f"Used fallback provider: {name}")
+            
+            done["timings"] = {
+                "ttft_ms": round(((first_token_at or time.monotonic()) - started) * 1000, 1),
+                "total_ms": round(elapsed * 1000, 1),
+            }
+            yield done
+            return
+        
+        raise RuntimeError(f"All providers failed ({'; '.join(errors)})")
+    
+    def resolve_chain(
+        self,
+        provider_name: Optional[str] = None,
+        fallback_providers: Optional[List[str]] = None,
+        template: Optional[str] = None,
+    ) -> List[str]:
+        """Build the ordered list of providers to try for a request.
+        
+        An explicitly requested provider always goes first. The rest of the
+        chain (explicit fallbacks, or the configured chain for the template
+        and environment) is ordered by live score, so the provider currently
+        giving the fastest good answers is tried first. Providers that have
+        not answered yet follow the measured healthy ones, in the configured
+        order, and providers failing above ``max_error_rate`` go last. The
+        default provider is only used when no configured provider is
+        registered.
+        """
+        if fallback_providers is None:
+            configured = self.config.get_failover_chain(template)
+            fallback_providers = [name for name in configured if name in self.providers]
+            if not fallback_providers and self.config.provider in self.providers:
+                fallback_providers = [self.config.provider]
+        
+        candidates = [name for name in self._dedupe(fallback_providers) if name != provider_name]
+        candidates.sort(key=self._route_key)
+        return self._dedupe([provider_name, *candidates])
+    
+    def _route_key(self, name: str):
+        """Sort key for routing.
+        
+        Closed circuits first, then healthy providers by best score, then
+        providers without a successful call yet, then providers over the
+        error-rate cutoff. The sort is stable, so ties keep chain order.
+        """
+        breaker = self.circuit_breakers.get(name)
+        score = self.scores.get(name)
+        tripped = breaker is not None and breaker.state != CircuitState.CLOSED
+        unhealthy = score is not None and not score.healthy
+        expected = score.score if score else None
+        return (tripped, unhealthy, expected is None, expected or 0.0)
+    
+    def _record_failure(self, name: str, error: BaseException) -> None:
+        """Record a failed call against a provider's circuit breaker and health.
+        
+        Only transient failures (as the retry policy classifies them:
+        transport errors, timeouts, 429 and 5xx) count towards opening the
+        breaker; a bad request or a local error says nothing about the
+        provider, so it just frees a half-open trial slot.
+        """
+        breaker = self.circuit_breakers[name]
+        if is_retryable(error):
+            breaker.record_failure(error)
+        else:
+            breaker.release()
+        self.health_monitor.record_outcome(name, error)
+    
+    def _fits_deadline(self, name: str, deadline: Optional[Deadline]) -> bool:
+        """Whether a provider's typical latency fits in what is left of the deadline."""
+        if deadline is None:
+            return True
+        score = self.scores.get(name)
+        fits = deadline.allows(score.latency if score else None)
+        if not fits:
+            self.logger.info(f"Not starting provider {name}: {deadline.remaining():.2f}s left of the deadline")
+        return fits
+    
+    @staticmethod
+    def _raise_exhausted(errors: List[str], deadline: Optional[Deadline]) -> None:
+        """Raise the error for a chain in which no provider answered."""
+        message = "; ".join(errors)
+        if deadline is not None and (deadline.expired or "skipped" in message):
+            raise DeadlineExceededError(f"Deadline of {deadline.timeout}s exceeded ({message})")
+        raise RuntimeError(f"All providers failed ({message})")
+    
+    async def _generate_hedged(
+        self, chain: List[str], prompt: Prompt, deadline: Optional[Deadline] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """Walk the chain, starting the next provider early if one is slow.
+        
+        A hedge is fired when the most recently started provider has not
+        answered within its latency percentile. The first good answer wins
+        and every other in-flight call is cancelled.
+        """
+        policy = self.hedge_policy
+        policy.record_request()
+        
+        remaining = list(chain)
+        pending: Dict[asyncio.Task, str] = {}
+        hedged: set = set()
+        errors = []
+        hedge_at: Optional[float] = None
+        
+        def launch(is_hedge: bool = False) -> None:
+            nonlocal hedge_at
+            name = remaining.pop(0)
+            if pending or errors:
+                # Drop fallbacks that cannot answer before the deadline
+                while not self._fits_deadline(name, deadline):
+                    errors.append(f"{name}: skipped, {deadline.remaining():.2f}s left")
+                    if not remaining:
+                        hedge_at = None
+                        return
+                    name = remaining.pop(0)
+            task = asyncio.ensure_future(self._call_provider(name, prompt, deadline, **kwargs))
+            pending[task] = name
+            if is_hedge:
+                # Charged only now that a backup call has actually started
+                policy.record_hedge()
+                hedged.add(task)
+                HEDGES_FIRED.labels(provider=name).inc()
+                self.logger.info(f"Hedging request to provider {name}")
+            
+            hedge_at = None
+            if remaining and len(hedged) < policy.config.max_hedges:
+                hedge_at = time.monotonic() + policy.delay_for(self.latencies.get(name))
+        
+        launch()
+        try:
+            while pending:
+                timeout = None if hedge_at is None else max(0.0, hedge_at - time.monotonic())
+                if deadline is not None:
+                    timeout = deadline.bound(timeout)
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if not done:
+                    if deadline is not None and deadline.expired:
+                        break
+                    if remaining and policy.can_hedge():
+                        launch(is_hedge=True)
+                    else:
+                        hedge_at = None
+                    continue
+                
+                for task in done:
+                    name = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if task in hedged:
+                            policy.won += 1
+                            HEDGES_WON.labels(provider=name).inc()
+                        return task.result()
+                    if isinstance(error, DeadlineExceededError):
+                        raise error
+                    self.logger.warning(f"Provider {name} failed: {error}")
+                    errors.append(f"{name}: {error}")
+                
+                if not pending and remaining:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        self._raise_exhausted(errors, deadline)
+    
+    async def _call_provider(
+        self, name: str, prompt: Prompt, deadline: Optional[Deadline] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """Call a single provider through its circuit breaker."""
+        provider = await self.get_provider(name)
+        breaker = self.circuit_breakers[name]
+        
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit for provider {name} is open, skipping")
+        
+        try:
+            result = await self._call_with_retries(name, provider, prompt, deadline, **kwargs)
+        except (QueueFullError, DeadlineExceededError):
+            # The caller ran out of time; that says nothing about the provider
+            breaker.release()
+            raise
+        except Exception as e:
+            self._record_failure(name, e)
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the provider, free the half-open slot
+            breaker.release()
+            raise
+        
+        breaker.record_success()
+        self.health_monitor.record_outcome(name)
+        return result
+    
+    async def _call_with_retries(
+        self, name: str, provider: Provider, prompt: Prompt, deadline: Optional[Deadline] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """Call a provider, retrying transient errors with backoff.
+        
+        Each attempt is paced by the rate limiter (for no longer than the
+        time left before ``deadline``), holds a concurrency slot and is
+        bounded by the provider's ``timeout`` or the time left before
+        ``deadline``, whichever is shorter. Retries are limited by
+        ``retry_attempts``, the manager-wide retry budget and the deadline.
+        """
+        rate_limiter = self.rate_limiters[name]
+        max_tokens = kwargs.get("max_tokens") or provider.config.get("max_tokens", 2000)
+        estimated_tokens = estimate_tokens(prompt_text(prompt)) + max_tokens
+        timeout = provider.config.get("timeout")
+        max_retries = provider.config.get("retry_attempts", 0)
+        
+        self.retry_budget.record_call()
+        attempt = 0
+        while True:
+            try:
+                await rate_limiter.acquire(estimated_tokens, None if deadline is None else deadline.remaining())
+            except asyncio.TimeoutError as e:
+                raise DeadlineExceededError(
+                    f"Deadline of {deadline.timeout}s exceeded waiting for the {name} rate limit"
+                ) from e
+            started = time.monotonic()
+            try:
+                async with self.limiters[name].slot():
+                    started = time.monotonic()
+                    attempt_timeout = timeout if deadline is None else deadline.bound(timeout)
+                    result = await asyncio.wait_for(provider.generate(prompt, **kwargs), attempt_timeout)
+                break
+            except QueueFullError:
+                raise
+            except Exception as e:
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceededError(
+                        f"Deadline of {deadline.timeout}s exceeded waiting for provider {name}"
+                    ) from e
+                self.scores[name].record(time.monotonic() - started, success=False)
+                rate_limiter.update_from_headers(getattr(getattr(e, "response", None), "headers", None))
+                
+                delay = self.retry_policy.next_delay(e, attempt, max_retries)
+                if delay is None or (deadline is not None and delay >= deadline.remaining()):
+                    raise
+                if not self.retry_budget.try_acquire():
+                    raise
+                attempt += 1
+                self.logger.warning(
+                    f"Provider {name} attempt {attempt} failed ({type(e).__name__}: {e}), "
+                    f"retrying in {delay:.2f}s"
+                )
+            
+            await asyncio.sleep(delay)
+        
+        elapsed = time.monotonic() - started
+        rate_limiter.reconcile(estimated_tokens, total_tokens(result.get("usage")))
+        rate_limiter.update_from_headers(result.pop("rate_limit", None))
+        self._record_cached_tokens(name, result.get("usage"))
+        self.scores[name].record(elapsed, success=True)
+        self.latencies.setdefault(name, LatencyWindow()).record(elapsed)
+        return result
+    
+    @staticmethod
+    def _record_cached_tokens(name: str, usage: Optional[Dict[str, Any]]) -> None:
+        """Count prompt tokens the provider served from its prompt cache."""
+        cached = (usage or {}).get("cached_tokens")
+        if cached:
+            PROMPT_TOKENS_CACHED.labels(provider=name).inc(cached)
+    
+    @staticmethod
+    def _dedupe(names: List[Optional[str]]) -> List[str]:
+        """Drop empty and repeated provider names, keeping order."""
+        chain: List[str] = []
+        for name in names:
+            if name and name not in chain:
+                chain.append(name)
+        return chain
+    
+    async def health_check_all(self) -> Dict[str, bool]:
+        """Get provider health from the monitor snapshot.
+        
+        Only providers that have never been checked are probed; the
+        background monitor (or live traffic) keeps the rest current.
+        """
+        await self.health_monitor.refresh(max_age=float("inf"))
+        return self.health_monitor.snapshot()
+    
+    async def warm_up(self) -> None:
+        """Pre-open pooled connections to every provider, concurrently."""
+        results = await asyncio.gather(
+            *(provider.warm_up() for provider in self.providers.values()), return_exceptions=True
+        )
+        for name, result in zip(self.providers, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Warm-up failed for {name}: {result}")
+    
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections and provider thread pools."""
+        await self.transport.aclose()
+        for provider in self.providers.values():
+            if provider.executor is not None:
+                provider.executor.shutdown()
+    
+    def get_transport_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get HTTP connection pool stats per upstream."""
+        return self.transport.snapshot()
+    
+    def get_executor_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get blocking-call thread pool usage for providers that have one."""
+        return {
+            name: provider.executor.snapshot()
+            for name, provider in self.providers.items()
+            if provider.executor is not None
+        }
+    
+    def get_health_details(self) -> Dict[str, Dict[str, Any]]:
+        """Get the last health check of each provider."""
+        return self.health_monitor.details()
     
     def list_providers(self) -> List[str]:
         """List available providers."""
-        return list(self.providers.keys())
\ No newline at end of file
+        return list(self.providers.keys())
+    
+    def get_provider_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get circuit breaker state for all providers."""
+        return {name: breaker.snapshot() for name, breaker in self.circuit_breakers.items()}
+    
+    def get_concurrency_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get adaptive concurrency limiter state for all providers."""
+        return {name: limiter.snapshot() for name, limiter in self.limiters.items()}
+    
+    def get_retry_status(self) -> Dict[str, Any]:
+        """Get the shared retry budget state."""
+        return self.retry_budget.snapshot()
+    
+    def get_rate_limit_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get RPM/TPM bucket balances for providers with quotas configured."""
+        return {
+            name: limiter.snapshot()
+            for name, limiter in self.rate_limiters.items()
+            if limiter.buckets
+        }
+    
+    def get_provider_scores(self) -> Dict[str, Dict[str, Any]]:
+        """Get live latency/error scores used for routing."""
+        return {name: score.snapshot() for name, score in self.scores.items()}
+    
+    def get_hedging_stats(self) -> Dict[str, Any]:
+        """Get hedged request counters."""
+        return self.hedge_policy.snapshot()
+    
+    def get_semantic_cache_stats(self) -> Dict[str, Any]:
+        """Get semantic cache counters."""
+        if self.semantic_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.semantic_cache.snapshot()}
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Get single-flight request coalescing counters."""
+        return {"enabled": self.config.coalesce_enabled, **self.single_flight.snapshot()}
\ No newline at end of file
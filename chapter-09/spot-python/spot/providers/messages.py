@@ -0,0 +1,75 @@
+"""Provider-neutral chat messages and their per-provider request shapes.
+
+A prompt is either a plain string or a list of messages, each a dict with
+``role`` (``system``, ``user`` or ``assistant``) and ``content`` (text).
+A message with ``"cache": True`` ends a stable prefix that providers with
+explicit prompt caching should cache.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+Message = Dict[str, Any]
+Prompt = Union[str, List[Message]]
+
+
+def as_messages(prompt: Prompt) -> List[Message]:
+    """Return a prompt as a message list."""
+    if isinstance(prompt, str):
+        return [{"role": "user", "content": prompt}]
+    return list(prompt)
+
+
+def prompt_text(prompt: Prompt) -> str:
+    """Flatten a prompt to one string, stable parts first."""
+    if isinstance(prompt, str):
+        return prompt
+    return "\n\n".join(message["content"] for message in prompt)
+
+
+def openai_messages(prompt: Prompt) -> List[Dict[str, str]]:
+    """Build OpenAI chat messages.
+    
+    OpenAI caches long prompt prefixes automatically, so only the order
+    matters; consecutive messages with the same role are merged.
+    """
+    merged: List[Dict[str, str]] = []
+    for message in as_messages(prompt):
+        if merged and merged[-1]["role"] == message["role"]:
+            merged[-1]["content"] += "\n\n" + message["content"]
+        else:
+            merged.append({"role": message["role"], "content": message["content"]})
+    return merged
+
+
+def anthropic_request(prompt: Prompt) -> Tuple[Optional[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Build the Anthropic ``system`` blocks and ``messages``.
+    
+    Messages marked ``cache`` get an ephemeral ``cache_control``
+    breakpoint so the prefix up to and including them is cached.
+    """
+    system: List[Dict[str, Any]] = []
+    messages: List[Dict[str, Any]] = []
+    for message in as_messages(prompt):
+        block: Dict[str, Any] = {"type": "text", "text": message["content"]}
+        if message.get("cache"):
+            block["cache_control"] = {"type": "ephemeral"}
+        if message["role"] == "system":
+            system.append(block)
+        elif messages and messages[-1]["role"] == message["role"]:
+            messages[-1]["content"].append(block)
+        else:
+            messages.append({"role": message["role"], "content": [block]})
+    return system or None, messages
+
+
+def cached_tokens(usage: Optional[Dict[str, Any]]) -> int:
+    """Prompt tokens served from the provider's prompt cache.
+    
+    Reads OpenAI's ``prompt_tokens_details.cached_tokens`` and Anthropic's
+    ``cache_read_input_tokens``.
+    """
+    if not usage:
+        return 0
+    details = usage.get("prompt_tokens_details") or {}
+    return details.get("cached_tokens") or usage.get("cache_read_input_tokens") or 0
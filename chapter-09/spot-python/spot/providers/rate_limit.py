@@ -0,0 +1,212 @@
+"""Client-side request and token rate limiting for SPOT providers."""
+
+import asyncio
+import hashlib
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from ..utils.metrics import RATE_LIMIT_WAIT
+
+
+# Remaining-quota headers sent by providers, mapped to our bucket names
+RATE_LIMIT_HEADERS = {
+    "x-ratelimit-remaining-requests": "requests",
+    "x-ratelimit-remaining-tokens": "tokens",
+    "anthropic-ratelimit-requests-remaining": "requests",
+    "anthropic-ratelimit-tokens-remaining": "tokens",
+}
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``capacity`` per minute."""
+    
+    def __init__(self, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+    
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def available(self) -> float:
+        """Tokens currently in the bucket."""
+        self._refill()
+        return self.tokens
+    
+    def time_until(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available."""
+        self._refill()
+        # A request larger than the bucket only needs a full bucket
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+    
+    def resize(self, capacity: float) -> None:
+        """Change the per-minute capacity, keeping the balance (capped to the new size)."""
+        self._refill()
+        self.capacity = float(capacity)
+        self.rate = self.capacity / 60.0
+        self.tokens = min(self.tokens, self.capacity)
+    
+    def consume(self, amount: float) -> None:
+        """Take tokens; the balance may go negative (debt) for large charges."""
+        self._refill()
+        self.tokens -= amount
+    
+    def credit(self, amount: float) -> None:
+        """Give back tokens, e.g. when an estimate was too high."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+    
+    def sync(self, remaining: float) -> None:
+        """Lower the balance to the provider's reported remaining quota."""
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets for one provider key.
+    
+    Calls are charged their estimated prompt tokens plus ``max_tokens`` before
+    they are sent, and paced until both buckets can cover them. The charge is
+    corrected from the reported usage once the response arrives.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._clock = clock
+        self.configure(requests_per_minute, tokens_per_minute)
+        self._locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+    
+    def configure(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int]) -> None:
+        """Apply per-minute limits; buckets that already exist keep their balance."""
+        for name, limit in (("requests", requests_per_minute), ("tokens", tokens_per_minute)):
+            bucket = self.buckets.get(name)
+            if not limit:
+                self.buckets.pop(name, None)
+            elif bucket is None:
+                self.buckets[name] = TokenBucket(limit, self._clock)
+            elif bucket.capacity != limit:
+                bucket.resize(limit)
+    
+    def _wait_time(self, tokens: int) -> float:
+        charges = {"requests": 1, "tokens": tokens}
+        return max(
+            [bucket.time_until(charges[name]) for name, bucket in self.buckets.items()],
+            default=0.0,
+        )
+    
+    async def acquire(self, tokens: int, timeout: Optional[float] = None) -> float:
+        """Wait until a call costing ``tokens`` fits the quota, then charge it.
+        
+        Raises ``asyncio.TimeoutError``, without charging, as soon as it is
+        clear the call will not fit within ``timeout`` seconds.
+        Returns the time spent waiting.
+        """
+        if not self.buckets:
+            return 0.0
+        
+        started = time.monotonic()
+        # Limiters are shared process-wide, so keep one lock per event loop.
+        # Holding the lock while sleeping keeps waiters in FIFO order.
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            self._locks = {loop: asyncio.Lock()}
+            lock = self._locks[loop]
+        give_up = None if timeout is None else started + timeout
+        await asyncio.wait_for(self._charge(lock, tokens, give_up), timeout)
+        
+        waited = time.monotonic() - started
+        RATE_LIMIT_WAIT.observe(waited)
+        return waited
+    
+    async def _charge(self, lock: asyncio.Lock, tokens: int, give_up: Optional[float]) -> None:
+        async with lock:
+            wait = self._wait_time(tokens)
+            while wait > 0:
+                if give_up is not None and time.monotonic() + wait > give_up:
+                    raise asyncio.TimeoutError(f"Rate limit needs {wait:.2f}s, more than the time left")
+                await asyncio.sleep(wait)
+                wait = self._wait_time(tokens)
+            if "requests" in self.buckets:
+                self.buckets["requests"].consume(1)
+            if "tokens" in self.buckets:
+                self.buckets["tokens"].consume(tokens)
+    
+    def reconcile(self, estimated: int, actual: Optional[int]) -> None:
+        """Correct a charge once the real token usage is known."""
+        bucket = self.buckets.get("tokens")
+        if bucket is None or not actual:
+            return
+        if actual < estimated:
+            bucket.credit(estimated - actual)
+        else:
+            bucket.consume(actual - estimated)
+    
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Apply remaining-quota headers returned by the provider."""
+        for name, remaining in parse_rate_limit_headers(headers).items():
+            if name in self.buckets:
+                self.buckets[name].sync(remaining)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return bucket balances for status reporting."""
+        result = {}
+        for name, bucket in self.buckets.items():
+            result[name] = {"available": round(bucket.available(), 1), "per_minute": bucket.capacity}
+        return result
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, str]]) -> Dict[str, float]:
+    """Extract remaining request/token quota from provider response headers."""
+    remaining: Dict[str, float] = {}
+    if not headers:
+        return remaining
+    for header, name in RATE_LIMIT_HEADERS.items():
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            remaining[name] = float(value)
+        except ValueError:
+            continue
+    return remaining
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(
+    provider: str,
+    api_key: Optional[str],
+    requests_per_minute: Optional[int],
+    tokens_per_minute: Optional[int],
+) -> RateLimiter:
+    """Get the process-wide limiter for a provider and API key.
+    
+    If the limits changed since the limiter was created (e.g. a reloaded
+    configuration), its buckets are updated to the new limits.
+    """
+    fingerprint = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    key = (provider, fingerprint)
+    if key not in _limiters:
+        _limiters[key] = RateLimiter(requests_per_minute, tokens_per_minute)
+    else:
+        _limiters[key].configure(requests_per_minute, tokens_per_minute)
+    return _limiters[key]
@@ -0,0 +1,58 @@
+"""Retry backoff and retry budget for SPOT providers."""
+
+import random
+from typing import Any, Dict, Optional
+
+from ..core.config import RetryConfig
+from .errors import get_retry_after, is_retryable
+
+
+class RetryBudget:
+    """Manager-wide cap on retries.
+    
+    Every call earns ``ratio`` retry credits (up to ``max_credits``) and every
+    retry spends one, so during an outage retries add at most ``ratio`` extra
+    load instead of multiplying it.
+    """
+    
+    def __init__(self, ratio: float, max_credits: float):
+        self.ratio = ratio
+        self.max_credits = max_credits
+        self.credits = max_credits
+        self.exhausted = 0
+    
+    def record_call(self) -> None:
+        """Credit the budget for a new call."""
+        self.credits = min(self.max_credits, self.credits + self.ratio)
+    
+    def try_acquire(self) -> bool:
+        """Spend a credit for a retry if one is available."""
+        if self.credits < 1.0:
+            self.exhausted += 1
+            return False
+        self.credits -= 1.0
+        return True
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return budget state for status reporting."""
+        return {"credits": round(self.credits, 2), "exhausted": self.exhausted}
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter that honours ``Retry-After``."""
+    
+    def __init__(self, config: RetryConfig):
+        self.config = config
+    
+    def next_delay(self, error: BaseException, attempt: int, max_retries: int) -> Optional[float]:
+        """Return seconds to wait before retry number ``attempt + 1``, or None to give up."""
+        if attempt >= max_retries or not is_retryable(error):
+            return None
+        
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            # Waiting longer than our cap is worse than failing over
+            return retry_after if retry_after <= self.config.max_delay else None
+        
+        ceiling = min(self.config.max_delay, self.config.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
@@ -0,0 +1,58 @@
+"""Live provider scoring for failover ordering."""
+
+from typing import Any, Dict, Optional
+
+
+class ProviderScore:
+    """EWMA of a provider's latency and error rate.
+    
+    The latency average only counts successful calls, since a provider
+    that fails fast would otherwise look fast. The score is the expected
+    time to a successful answer: the smoothed latency inflated by the
+    smoothed error rate. Lower is better. A provider whose error rate is
+    above ``max_error_rate`` is unhealthy, whatever its latency.
+    """
+    
+    def __init__(self, alpha: float = 0.2, max_error_rate: float = 0.5):
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.samples = 0
+    
+    def record(self, latency: float, success: bool) -> None:
+        """Fold the outcome of one call into the averages."""
+        outcome = 0.0 if success else 1.0
+        if self.samples == 0:
+            self.error_rate = outcome
+        else:
+            self.error_rate += self.alpha * (outcome - self.error_rate)
+        self.samples += 1
+        if not success:
+            return
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.alpha * (latency - self.latency)
+    
+    @property
+    def healthy(self) -> bool:
+        """Whether the error rate is within ``max_error_rate``."""
+        return self.error_rate <= self.max_error_rate
+    
+    @property
+    def score(self) -> Optional[float]:
+        """Expected seconds to a good answer, or None without a successful call."""
+        if self.latency is None:
+            return None
+        return self.latency / max(1.0 - self.error_rate, 0.05)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the averages for status reporting."""
+        return {
+            "latency_ewma": self.latency,
+            "error_rate_ewma": self.error_rate,
+            "score": self.score,
+            "healthy": self.healthy,
+            "samples": self.samples,
+        }
@@ -0,0 +1,213 @@
+"""Embedding-based semantic response cache.
+
+Requires NumPy (``pip install spot-python[cache]``).
+"""
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..core.config import SemanticCacheConfig
+from ..utils.logger import get_logger
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class Embedder(ABC):
+    """Turns text into an embedding vector."""
+    
+    dimensions: int
+    
+    @abstractmethod
+    async def embed(self, text: str) -> "np.ndarray":
+        """Embed one text."""
+        pass
+
+
+class HashingEmbedder(Embedder):
+    """Deterministic local embedder using signed feature hashing.
+    
+    Words and word bigrams are hashed into ``dimensions`` buckets. No model
+    or network is needed, which makes it suitable for tests and offline use;
+    it matches rephrasings that share vocabulary, not synonyms.
+    """
+    
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+    
+    def embed_sync(self, text: str) -> "np.ndarray":
+        """Embed one text without awaiting."""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        words = WORD_PATTERN.findall(text.lower())
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dimensions] += 1.0 if value & (1 << 63) else -1.0
+        return vector
+    
+    async def embed(self, text: str) -> "np.ndarray":
+        """Embed one text."""
+        return self.embed_sync(text)
+
+
+class OpenAIEmbedder(Embedder):
+    """Embedder backed by the OpenAI embeddings API."""
+    
+    def __init__(self, api_key: str, model: str = "text-embedding-3-small", dimensions: int = 512):
+        import openai
+        self.client = openai.AsyncOpenAI(api_key=api_key)
+        self.model = model
+        self.dimensions = dimensions
+    
+    async def embed(self, text: str) -> "np.ndarray":
+        """Embed one text."""
+        response = await self.client.embeddings.create(
+            input=text, model=self.model, dimensions=self.dimensions
+        )
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+
+class SemanticCache:
+    """Fixed-capacity cache of responses looked up by embedding similarity.
+    
+    Embeddings are L2-normalized on insert and stored as rows of a
+    preallocated float32 matrix, so a lookup is one matrix-vector product
+    (cosine similarity) over the occupied rows. Each row may belong to a
+    scope (e.g. a provider, its parameters and the system prompt); a scoped
+    lookup only ranks the rows of its scope. When the cache is full the
+    least recently used row is overwritten.
+    """
+    
+    def __init__(self, embedder: Embedder, capacity: int = 10000, threshold: float = 0.92):
+        if np is None:
+            raise ImportError("The semantic cache requires numpy (pip install spot-python[cache])")
+        self.embedder = embedder
+        self.capacity = capacity
+        self.threshold = threshold
+        self._matrix = np.zeros((capacity, embedder.dimensions), dtype=np.float32)
+        self._values: List[Any] = [None] * capacity
+        self._scope_ids = np.full(capacity, -1, dtype=np.int64)
+        self._scopes: Dict[str, int] = {}
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._lru)
+    
+    @staticmethod
+    def normalize(vector: "np.ndarray") -> "np.ndarray":
+        """Return ``vector`` as a unit-length float32 array."""
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+    
+    async def embed(self, text: str) -> "np.ndarray":
+        """Embed and normalize a text, ready for ``search`` and ``insert``."""
+        return self.normalize(await self.embedder.embed(text))
+    
+    def search(
+        self,
+        embedding: "np.ndarray",
+        k: int = 1,
+        scope: Optional[str] = None,
+    ) -> List[Tuple[float, Any]]:
+        """Return up to ``k`` (similarity, value) pairs above the threshold, best first.
+        
+        With a ``scope``, only rows inserted with that scope are ranked.
+        """
+        size = len(self._lru)
+        if scope is None:
+            rows = np.arange(size)
+        elif scope in self._scopes:
+            rows = np.flatnonzero(self._scope_ids[:size] == self._scopes[scope])
+        else:
+            return []
+        if rows.size == 0:
+            return []
+        scores = self._matrix[rows] @ embedding
+        k = min(k, rows.size)
+        if k == 1:
+            top = np.array([int(np.argmax(scores))])
+        else:
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+        
+        matches = []
+        for index in top:
+            score = float(scores[index])
+            if score < self.threshold:
+                break
+            slot = int(rows[index])
+            self._lru.move_to_end(slot)
+            matches.append((score, self._values[slot]))
+        return matches
+    
+    def insert(self, embedding: "np.ndarray", value: Any, scope: Optional[str] = None) -> int:
+        """Store a value under a normalized embedding; returns its row."""
+        if len(self._lru) < self.capacity:
+            slot = len(self._lru)
+        else:
+            slot, _ = self._lru.popitem(last=False)
+        self._matrix[slot] = embedding
+        self._values[slot] = value
+        self._scope_ids[slot] = -1 if scope is None else self._scopes.setdefault(scope, len(self._scopes))
+        self._lru[slot] = None
+        return slot
+    
+    async def lookup(
+        self,
+        text: str,
+        k: int = 1,
+        scope: Optional[str] = None,
+    ) -> Tuple[List[Tuple[float, Any]], "np.ndarray"]:
+        """Search by text.
+        
+        Also returns the embedding, so a miss can be inserted without
+        embedding the text a second time.
+        """
+        embedding = await self.embed(text)
+        matches = self.search(embedding, k, scope)
+        if matches:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return matches, embedding
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return cache counters for status reporting."""
+        return {
+            "entries": len(self),
+            "capacity": self.capacity,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def create_semantic_cache(config: SemanticCacheConfig, openai_api_key: Optional[str] = None) -> Optional[SemanticCache]:
+    """Build the configured semantic cache, or None if disabled or unavailable."""
+    if not config.enabled:
+        return None
+    logger = get_logger("semantic_cache")
+    if np is None:
+        logger.warning("Semantic cache enabled but numpy is not installed")
+        return None
+    
+    if config.embedder == "openai":
+        if not openai_api_key:
+            logger.warning("Semantic cache needs an OpenAI API key for the openai embedder")
+            return None
+        embedder: Embedder = OpenAIEmbedder(openai_api_key, config.model, config.dimensions)
+    else:
+        embedder = HashingEmbedder(config.dimensions)
+    return SemanticCache(embedder, config.capacity, config.threshold)
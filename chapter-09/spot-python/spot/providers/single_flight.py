@@ -0,0 +1,84 @@
+"""Coalescing of identical in-flight provider requests."""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+
+def request_key(
+    provider: Optional[str],
+    model: Optional[str],
+    prompt: str,
+    params: Dict[str, Any],
+) -> str:
+    """Build the coalescing key for a request."""
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    payload = json.dumps(
+        [provider, model, prompt_hash, params], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    """One shared in-flight call and the number of callers awaiting it."""
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run one call per key and share its result with concurrent duplicates.
+    
+    The call runs in its own task, so a caller that is cancelled (e.g. a
+    client disconnect) only stops waiting; the call itself is cancelled once
+    no caller is left waiting for it. ``counter``, if given, is a
+    Prometheus counter incremented for every shared call.
+    """
+    
+    def __init__(self, counter: Optional[Any] = None):
+        self._calls: Dict[str, _Call] = {}
+        self.counter = counter
+        self.hits = 0
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+    
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await the call for ``key``, starting it if none is in flight.
+        
+        Returns the result and whether it was shared with an earlier caller.
+        """
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = _Call(asyncio.ensure_future(factory()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+        else:
+            self.hits += 1
+            if self.counter is not None:
+                self.counter.inc()
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is left waiting: stop the call and let a later
+                # duplicate start a fresh one instead of joining a dying task
+                self._forget(key, call)
+                call.task.cancel()
+    
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return coalescing counters for status reporting."""
+        return {"in_flight": self.in_flight, "hits": self.hits}
@@ -0,0 +1,109 @@
+"""Pooled HTTP transport shared by provider SDK clients."""
+
+import asyncio
+import sys
+from typing import Any, Dict, Optional, Type
+
+from ..utils.logger import get_logger
+from ..utils.metrics import HTTP_POOL_CONNECTIONS
+
+
+def _httpx_module(client_class: type) -> Any:
+    """Return the httpx (or API-compatible fork) module a client class is built on."""
+    for cls in client_class.__mro__:
+        if cls.__name__ == "AsyncClient":
+            return sys.modules[cls.__module__.split(".")[0]]
+    raise TypeError(f"{client_class!r} is not an httpx AsyncClient")
+
+
+class HTTPTransport:
+    """Owns one tuned, pooled ``AsyncClient`` per upstream.
+    
+    Every SDK client for an upstream is given the same HTTP client, so
+    generation calls and health checks reuse warm keep-alive connections.
+    Pool sizing comes from the provider config: ``pool_max_connections``,
+    ``pool_max_keepalive``, ``pool_keepalive_expiry`` and ``http2``.
+    """
+    
+    def __init__(self):
+        self.logger = get_logger("transport")
+        self.clients: Dict[str, Any] = {}
+        self._settings: Dict[str, Dict[str, Any]] = {}
+    
+    def client(self, upstream: str, config: Dict[str, Any], client_class: Optional[Type] = None) -> Any:
+        """Get the pooled client for an upstream, creating it on first use.
+        
+        ``client_class`` should be the SDK's own default client class (for
+        example ``openai.DefaultAsyncHttpxClient``) so the SDK's timeouts and
+        redirect handling are kept and the right httpx flavour is used.
+        """
+        if upstream in self.clients:
+            return self.clients[upstream]
+        
+        if client_class is None:
+            import httpx
+            client_class = httpx.AsyncClient
+        httpx_module = _httpx_module(client_class)
+        limits = httpx_module.Limits(
+            max_connections=config.get("pool_max_connections", 20),
+            max_keepalive_connections=config.get("pool_max_keepalive", 10),
+            keepalive_expiry=config.get("pool_keepalive_expiry", 30.0),
+        )
+        http2 = config.get("http2", False)
+        try:
+            client = client_class(limits=limits, http2=http2)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package
+            self.logger.warning(f"HTTP/2 unavailable for {upstream} (install httpx[http2]), using HTTP/1.1")
+            http2 = False
+            client = client_class(limits=limits)
+        
+        self.clients[upstream] = client
+        self._settings[upstream] = {
+            "max_connections": limits.max_connections,
+            "max_keepalive": limits.max_keepalive_connections,
+            "keepalive_expiry": limits.keepalive_expiry,
+            "http2": http2,
+        }
+        return client
+    
+    async def warm_up(self, upstream: str, url: str, connections: int) -> int:
+        """Pre-open up to ``connections`` keep-alive connections to ``url``.
+        
+        Sends concurrent HEAD requests so each one needs its own connection;
+        the response status does not matter. Returns the number opened.
+        """
+        client = self.clients.get(upstream)
+        if client is None or connections <= 0:
+            return 0
+        connections = min(connections, self._settings[upstream]["max_keepalive"])
+        results = await asyncio.gather(
+            *(client.head(url) for _ in range(connections)), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            self.logger.warning(f"Warm-up to {upstream} failed for {len(failures)} connection(s): {failures[0]}")
+        return len(results) - len(failures)
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return pool settings and connection counts per upstream."""
+        stats = {}
+        for upstream, client in self.clients.items():
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            idle = sum(1 for connection in connections if connection.is_idle())
+            active = sum(
+                1 for connection in connections
+                if not connection.is_idle() and not connection.is_closed()
+            )
+            HTTP_POOL_CONNECTIONS.labels(upstream=upstream, state="idle").set(idle)
+            HTTP_POOL_CONNECTIONS.labels(upstream=upstream, state="active").set(active)
+            stats[upstream] = {**self._settings[upstream], "idle": idle, "active": active}
+        return stats
+    
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+        self._settings.clear()
@@ -0,0 +1,231 @@
+"""Parallel style linting of many files.
+
+Files are collected from directories and glob patterns, split into chunks
+of about equal total size, and linted in a process pool. Each worker
+loads the style pack and compiles its term matcher once, when it starts.
+Results are yielded per file as chunks finish.
+"""
+
+import glob
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .stream_lint import STREAM_THRESHOLD, lint_file_streaming
+from .style_linter import lint_style, style_result
+from .term_matcher import compile_style_pack
+
+
+LINT_EXTENSIONS = (".md", ".markdown", ".txt")
+
+# Exit codes of a batch lint
+EXIT_OK = 0
+EXIT_VIOLATIONS = 1
+EXIT_ERROR = 2
+
+_style_pack: Optional[Dict[str, Any]] = None
+
+
+def collect_paths(
+    patterns: Iterable[str],
+    extensions: Sequence[str] = LINT_EXTENSIONS
+) -> Tuple[List[Path], List[str]]:
+    """Expand files, directories and glob patterns into files to lint.
+    
+    Directories are walked recursively for files with the given extensions,
+    skipping hidden directories. Files named explicitly are always linted.
+    
+    Returns:
+        Sorted unique files, and the patterns that matched nothing
+    """
+    files = set()
+    unmatched = []
+    for pattern in patterns:
+        if os.path.isfile(pattern):
+            files.add(Path(pattern))
+            continue
+        matches = [pattern] if os.path.isdir(pattern) else glob.glob(pattern, recursive=True)
+        found = set()
+        for match in matches:
+            if os.path.isfile(match):
+                if match.endswith(tuple(extensions)):
+                    found.add(Path(match))
+                continue
+            for root, dirs, names in os.walk(match):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                found.update(Path(root) / name for name in names if name.endswith(tuple(extensions)))
+        if not found:
+            unmatched.append(pattern)
+        files.update(found)
+    return sorted(files), unmatched
+
+
+def balance_chunks(paths: Sequence[Path], count: int) -> List[List[Path]]:
+    """Split files into up to ``count`` chunks of about equal total size.
+    
+    Largest files are placed first, each into the currently smallest chunk.
+    """
+    count = max(1, min(count, len(paths)))
+    sized = sorted(((_file_size(path), str(path), path) for path in paths), reverse=True)
+    heap = [(0, index) for index in range(count)]
+    chunks: List[List[Path]] = [[] for _ in range(count)]
+    for size, _, path in sized:
+        total, index = heapq.heappop(heap)
+        chunks[index].append(path)
+        heapq.heappush(heap, (total + size, index))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def lint_text(content: str, style_pack: Dict[str, Any]) -> Dict[str, Any]:
+    """Lint content into the fields ``SPOT.check_style`` returns (without the style pack)."""
+    return style_result(lint_style(content, style_pack), style_pack)
+
+
+def lint_path(path: Path, style_pack: Dict[str, Any]) -> Dict[str, Any]:
+    """Lint one file; read errors are returned as an ``error`` field.
+    
+    Files larger than ``STREAM_THRESHOLD`` bytes are linted in chunks.
+    """
+    try:
+        if _file_size(path) > STREAM_THRESHOLD:
+            return {"file_path": str(path), **style_result(lint_file_streaming(path, style_pack), style_pack)}
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return {"file_path": str(path), "error": str(e)}
+    return {"file_path": str(path), **lint_text(content, style_pack)}
+
+
+def _init_worker(style_pack: Dict[str, Any]) -> None:
+    """Process pool initializer: keep the style pack and compile its matcher."""
+    global _style_pack
+    _style_pack = style_pack
+    compile_style_pack(style_pack)
+
+
+def _lint_chunk(paths: List[Path]) -> List[Dict[str, Any]]:
+    return [lint_path(path, _style_pack) for path in paths]
+
+
+def lint_paths(
+    paths: Sequence[Path],
+    style_pack: Dict[str, Any],
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4
+) -> Iterator[Dict[str, Any]]:
+    """Lint files in parallel, yielding each file's result as it is ready.
+    
+    Args:
+        paths: Files to lint
+        style_pack: Style pack configuration
+        workers: Worker processes (default: CPU count); 1 lints in this process
+        chunks_per_worker: Chunks per worker, so a slow chunk does not leave
+            the other workers idle at the end
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield lint_path(path, style_pack)
+        return
+    
+    chunks = balance_chunks(paths, workers * chunks_per_worker)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=(style_pack,)
+    ) as pool:
+        futures = [pool.submit(_lint_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def exit_code(results: Iterable[Dict[str, Any]]) -> int:
+    """Aggregate exit code: 2 if any file failed to lint, 1 for violations, else 0."""
+    code = EXIT_OK
+    for result in results:
+        if "error" in result:
+            return EXIT_ERROR
+        if not result["compliant"]:
+            code = EXIT_VIOLATIONS
+    return code
+
+
+SARIF_RULES = {
+    "must_avoid": ("error", "Content contains a prohibited term"),
+    "must_use": ("warning", "Content is missing a required term"),
+    "reading_level": ("warning", "Reading level is outside the target range"),
+    "terminology": ("note", "A preferred term exists"),
+}
+
+
+def sarif_report(results: Iterable[Dict[str, Any]], style_pack: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a SARIF 2.1.0 log from batch lint results.
+    
+    Prohibited and terminology terms are reported at each occurrence (as
+    character offsets); missing terms and reading level apply to the file.
+    Files that could not be linted become tool execution notifications.
+    """
+    terminology = style_pack.get("terminology", {})
+    sarif_results = []
+    notifications = []
+    for result in results:
+        uri = Path(result["file_path"]).as_posix()
+        if "error" in result:
+            notifications.append({
+                "level": "error",
+                "message": {"text": result["error"]},
+                "locations": [{"physicalLocation": {"artifactLocation": {"uri": uri}}}],
+            })
+            continue
+        
+        for match in result["report"].get("matches", []):
+            if match["kind"] == "must_avoid":
+                message = f'Content contains prohibited term: "{match["term"]}"'
+            elif match["kind"] == "terminology":
+                message = f'Prefer "{terminology.get(match["term"], "")}" over "{match["term"]}"'
+            else:
+                continue
+            sarif_results.append({
+                "ruleId": match["kind"],
+                "level": SARIF_RULES[match["kind"]][0],
+                "message": {"text": message},
+                "locations": [{"physicalLocation": {
+                    "artifactLocation": {"uri": uri},
+                    "region": {"charOffset": match["start"], "charLength": match["end"] - match["start"]},
+                }}],
+            })
+        for violation in result["violations"]:
+            if violation["type"] == "must_avoid":
+                continue
+            sarif_results.append({
+                "ruleId": violation["type"],
+                "level": SARIF_RULES[violation["type"]][0],
+                "message": {"text": violation["message"]},
+                "locations": [{"physicalLocation": {"artifactLocation": {"uri": uri}}}],
+            })
+    
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": "spot-lint",
+                "rules": [
+                    {"id": rule, "shortDescription": {"text": description}, "defaultConfiguration": {"level": level}}
+                    for rule, (level, description) in SARIF_RULES.items()
+                ],
+            }},
+            "invocations": [{
+                "executionSuccessful": not notifications,
+                "toolExecutionNotifications": notifications,
+            }],
+            "results": sarif_results,
+        }],
+    }
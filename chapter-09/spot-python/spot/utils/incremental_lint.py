@@ -0,0 +1,130 @@
+"""Incremental style linting for documents that are checked repeatedly.
+
+Content is split into paragraphs at blank lines. Each paragraph's term
+hits and readability counts are cached under a hash of its text, so
+re-checking a document after an edit only lints the paragraphs that
+changed; the report is re-aggregated from the cached partials. Caches are
+kept per document id, for the most recently used documents.
+
+Terms are matched within paragraphs, so a multi-word term broken across
+a blank line is not reported.
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple
+
+from .readability import ReadabilityStats
+from .style_linter import build_report
+from .term_matcher import TermMatch, TermMatcher, compile_style_pack
+
+
+PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+
+
+@dataclass(frozen=True)
+class ParagraphLint:
+    """Term hits (with offsets relative to the paragraph) and counts of one paragraph."""
+    
+    found: FrozenSet[Tuple[str, str]]
+    matches: Tuple[TermMatch, ...]
+    stats: ReadabilityStats
+
+
+def split_paragraphs(content: str) -> Iterator[Tuple[int, str]]:
+    """Yield (offset, text) for each paragraph, separators excluded."""
+    start = 0
+    for separator in PARAGRAPH_BREAK.finditer(content):
+        if separator.start() > start:
+            yield start, content[start:separator.start()]
+        start = separator.end()
+    if start < len(content):
+        yield start, content[start:]
+
+
+def paragraph_key(text: str) -> str:
+    """Cache key for a paragraph's content."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LintSession:
+    """Cached paragraph results of one document for one style pack."""
+    
+    def __init__(self, matcher: TermMatcher):
+        self.matcher = matcher
+        self.paragraphs: Dict[str, ParagraphLint] = {}
+    
+    def lint(self, content: str) -> Tuple[List[Tuple[int, ParagraphLint]], int]:
+        """Lint a version of the document, reusing unchanged paragraphs.
+        
+        Returns each paragraph's offset and result, and how many
+        paragraphs had to be linted. Paragraphs that are no longer in the
+        document are dropped from the cache.
+        """
+        current: Dict[str, ParagraphLint] = {}
+        parts = []
+        relinted = 0
+        for offset, text in split_paragraphs(content):
+            key = paragraph_key(text)
+            part = current.get(key) or self.paragraphs.get(key)
+            if part is None:
+                matches = tuple(self.matcher.finditer(text))
+                part = ParagraphLint(
+                    found=frozenset((match.kind, match.term) for match in matches),
+                    matches=matches,
+                    stats=ReadabilityStats.from_text(text),
+                )
+                relinted += 1
+            current[key] = part
+            parts.append((offset, part))
+        self.paragraphs = current
+        return parts, relinted
+
+
+class IncrementalLinter:
+    """Per-document incremental linting with an LRU of document sessions.
+    
+    Args:
+        max_documents: Documents whose paragraph caches are kept
+    """
+    
+    def __init__(self, max_documents: int = 256):
+        self.max_documents = max_documents
+        self.sessions: "OrderedDict[str, LintSession]" = OrderedDict()
+    
+    def lint(self, document_id: str, content: str, style_pack: Dict[str, Any]) -> Dict[str, Any]:
+        """Lint the current version of a document.
+        
+        Returns the ``lint_style`` report plus ``incremental`` with the
+        paragraph count and how many paragraphs were re-linted.
+        """
+        matcher = compile_style_pack(style_pack)
+        session = self.sessions.get(document_id)
+        if session is None or session.matcher is not matcher:
+            # New document, or the style pack's terms changed
+            session = LintSession(matcher)
+            self.sessions[document_id] = session
+        self.sessions.move_to_end(document_id)
+        while len(self.sessions) > self.max_documents:
+            self.sessions.popitem(last=False)
+        
+        parts, relinted = session.lint(content)
+        found = set()
+        matches = []
+        stats = ReadabilityStats()
+        for offset, part in parts:
+            found.update(part.found)
+            matches.extend(
+                TermMatch(term, kind, start + offset, end + offset) for term, kind, start, end in part.matches
+            )
+            stats += part.stats
+        
+        report = build_report(style_pack, found, matches, stats)
+        report["incremental"] = {"paragraphs": len(parts), "relinted": relinted}
+        return report
+    
+    def forget(self, document_id: str) -> None:
+        """Drop a document's cached paragraphs."""
+        self.sessions.pop(document_id, None)
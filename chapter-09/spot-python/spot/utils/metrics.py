@@ -0,0 +1,98 @@
+"""Prometheus metrics for SPOT."""
+
+from typing import Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+
+HEDGES_FIRED = Counter(
+    "spot_provider_hedges_fired_total",
+    "Hedged requests started against a provider",
+    ["provider"],
+)
+HEDGES_WON = Counter(
+    "spot_provider_hedges_won_total",
+    "Hedged requests that answered before the request they hedged",
+    ["provider"],
+)
+
+CONCURRENCY_LIMIT = Gauge(
+    "spot_provider_concurrency_limit",
+    "Current adaptive concurrency limit",
+    ["provider"],
+)
+CONCURRENCY_IN_FLIGHT = Gauge(
+    "spot_provider_in_flight",
+    "Provider calls currently in flight",
+    ["provider"],
+)
+CONCURRENCY_QUEUE_WAIT = Histogram(
+    "spot_provider_queue_wait_seconds",
+    "Time spent waiting for a provider concurrency slot",
+    ["provider"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+RATE_LIMIT_WAIT = Histogram(
+    "spot_provider_rate_limit_wait_seconds",
+    "Time spent pacing calls to stay under provider RPM/TPM quotas",
+    buckets=(0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+PROVIDER_HEALTHY = Gauge(
+    "spot_provider_healthy",
+    "Last known provider health (1 healthy, 0 unhealthy)",
+    ["provider"],
+)
+
+HTTP_POOL_CONNECTIONS = Gauge(
+    "spot_http_pool_connections",
+    "Pooled HTTP connections per upstream",
+    ["upstream", "state"],
+)
+
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    "spot_executor_queue_depth",
+    "Blocking SDK calls waiting for a worker thread",
+    ["executor"],
+)
+EXECUTOR_QUEUE_WAIT = Histogram(
+    "spot_executor_queue_wait_seconds",
+    "Time blocking SDK calls waited for a worker thread",
+    ["executor"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+PROMPT_TOKENS_CACHED = Counter(
+    "spot_provider_prompt_tokens_cached_total",
+    "Prompt tokens served from the provider's prompt cache",
+    ["provider"],
+)
+
+OUTPUT_VALIDATIONS = Counter(
+    "spot_output_validations_total",
+    "Generated outputs checked against their template's output_schema",
+    ["template", "result"],
+)
+
+TEMPLATE_CACHE_LOOKUPS = Counter(
+    "spot_template_cache_lookups_total",
+    "Template loads by outcome (hit, miss, reload)",
+    ["result"],
+)
+
+STREAMS_STOPPED = Counter(
+    "spot_provider_streams_stopped_total",
+    "Streams stopped before the provider finished, by reason (complete, invalid)",
+    ["provider", "reason"],
+)
+
+REQUESTS_COALESCED = Counter(
+    "spot_provider_requests_coalesced_total",
+    "Generation requests served by joining an identical in-flight request",
+)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render all metrics in the Prometheus text format."""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,124 @@
+"""Readability statistics from a single tokenization pass.
+
+The text is split once into words and sentence-ending punctuation.
+Syllables are counted once per distinct word (natural text repeats the
+same few thousand words) with a bounded cache. Every score is computed
+from the resulting counts. ``ReadabilityStats`` can be added together, so
+counts for parts of a document combine into the counts for the whole.
+"""
+
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict
+
+
+TOKEN_PATTERN = re.compile(r"\w+|[.!?]+")
+LETTERS_PATTERN = re.compile(r"[a-z]+")
+SILENT_ENDING = re.compile(r"(?:[^laeiouy]es|ed|[^laeiouy]e)$")
+VOWEL_GROUPS = re.compile(r"[aeiouy]{1,2}")
+
+
+@lru_cache(maxsize=65536)
+def word_syllables(word: str) -> int:
+    """Estimate the syllables in one word (cached per distinct word).
+    
+    Counts vowel groups after dropping common silent endings, at least one
+    per run of ASCII letters.
+    """
+    count = 0
+    for letters in LETTERS_PATTERN.findall(word.lower()):
+        letters = SILENT_ENDING.sub("", letters)
+        if letters.startswith("y"):
+            letters = letters[1:]
+        count += len(VOWEL_GROUPS.findall(letters)) or 1
+    return count
+
+
+@dataclass
+class ReadabilityStats:
+    """Counts behind the readability scores of a text."""
+    
+    sentences: int = 0
+    words: int = 0
+    syllables: int = 0
+    letters: int = 0
+    polysyllables: int = 0
+    
+    @classmethod
+    def from_text(cls, text: str) -> "ReadabilityStats":
+        """Count sentences, words, syllables and letters in one pass."""
+        tokens = Counter(TOKEN_PATTERN.findall(text))
+        stats = cls()
+        for token, count in tokens.items():
+            if token[0] in ".!?":
+                stats.sentences += count
+                continue
+            syllables = word_syllables(token)
+            stats.words += count
+            stats.syllables += syllables * count
+            stats.letters += len(token) * count
+            if syllables >= 3:
+                stats.polysyllables += count
+        return stats
+    
+    def __add__(self, other: "ReadabilityStats") -> "ReadabilityStats":
+        return ReadabilityStats(
+            sentences=self.sentences + other.sentences,
+            words=self.words + other.words,
+            syllables=self.syllables + other.syllables,
+            letters=self.letters + other.letters,
+            polysyllables=self.polysyllables + other.polysyllables,
+        )
+    
+    def __sub__(self, other: "ReadabilityStats") -> "ReadabilityStats":
+        return ReadabilityStats(
+            sentences=self.sentences - other.sentences,
+            words=self.words - other.words,
+            syllables=self.syllables - other.syllables,
+            letters=self.letters - other.letters,
+            polysyllables=self.polysyllables - other.polysyllables,
+        )
+    
+    def flesch_kincaid_grade(self) -> float:
+        """Flesch-Kincaid Grade Level (never below 0)."""
+        sentences, words = max(1, self.sentences), max(1, self.words)
+        grade = 0.39 * (words / sentences) + 11.8 * (self.syllables / words) - 15.59
+        return max(0.0, round(grade, 1))
+    
+    def flesch_reading_ease(self) -> float:
+        """Flesch Reading Ease (higher is easier, roughly 0-100)."""
+        sentences, words = max(1, self.sentences), max(1, self.words)
+        return round(206.835 - 1.015 * (words / sentences) - 84.6 * (self.syllables / words), 1)
+    
+    def gunning_fog(self) -> float:
+        """Gunning Fog index."""
+        sentences, words = max(1, self.sentences), max(1, self.words)
+        return round(0.4 * (words / sentences + 100 * self.polysyllables / words), 1)
+    
+    def smog_index(self) -> float:
+        """SMOG grade."""
+        sentences = max(1, self.sentences)
+        return round(1.043 * (self.polysyllables * 30 / sentences) ** 0.5 + 3.1291, 1)
+    
+    def coleman_liau_index(self) -> float:
+        """Coleman-Liau index."""
+        words = max(1, self.words)
+        letters_per_100 = self.letters / words * 100
+        sentences_per_100 = max(1, self.sentences) / words * 100
+        return round(0.0588 * letters_per_100 - 0.296 * sentences_per_100 - 15.8, 1)
+    
+    def scores(self) -> Dict[str, float]:
+        """All readability scores."""
+        return {
+            "flesch_kincaid_grade": self.flesch_kincaid_grade(),
+            "flesch_reading_ease": self.flesch_reading_ease(),
+            "gunning_fog": self.gunning_fog(),
+            "smog_index": self.smog_index(),
+            "coleman_liau_index": self.coleman_liau_index(),
+        }
+    
+    def to_dict(self) -> Dict[str, int]:
+        """The raw counts."""
+        return asdict(self)
@@ -0,0 +1,131 @@
+"""Memory-bounded style linting of very large files.
+
+The file is read in chunks through Python's incremental UTF-8 decoder, so
+a multi-byte character split across reads is never broken. Each chunk is
+scanned together with the unfinished tail of the previous one. The tail
+starts at a whitespace boundary and holds as many whitespace-separated
+pieces as the longest term, so every term that starts before the cut also
+ends inside the scanned text. No word or sentence mark straddles the cut
+either, so the running readability counts add up to a whole-file lint.
+Text with too little whitespace for that (minified or binary-like data) is
+cut so the tail holds just over the longest term; such a cut may split a
+word, which then counts as two for readability. Memory use depends on the
+chunk size, not on the file size.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .readability import ReadabilityStats
+from .style_linter import build_report
+from .term_matcher import TermMatch, compile_style_pack
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # characters
+STREAM_THRESHOLD = 8 << 20  # bytes; larger files are linted in chunks
+DEFAULT_MAX_MATCHES = 1000
+SEGMENT_START = re.compile(r"(?<!\S)\S")
+
+
+class StreamingLinter:
+    """Lints text fed in pieces; ``finish`` returns the ``lint_style`` report.
+    
+    Args:
+        style_pack: Style pack configuration
+        max_matches: Term occurrences kept in the report's ``matches``
+            (``matches_truncated`` is set when more were found); None keeps all
+    """
+    
+    def __init__(self, style_pack: Dict[str, Any], max_matches: Optional[int] = DEFAULT_MAX_MATCHES):
+        self.style_pack = style_pack
+        self.max_matches = max_matches
+        self.matcher = compile_style_pack(style_pack)
+        self.segments = max((term.count(" ") + 1 for term in self.matcher.kinds), default=1)
+        self.max_term_length = max((len(term) for term in self.matcher.kinds), default=0)
+        self.stats = ReadabilityStats()
+        self.found = set()
+        self.matches: List[TermMatch] = []
+        self.truncated = False
+        self.offset = 0
+        self._tail = ""
+        self._before = ""
+    
+    def feed(self, text: str) -> None:
+        """Lint the next piece of the document."""
+        buffer = self._tail + text
+        cut = self._cut(buffer)
+        self._lint(buffer, cut)
+        self._tail = buffer[cut:]
+    
+    def finish(self) -> Dict[str, Any]:
+        """Lint what is left and build the report."""
+        self._lint(self._tail, len(self._tail))
+        self._tail = ""
+        
+        report = build_report(self.style_pack, self.found, self.matches, self.stats)
+        if self.truncated:
+            report["matches_truncated"] = True
+        return report
+    
+    def _cut(self, buffer: str) -> int:
+        """Where the finished part of ``buffer`` ends.
+        
+        The last ``segments`` whitespace-separated pieces are held back
+        (the last one may be cut mid-word), so any term starting before the
+        cut ends, followed by its boundary character, inside ``buffer``.
+        Without enough whitespace, only ``max_term_length + 1`` characters
+        are held back, so the tail stays bounded.
+        """
+        window = 256
+        while True:
+            start = max(0, len(buffer) - window)
+            starts = [match.start() for match in SEGMENT_START.finditer(buffer, start)]
+            if len(starts) >= self.segments:
+                return starts[-self.segments]
+            if start == 0:
+                return max(0, len(buffer) - self.max_term_length - 1)
+            window *= 4
+    
+    def _lint(self, buffer: str, cut: int) -> None:
+        """Count the terms starting, and the words, before ``cut``."""
+        if not cut:
+            return
+        end = self.offset + cut
+        # After a cut inside a word, a hit at the start of the buffer is not
+        # a whole word
+        mid_word = bool(re.match(r"\w", self._before))
+        for match in self.matcher.finditer(buffer, self.offset):
+            if match.start >= end:
+                break
+            if mid_word and match.start == self.offset:
+                continue
+            self.found.add((match.kind, match.term))
+            if self.max_matches is None or len(self.matches) < self.max_matches:
+                self.matches.append(match)
+            else:
+                self.truncated = True
+        self.stats += ReadabilityStats.from_text(buffer[:cut])
+        self.offset = end
+        self._before = buffer[cut - 1]
+
+
+def lint_file_streaming(
+    path: Union[str, Path],
+    style_pack: Dict[str, Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_matches: Optional[int] = DEFAULT_MAX_MATCHES
+) -> Dict[str, Any]:
+    """Lint a file of any size in bounded memory.
+    
+    Returns the same report as ``lint_style`` on the whole file, except
+    that ``matches`` is capped at ``max_matches``.
+    """
+    linter = StreamingLinter(style_pack, max_matches=max_matches)
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            linter.feed(chunk)
+    return linter.finish()
@@ -2,48 +2,145 @@
 
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Set, Tuple
 import json
 
+from .readability import ReadabilityStats, word_syllables
+from .term_matcher import TermMatch, compile_style_pack
+
 
 def lint_style(text: str, style_pack: Dict[str, Any]) -> Dict[str, Any]:
     """Lint text against style pack rules.
     
     Args:
         text: Content to analyze
-        style_pack: Style pack configuration with must_use, must_avoid, reading_level
+        style_pack: Style pack configuration with must_use, must_avoid,
+            terminology, reading_level
         
     Returns:
-        Dictionary with linting results including violations and compliance
+        Dictionary with linting results including violations and compliance.
+        Terms match whole words only; ``matches`` lists every term
+        occurrence with its character offsets.
+    """
+    # Term Detection (one pass for every banned, required and terminology term)
+    matches = compile_style_pack(style_pack).find_all(text)
+    found = {(match.kind, match.term) for match in matches}
+    
+    # Reading Level Calculation
+    stats = ReadabilityStats.from_text(text)
+    
+    return build_report(style_pack, found, matches, stats)
+
+
+def build_report(
+    style_pack: Dict[str, Any],
+    found: Set[Tuple[str, str]],
+    matches: List[TermMatch],
+    stats: ReadabilityStats
+) -> Dict[str, Any]:
+    """Assemble a lint report from term hits and readability counts.
+    
+    Args:
+        style_pack: Style pack configuration
+        found: (kind, term) pairs that occur in the content
+        matches: Term occurrences to list in the report
+        stats: Readability counts of the content
+    
+    Returns:
+        Report in the format of lint_style()
     """
     report = {
         "banned": [],
         "missing_required": [],
+        "terminology": [],
+        "matches": [match.to_dict() for match in matches],
         "reading_level_ok": True,
         "reading_level": None,
     }
-
+    
     # Banned Terms Detection
     banned = style_pack.get("must_avoid", [])
-    lower_text = text.lower()
-    for term in banned:
-        if term.lower() in lower_text:
-            report["banned"].append(term)
-
+    report["banned"] = [term for term in banned if ("must_avoid", term) in found]
+    
     # Required Terms Validation
     required = style_pack.get("must_use", [])
-    for term in required:
-        if term.lower() not in lower_text:
-            report["missing_required"].append(term)
-
+    report["missing_required"] = [term for term in required if ("must_use", term) not in found]
+    
+    # Preferred Terminology
+    terminology = style_pack.get("terminology", {})
+    report["terminology"] = [
+        {"term": term, "preferred": preferred}
+        for term, preferred in terminology.items()
+        if ("terminology", term) in found
+    ]
+    
     # Reading Level Calculation
-    report["reading_level"] = flesch_kincaid_grade(text)
+    report["reading_level"] = stats.flesch_kincaid_grade()
+    report["readability"] = stats.scores()
     min_level, max_level = parse_reading_band(style_pack.get("reading_level", "Grade 8-10"))
     report["reading_level_ok"] = min_level <= report["reading_level"] <= max_level
-
+    
     return report
 
 
+def style_violations(report: Dict[str, Any], style_pack: Dict[str, Any]) -> List[Dict[str, str]]:
+    """List the violations in a lint report.
+    
+    Args:
+        report: Style linting report from lint_style()
+        style_pack: Style pack configuration the report was made with
+    
+    Returns:
+        Violations with type (must_avoid, must_use, reading_level), term and message
+    """
+    violations = []
+    
+    # Add banned term violations
+    for term in report.get("banned", []):
+        violations.append({
+            "type": "must_avoid",
+            "term": term,
+            "message": f'Content contains prohibited term: "{term}"'
+        })
+    
+    # Add missing required term violations
+    for term in report.get("missing_required", []):
+        violations.append({
+            "type": "must_use",
+            "term": term,
+            "message": f'Content missing required term: "{term}"'
+        })
+    
+    # Add reading level violation
+    if not report.get("reading_level_ok", True):
+        violations.append({
+            "type": "reading_level",
+            "term": f"Grade {report['reading_level']}",
+            "message": f"Reading level {report['reading_level']} outside target range: {style_pack.get('reading_level', 'Grade 8-10')}"
+        })
+    
+    return violations
+
+
+def style_result(report: Dict[str, Any], style_pack: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a lint report as violations, compliance and score.
+    
+    Args:
+        report: Style linting report from lint_style()
+        style_pack: Style pack configuration the report was made with
+    
+    Returns:
+        Dictionary with violations, compliant, score and the report
+    """
+    violations = style_violations(report, style_pack)
+    return {
+        "violations": violations,
+        "compliant": len(violations) == 0,
+        "score": calculate_style_score(report),
+        "report": report,
+    }
+
+
 def flesch_kincaid_grade(text: str) -> float:
     """Calculate Flesch-Kincaid Grade Level.
     
@@ -53,12 +150,7 @@ def flesch_kincaid_grade(text: str) -> float:
     Returns:
         Reading level as a float (e.g., 8.2 for 8th grade, 2nd month)
     """
-    sentences = max(1, len(re.findall(r'[.!?]+', text)))
-    words = max(1, len(re.findall(r'\b\w+\b', text)))
-    syllables = count_syllables(text)
-    
-    grade = 0.39 * (words / sentences) + 11.8 * (syllables / words) - 15.59
-    return max(0.0, round(grade, 1))
+    return ReadabilityStats.from_text(text).flesch_kincaid_grade()
 
 
 def count_syllables(text: str) -> int:
@@ -70,19 +162,7 @@ def count_syllables(text: str) -> int:
     Returns:
         Estimated syllable count
     """
-    words = re.findall(r'[a-z]+', text.lower())
-    count = 0
-    
-    for word in words:
-        # Remove common silent endings
-        syllable_word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
-        syllable_word = re.sub(r'^y', '', syllable_word)
-        
-        # Count vowel groups
-        vowel_matches = re.findall(r'[aeiouy]{1,2}', syllable_word)
-        count += len(vowel_matches) if vowel_matches else 1
-    
-    return count
+    return sum(word_syllables(word) for word in re.findall(r'[a-z]+', text.lower()))
 
 
 def parse_reading_band(band: str) -> Tuple[int, int]:
@@ -167,6 +247,12 @@ def format_style_report(report: Dict[str, Any], style_pack: Dict[str, Any], file
     elif required_terms:
         lines.append("✅ All required terms present")
     
+    # Preferred terminology
+    terminology = report.get("terminology", [])
+    if terminology:
+        suggestions = ", ".join(f"{item['term']} → {item['preferred']}" for item in terminology)
+        lines.append(f"💡 Preferred terminology: {suggestions}")
+    
     return "\n".join(lines)
 
 
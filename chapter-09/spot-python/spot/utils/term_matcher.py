@@ -0,0 +1,154 @@
+"""Single-pass matching of style pack terms.
+
+A style pack's ``must_avoid``, ``must_use`` and ``terminology`` terms are
+compiled once into one automaton: a regular expression shaped like a trie
+of all the terms, so at each word start the regex engine follows one path
+through the trie instead of trying every term. One scan of the text finds
+every hit, with its offsets, and the scan time barely grows with the
+number of terms. Terms only match whole words ("just" does not match
+"adjust"), case-insensitively, and a space in a term matches any run of
+whitespace.
+
+The word-start check runs at every character, so for a small pack like
+the shipped one a scan costs several times more than a bare substring
+test per term; ``scripts/bench_lint.py`` shows where the two cross.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+
+TERM_KINDS = ("must_avoid", "must_use", "terminology")
+
+
+class TermMatch(NamedTuple):
+    """One occurrence of a style pack term."""
+    
+    term: str
+    kind: str
+    start: int
+    end: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"term": self.term, "kind": self.kind, "start": self.start, "end": self.end}
+
+
+def normalize_term(term: str) -> str:
+    """Lowercase a term and collapse its whitespace."""
+    return " ".join(term.lower().split())
+
+
+def _char_pattern(char: str) -> str:
+    return r"\s+" if char == " " else re.escape(char)
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Regex alternation of terms, factored into a trie.
+    
+    Longer continuations are tried first, so the longest term starting at
+    a position wins.
+    """
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [_char_pattern(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return build(trie)
+
+
+class TermMatcher:
+    """Finds style pack terms in text in one pass.
+    
+    Args:
+        terms: Terms to find, by kind (``must_avoid``, ``must_use``,
+            ``terminology``); a term may appear under several kinds
+    """
+    
+    def __init__(self, terms: Dict[str, Iterable[str]]):
+        self.kinds: Dict[str, List[Tuple[str, str]]] = {}
+        for kind, kind_terms in terms.items():
+            for term in kind_terms:
+                normalized = normalize_term(term)
+                if normalized:
+                    self.kinds.setdefault(normalized, []).append((kind, term))
+        
+        # Hits are found with a zero-width lookahead so a match inside a
+        # longer one (a term starting mid-phrase) is still found.
+        self.pattern = re.compile(r"(?<!\w)(?=(" + _trie_pattern(self.kinds) + r")(?!\w))") if self.kinds else None
+        self.ignore_case_pattern = None
+        
+        # Shorter terms that a longer term starts with, ending at a word boundary
+        # ("crazy" in "crazy idea"): the longest match hides them at that position.
+        self.prefixes: Dict[str, List[str]] = {}
+        for normalized in self.kinds:
+            for index, char in enumerate(normalized):
+                if not re.match(r"\w", char) and normalized[:index] in self.kinds:
+                    self.prefixes.setdefault(normalized, []).append(normalized[:index])
+        self._term_patterns: Dict[str, re.Pattern] = {}
+    
+    def finditer(self, text: str, offset: int = 0) -> Iterator[TermMatch]:
+        """Yield every term occurrence in order of position.
+        
+        ``offset`` is added to the reported positions, for scanning part
+        of a larger document.
+        """
+        if self.pattern is None:
+            return
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            pattern, source = self.pattern, lowered
+        else:
+            # Lowercasing changed the length (rare non-ASCII letters), so
+            # offsets would not line up: match case-insensitively instead
+            if self.ignore_case_pattern is None:
+                self.ignore_case_pattern = re.compile(self.pattern.pattern, re.IGNORECASE)
+            pattern, source = self.ignore_case_pattern, text
+        
+        kinds = self.kinds
+        for match in pattern.finditer(source):
+            start = match.start()
+            found = match.group(1)
+            normalized = found if found in kinds else normalize_term(found)
+            for kind, term in kinds[normalized]:
+                yield TermMatch(term, kind, start + offset, match.end(1) + offset)
+            for prefix in self.prefixes.get(normalized, ()):
+                end = self._term_pattern(prefix).match(source, start).end()
+                for kind, term in self.kinds[prefix]:
+                    yield TermMatch(term, kind, start + offset, end + offset)
+    
+    def find_all(self, text: str) -> List[TermMatch]:
+        """Return every term occurrence in order of position."""
+        return list(self.finditer(text))
+    
+    def _term_pattern(self, normalized: str) -> re.Pattern:
+        pattern = self._term_patterns.get(normalized)
+        if pattern is None:
+            pattern = re.compile("".join(_char_pattern(char) for char in normalized), re.IGNORECASE)
+            self._term_patterns[normalized] = pattern
+        return pattern
+
+
+@lru_cache(maxsize=32)
+def _compile(key: str) -> TermMatcher:
+    return TermMatcher(json.loads(key))
+
+
+def compile_style_pack(style_pack: Dict[str, Any]) -> TermMatcher:
+    """Get the term matcher for a style pack, compiling it on first use.
+    
+    Matchers are cached by the style pack's term lists, so a reloaded but
+    unchanged style pack reuses its matcher.
+    """
+    terms = {kind: list(style_pack.get(kind) or []) for kind in TERM_KINDS}
+    return _compile(json.dumps(terms, sort_keys=True))
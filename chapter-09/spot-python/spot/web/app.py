@@ -1,15 +1,20 @@
 """FastAPI web application for SPOT."""
 
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 import asyncio
+import json
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse
+import anyio
+from fastapi import FastAPI, Header, HTTPException, BackgroundTasks, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import List
 
 from ..core.spot import SPOT
 from ..core.config import Config
+from ..providers.deadline import Deadline, DeadlineExceededError
+from ..utils.metrics import render_metrics
 
 
 class GenerateRequest(BaseModel):
@@ -43,6 +48,16 @@ class GenerateRequest(BaseModel):
         description="Generation temperature (0.0-1.0)",
         example=0.7
     )
+    no_cache: bool = Field(
+        default=False,
+        description="Bypass the response cache",
+        example=False
+    )
+    refresh_cache: bool = Field(
+        default=False,
+        description="Regenerate and overwrite the cached response",
+        example=False
+    )
 
 
 class GenerateResponse(BaseModel):
@@ -54,6 +69,12 @@ class GenerateResponse(BaseModel):
         description="Token usage statistics",
         example={"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
     )
+    cached: bool = Field(default=False, description="Whether the response came from the cache", example=False)
+    validation: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Output check against the template's output_schema, if it has one",
+        example={"valid": True, "errors": []}
+    )
 
 
 class HealthResponse(BaseModel):
@@ -63,6 +84,11 @@ class HealthResponse(BaseModel):
         description="Provider availability",
         example={"mock": True, "openai": False}
     )
+    circuit_breakers: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Circuit breaker state per provider",
+        example={"openai": {"state": "open", "failures": 5, "rejected": 12, "retry_in": 18.5, "last_error": "timeout"}}
+    )
     templates_available: bool = Field(description="Template availability", example=True)
     config: Dict[str, Any] = Field(
         description="Current configuration",
@@ -87,6 +113,11 @@ class StyleCheckRequest(BaseModel):
         description="Content to check for style compliance",
         example="This revolutionary AI solution will disrupt the market..."
     )
+    document_id: Optional[str] = Field(
+        default=None,
+        description="Document identifier; repeated checks of the same document only re-lint changed paragraphs",
+        example="drafts/launch-post.md"
+    )
 
 
 class StyleViolation(BaseModel):
@@ -105,18 +136,80 @@ class StyleCheckResponse(BaseModel):
     stylepack: Dict[str, Any] = Field(description="Style pack rules used")
 
 
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class ClientDisconnected(Exception):
+    """Raised when the HTTP client goes away before its response is ready."""
+    pass
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """Return once the client has disconnected.
+    
+    Only valid after the request body has been read.
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Any) -> Any:
+    """Await ``awaitable``, cancelling it if the client disconnects first."""
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        disconnected = not task.done()
+        if disconnected:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    if disconnected:
+        raise ClientDisconnected()
+    return task.result()
+
+
+async def aclose_shielded(stream: Any) -> None:
+    """Close an async generator, even while the calling task is being cancelled.
+    
+    On a client disconnect the response task is cancelled; without the
+    shield that cancellation could interrupt the close and leave the
+    upstream provider stream open.
+    """
+    with anyio.CancelScope(shield=True):
+        await stream.aclose()
+
+
 def create_app(config: Config) -> FastAPI:
     """Create FastAPI application."""
     
+    # Initialize SPOT
+    spot = SPOT(config)
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Warm provider connections and run the health monitor for the app's lifetime."""
+        await spot.provider_manager.warm_up()
+        spot.provider_manager.health_monitor.start()
+        if config.templates.watch:
+            spot.template_manager.start_watching()
+        yield
+        await spot.template_manager.stop_watching()
+        await spot.provider_manager.health_monitor.stop()
+        await spot.provider_manager.aclose()
+    
     app = FastAPI(
         title="SPOT API",
         description="Structured Prompt Output Toolkit - AI-Powered Content Generation",
         version="1.0.0",
+        lifespan=lifespan,
     )
     
-    # Initialize SPOT
-    spot = SPOT(config)
-    
     @app.get("/", response_class=HTMLResponse)
     async def root():
         """Root endpoint with basic info."""
@@ -144,6 +237,9 @@ def create_app(config: Config) -> FastAPI:
                     <div class="endpoint">
                         <strong>POST /generate</strong> - Generate content using templates
                     </div>
+                    <div class="endpoint">
+                        <strong>POST /generate/stream</strong> - Stream generated content (Server-Sent Events)
+                    </div>
                     <div class="endpoint">
                         <strong>POST /evaluate</strong> - Run evaluation tests
                     </div>
@@ -153,6 +249,12 @@ def create_app(config: Config) -> FastAPI:
                     <div class="endpoint">
                         <strong>GET /providers</strong> - List available providers
                     </div>
+                    <div class="endpoint">
+                        <strong>GET /cache</strong> - Response cache statistics
+                    </div>
+                    <div class="endpoint">
+                        <strong>GET /metrics</strong> - Prometheus metrics
+                    </div>
                 </div>
                 
                 <div class="section">
@@ -182,32 +284,100 @@ def create_app(config: Config) -> FastAPI:
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.post("/generate", response_model=GenerateResponse)
-    async def generate_content(request: GenerateRequest):
-        """Generate content using a template."""
+    async def generate_content(
+        request: GenerateRequest,
+        http_request: Request,
+        request_timeout: Optional[float] = Header(
+            default=None,
+            alias="X-Request-Timeout",
+            description="Seconds the caller will wait; defaults to REQUEST_TIMEOUT",
+        ),
+    ):
+        """Generate content using a template.
+        
+        The provider call is cancelled if the client disconnects, and no
+        attempt runs past the request deadline.
+        """
+        deadline = Deadline.resolve(request_timeout, config.deadline)
         try:
             kwargs = {}
             if request.max_tokens:
                 kwargs['max_tokens'] = request.max_tokens
-            if request.temperature:
+            if request.temperature is not None:
                 kwargs['temperature'] = request.temperature
             
-            result = await spot.generate(
+            result = await cancel_on_disconnect(http_request, spot.generate(
                 template=request.template,
                 input_data=request.input_data,
                 provider=request.provider,
+                use_cache=not request.no_cache,
+                refresh_cache=request.refresh_cache,
+                deadline=deadline,
                 **kwargs
-            )
+            ))
             
             return GenerateResponse(
                 content=result["content"],
                 provider=result["provider"],
                 model=result["model"],
-                usage=result["usage"]
+                usage=result["usage"],
+                cached=result.get("cached", False),
+                validation=result.get("validation")
             )
         
+        except ClientDisconnected:
+            # Nobody is listening; 499 is the conventional "client closed request"
+            return Response(status_code=499)
+        except DeadlineExceededError as e:
+            raise HTTPException(status_code=504, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
     
+    @app.post("/generate/stream")
+    async def stream_content(request: GenerateRequest):
+        """Stream generated content as Server-Sent Events.
+        
+        Sends ``delta`` events with text as it arrives and a final ``done``
+        event with usage and timings, or an ``error`` event if the stream fails
+        (including when it is aborted because the output cannot match the
+        template's ``output_schema``).
+        """
+        kwargs = {}
+        if request.max_tokens:
+            kwargs['max_tokens'] = request.max_tokens
+        if request.temperature is not None:
+            kwargs['temperature'] = request.temperature
+        
+        events = spot.stream_generate(
+            template=request.template,
+            input_data=request.input_data,
+            provider=request.provider,
+            **kwargs
+        )
+        
+        # Wait for the first event so setup and provider errors still get a 400
+        try:
+            first = await events.__anext__()
+        except Exception as e:
+            await aclose_shielded(events)
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        async def event_source() -> AsyncIterator[str]:
+            try:
+                yield format_sse(first["type"], first)
+                async for event in events:
+                    yield format_sse(event["type"], event)
+            except Exception as e:
+                yield format_sse("error", {"type": "error", "detail": str(e)})
+            finally:
+                await aclose_shielded(events)
+        
+        return StreamingResponse(
+            event_source(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
     @app.post("/evaluate", response_model=EvaluationResponse)
     async def run_evaluation(
         template: Optional[str] = None,
@@ -239,11 +409,37 @@ def create_app(config: Config) -> FastAPI:
             return {
                 "providers": providers,
                 "health": health_status,
+                "health_details": spot.provider_manager.get_health_details(),
+                "circuit_breakers": spot.provider_manager.get_provider_status(),
+                "scores": spot.provider_manager.get_provider_scores(),
+                "concurrency": spot.provider_manager.get_concurrency_status(),
+                "rate_limits": spot.provider_manager.get_rate_limit_status(),
+                "retry_budget": spot.provider_manager.get_retry_status(),
+                "hedging": spot.provider_manager.get_hedging_stats(),
+                "coalescing": spot.provider_manager.get_coalescing_stats(),
+                "semantic_cache": spot.provider_manager.get_semantic_cache_stats(),
+                "transport": spot.provider_manager.get_transport_status(),
+                "executors": spot.provider_manager.get_executor_status(),
                 "current": config.provider
             }
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
+    @app.get("/cache")
+    async def cache_status():
+        """Get response and template cache statistics."""
+        return {**spot.response_cache.snapshot(), "templates": spot.template_manager.snapshot()}
+    
+    @app.get("/metrics")
+    async def metrics():
+        """Expose Prometheus metrics."""
+        if not config.metrics.enabled:
+            raise HTTPException(status_code=404, detail="Metrics are disabled")
+        # Refresh connection pool gauges before rendering
+        spot.provider_manager.get_transport_status()
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+    
     @app.get("/templates")
     async def list_templates():
         """List available templates with example usage."""
@@ -330,7 +526,7 @@ def create_app(config: Config) -> FastAPI:
     async def check_style(request: StyleCheckRequest):
         """Check content against style pack rules."""
         try:
-            result = await spot.check_style(request.content)
+            result = await spot.check_style(request.content, document_id=request.document_id)
             
             # Convert violations to the response format
             violations = [
@@ -8,7 +8,7 @@ from spot.core.config import Config, set_config
 
 
 @pytest.fixture
-def test_config():
+def test_config(tmp_path):
     """Create test configuration."""
     config = Config(
         environment="test",
@@ -16,6 +16,7 @@ def test_config():
         provider="mock",
         dev_mock_providers=True,
         dev_skip_health_checks=True,
+        cache_path=str(tmp_path / "responses.sqlite3"),
     )
     set_config(config)
     return config
@@ -0,0 +1,76 @@
+"""Test batch linting of many files."""
+
+import json
+
+from click.testing import CliRunner
+
+from spot.cli import cli
+from spot.utils.batch_lint import balance_chunks, collect_paths, lint_paths, sarif_report
+from spot.utils.style_linter import load_style_pack
+
+
+GOOD = (
+    "Our accessible tools help everyone, including all users and people with disabilities. "
+    "The inclusive design keeps each page plain to read for many kinds of readers.\n"
+)
+BAD = "Just a revolutionary idea.\n"
+
+
+def write_docs(root):
+    """Create a small content tree with one compliant and two failing files."""
+    (root / "guides").mkdir()
+    (root / ".git").mkdir()
+    (root / "good.md").write_text(GOOD, encoding="utf-8")
+    (root / "guides" / "bad.md").write_text(BAD, encoding="utf-8")
+    (root / "guides" / "worse.txt").write_text(BAD * 50, encoding="utf-8")
+    (root / "guides" / "notes.json").write_text("{}", encoding="utf-8")
+    (root / ".git" / "ignored.md").write_text(BAD, encoding="utf-8")
+
+
+class TestBatchLint:
+    """Test file collection, chunking and parallel linting."""
+    
+    def test_collects_directories_and_globs(self, tmp_path):
+        """Test that directories are walked and globs expanded, skipping hidden dirs."""
+        write_docs(tmp_path)
+        
+        files, unmatched = collect_paths([str(tmp_path), str(tmp_path / "**" / "*.md"), str(tmp_path / "nope*")])
+        
+        assert [path.relative_to(tmp_path).as_posix() for path in files] == [
+            "good.md", "guides/bad.md", "guides/worse.txt",
+        ]
+        assert unmatched == [str(tmp_path / "nope*")]
+        chunks = balance_chunks(files, 2)
+        assert sorted(len(chunk) for chunk in chunks) == [1, 2]
+        assert chunks[0] == [tmp_path / "guides" / "worse.txt"]
+    
+    def test_parallel_results_match_serial(self, tmp_path):
+        """Test that linting in worker processes gives the same results as in-process."""
+        write_docs(tmp_path)
+        files, _ = collect_paths([str(tmp_path)])
+        style_pack = load_style_pack()
+        
+        parallel = sorted(lint_paths(files, style_pack, workers=2), key=lambda result: result["file_path"])
+        serial = list(lint_paths(files, style_pack, workers=1))
+        
+        assert parallel == serial
+        assert [result["compliant"] for result in serial] == [True, False, False]
+        sarif = sarif_report(serial, style_pack)
+        regions = [
+            result["locations"][0]["physicalLocation"].get("region")
+            for result in sarif["runs"][0]["results"] if result["ruleId"] == "must_avoid"
+        ]
+        assert regions[:2] == [{"charOffset": 0, "charLength": 4}, {"charOffset": 7, "charLength": 13}]
+    
+    def test_cli_exit_codes(self, tmp_path):
+        """Test that the lint command aggregates exit codes and streams JSONL."""
+        write_docs(tmp_path)
+        runner = CliRunner()
+        
+        assert runner.invoke(cli, ["lint", str(tmp_path / "good.md")]).exit_code == 0
+        result = runner.invoke(cli, ["lint", str(tmp_path), "--format", "jsonl", "--workers", "1"])
+        assert result.exit_code == 1
+        assert len([json.loads(line) for line in result.output.splitlines()]) == 3
+        (tmp_path / "broken.md").write_bytes(b"\xff\xfe")
+        assert runner.invoke(cli, ["lint", str(tmp_path), "--format", "sarif"]).exit_code == 2
+        assert runner.invoke(cli, ["lint", str(tmp_path / "missing")]).exit_code == 2
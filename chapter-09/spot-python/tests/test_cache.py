@@ -0,0 +1,57 @@
+"""Test the response cache."""
+
+import pytest
+
+from spot.core.cache import MemoryCache, ResponseCache, cache_key
+from spot.core.config import CacheConfig
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """Test cache tiers and keys."""
+    
+    def test_memory_tier_evicts_lru_and_expires(self):
+        """Test that the memory tier is bounded and honours its TTL."""
+        clock = FakeClock()
+        cache = MemoryCache(max_entries=2, ttl=10, clock=clock)
+        cache.set("a", {"content": "a"})
+        cache.set("b", {"content": "b"})
+        assert cache.get("a") == {"content": "a"}
+        cache.set("c", {"content": "c"})
+        
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        clock.now = 11
+        assert cache.get("a") is None
+        assert len(cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_disk_tier_is_shared_and_promoted(self, tmp_path):
+        """Test that a second cache instance on the same file sees entries."""
+        config = CacheConfig(path=str(tmp_path / "responses.sqlite3"))
+        writer = ResponseCache(config)
+        await writer.set("key", {"content": "hello"})
+        
+        reader = ResponseCache(config)
+        assert await reader.get("key") == ({"content": "hello"}, "disk")
+        assert await reader.get("key") == ({"content": "hello"}, "memory")
+        assert await reader.get("missing") is None
+        assert reader.snapshot()["misses"] == 1
+    
+    def test_key_normalizes_variables(self):
+        """Test that key order and surrounding whitespace do not change the key."""
+        params = {"temperature": 0}
+        first = cache_key("draft_scaffold@1.0.0", {"a": "x ", "b": 1}, {}, "mock", "m", params)
+        second = cache_key("draft_scaffold@1.0.0", {"b": "1", "a": "x"}, {}, "mock", "m", params)
+        other = cache_key("draft_scaffold@1.0.0", {"a": "x", "b": 1}, {"reading_level": 8}, "mock", "m", params)
+        assert first == second
+        assert first != other
@@ -0,0 +1,54 @@
+"""Test CLI startup cost."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Wall-time budget for ``spot --help`` in seconds; override on slow CI machines
+HELP_BUDGET = float(os.environ.get("SPOT_HELP_BUDGET", "1.0"))
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter in the project root."""
+    return subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+
+class TestCLIStartup:
+    """Test that the CLI starts without loading heavy dependencies."""
+    
+    def test_help_within_budget(self):
+        """Test that ``spot --help`` finishes within the wall-time budget."""
+        run_python("-m", "spot.cli", "--help")  # warm the bytecode cache
+        started = time.perf_counter()
+        result = run_python("-m", "spot.cli", "--help")
+        elapsed = time.perf_counter() - started
+        
+        assert "Structured Prompt Output Toolkit" in result.stdout
+        assert elapsed < HELP_BUDGET, f"spot --help took {elapsed:.2f}s (budget {HELP_BUDGET}s)"
+    
+    def test_import_does_not_load_sdks(self):
+        """Test that importing the CLI defers SDKs and the SPOT core."""
+        heavy = ["openai", "anthropic", "google.generativeai", "numpy", "spot.core.spot"]
+        result = run_python(
+            "-c",
+            f"import sys, spot.cli; print([m for m in {heavy!r} if m in sys.modules])",
+        )
+        assert result.stdout.strip() == "[]"
+    
+    def test_style_check_does_not_load_spot_core(self):
+        """Test that ``spot style-check`` lints without building SPOT."""
+        heavy = ["openai", "anthropic", "google.generativeai", "numpy", "spot.core.spot"]
+        result = run_python(
+            "-c",
+            "import sys, spot.cli; "
+            "spot.cli.cli(['style-check', '--content', 'Hello there.', '--format', 'json'], standalone_mode=False); "
+            f"print([m for m in {heavy!r} if m in sys.modules], file=sys.stderr)",
+        )
+        assert '"compliant"' in result.stdout
+        assert result.stderr.strip().splitlines()[-1] == "[]"
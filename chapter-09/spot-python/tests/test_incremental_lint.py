@@ -0,0 +1,62 @@
+"""Test incremental re-linting by paragraph."""
+
+import pytest
+
+from spot.core.spot import SPOT
+from spot.utils.incremental_lint import IncrementalLinter
+from spot.utils.style_linter import lint_style, load_style_pack
+
+
+def make_document(paragraphs: int) -> list:
+    """Paragraphs of a long document with a few style problems."""
+    return [
+        f"Section {index} explains how all users reach accessible, inclusive tools. "
+        f"It is just a {'revolutionary' if index % 7 == 0 else 'useful'} step for everyone."
+        for index in range(paragraphs)
+    ]
+
+
+class TestIncrementalLint:
+    """Test paragraph caching and session handling."""
+    
+    def test_only_changed_paragraphs_are_relinted(self):
+        """Test that an edit re-lints one paragraph and totals equal a full lint."""
+        style_pack = load_style_pack()
+        linter = IncrementalLinter()
+        paragraphs = make_document(150)
+        
+        first = linter.lint("doc", "\n\n".join(paragraphs), style_pack)
+        paragraphs[42] = "A crazy new paragraph written by people with disabilities."
+        content = "\n\n".join(paragraphs)
+        second = linter.lint("doc", content, style_pack)
+        
+        assert first["incremental"] == {"paragraphs": 150, "relinted": 150}
+        assert second.pop("incremental") == {"paragraphs": 150, "relinted": 1}
+        assert second == lint_style(content, style_pack)
+        assert "crazy" in second["banned"]
+    
+    def test_sessions_are_bounded_and_reset_on_new_terms(self):
+        """Test that least recently used documents and stale style packs are dropped."""
+        style_pack = load_style_pack()
+        linter = IncrementalLinter(max_documents=2)
+        
+        for document_id in ("a", "b", "a", "c"):
+            linter.lint(document_id, "Just one paragraph.", style_pack)
+        changed = {**style_pack, "must_avoid": ["paragraph"]}
+        report = linter.lint("a", "Just one paragraph.", changed)
+        
+        assert list(linter.sessions) == ["c", "a"]
+        assert report["incremental"]["relinted"] == 1
+        assert report["banned"] == ["paragraph"]
+    
+    @pytest.mark.asyncio
+    async def test_check_style_with_document_id(self, test_config):
+        """Test that SPOT.check_style reuses a document's session."""
+        spot = SPOT(test_config)
+        content = "\n\n".join(make_document(10))
+        
+        await spot.check_style(content, document_id="draft")
+        result = await spot.check_style(content + "\n\nOne more line.", document_id="draft")
+        
+        assert result["report"]["incremental"] == {"paragraphs": 11, "relinted": 1}
+        assert result["violations"] == (await spot.check_style(content + "\n\nOne more line."))["violations"]
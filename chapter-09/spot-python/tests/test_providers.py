@@ -0,0 +1,684 @@
+"""Test provider management."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from spot.core.config import CircuitBreakerConfig, ConcurrencyConfig
+from spot.providers.circuit_breaker import CircuitBreaker, CircuitState
+from spot.providers.concurrency import AdaptiveConcurrencyLimiter, QueueFullError
+from spot.providers.deadline import Deadline, DeadlineExceededError
+from spot.providers.executor import BlockingExecutor
+from spot.providers.manager import OpenAIProvider, Provider, ProviderManager, gemini_usage
+from spot.providers.messages import cached_tokens
+from spot.providers.rate_limit import RateLimiter, TokenBucket, get_rate_limiter
+from spot.providers.transport import HTTPTransport
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingProvider(Provider):
+    """Provider that always fails."""
+    
+    def __init__(self):
+        super().__init__({"model": "failing-model"})
+        self.calls = 0
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        self.calls += 1
+        raise ConnectionError("upstream unavailable")
+    
+    async def health_check(self):
+        return False
+
+
+class SlowProvider(Provider):
+    """Provider that answers after a delay."""
+    
+    def __init__(self, delay: float):
+        super().__init__({"model": "slow-model"})
+        self.delay = delay
+        self.cancelled = False
+        self.calls = 0
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"content": "slow", "usage": {}, "model": "slow-model", "provider": "slow"}
+    
+    async def health_check(self):
+        return True
+
+
+class BrokenStreamProvider(Provider):
+    """Provider whose stream fails after the first token."""
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        raise NotImplementedError
+    
+    async def stream(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        yield {"type": "delta", "content": "partial"}
+        raise ConnectionError("connection reset")
+    
+    async def health_check(self):
+        return True
+
+
+class HangingHealthProvider(Provider):
+    """Provider whose health check never answers."""
+    
+    def __init__(self):
+        super().__init__({"model": "hanging-model"})
+        self.probes = 0
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        return {"content": "ok", "usage": {}, "model": "hanging-model", "provider": "hanging"}
+    
+    async def health_check(self):
+        self.probes += 1
+        await asyncio.sleep(10)
+        return True
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+    
+    def test_opens_after_threshold_and_probes_once(self):
+        """Test that the breaker opens, then lets a single trial through."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "test", CircuitBreakerConfig(threshold=2, timeout=60, reset_timeout=30), clock=clock
+        )
+        
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+        
+        clock.now = 31
+        assert breaker.allow_request()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow_request()
+        
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+    
+    def test_failures_outside_window_do_not_accumulate(self):
+        """Test that old failures fall out of the counting window."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "test", CircuitBreakerConfig(threshold=2, timeout=10, reset_timeout=30), clock=clock
+        )
+        
+        breaker.record_failure()
+        clock.now = 20
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+
+class RateLimitError(Exception):
+    """Stand-in for an SDK 429 error."""
+    
+    status_code = 429
+
+
+class FakeResponse:
+    """Minimal HTTP response carried by SDK errors."""
+    
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class APIStatusError(Exception):
+    """Stand-in for an SDK HTTP status error."""
+    
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code, headers)
+        self.status_code = status_code
+
+
+class FlakyProvider(Provider):
+    """Provider that raises the queued errors before succeeding."""
+    
+    def __init__(self, errors, retry_attempts=3):
+        super().__init__({"model": "flaky-model", "retry_attempts": retry_attempts})
+        self.errors = list(errors)
+        self.calls = 0
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"content": "ok", "usage": {}, "model": "flaky-model", "provider": "flaky"}
+    
+    async def health_check(self):
+        return True
+
+
+class TestConcurrencyLimiter:
+    """Test adaptive concurrency limiting."""
+    
+    @pytest.mark.asyncio
+    async def test_aimd_adjusts_limit(self):
+        """Test additive increase on success and multiplicative decrease on 429."""
+        limiter = AdaptiveConcurrencyLimiter("test", ConcurrencyConfig(initial_limit=4, max_limit=8))
+        
+        for _ in range(4):
+            async with limiter.slot():
+                pass
+        assert limiter.limit == pytest.approx(5.0, abs=0.1)
+        
+        with pytest.raises(RateLimitError):
+            async with limiter.slot():
+                raise RateLimitError()
+        assert int(limiter.limit) == 2
+        assert limiter.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_fifo_with_depth_limit(self):
+        """Test FIFO hand-off and queue-depth rejection."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "test", ConcurrencyConfig(initial_limit=1, max_limit=1, max_queue=2)
+        )
+        order = []
+        
+        async def worker(label):
+            async with limiter.slot():
+                order.append(label)
+                await asyncio.sleep(0)
+        
+        await limiter.acquire()
+        tasks = [asyncio.ensure_future(worker(label)) for label in ("a", "b")]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 2
+        with pytest.raises(QueueFullError):
+            await limiter.acquire()
+        
+        limiter.release("success")
+        await asyncio.gather(*tasks)
+        assert order == ["a", "b"]
+        assert limiter.in_flight == 0
+
+
+class TestRateLimiter:
+    """Test RPM/TPM token buckets."""
+    
+    def test_bucket_refills_per_minute(self):
+        """Test that a drained bucket reports the time until it can cover a charge."""
+        clock = FakeClock()
+        bucket = TokenBucket(600, clock=clock)
+        bucket.consume(600)
+        assert bucket.time_until(100) == pytest.approx(10.0)
+        clock.now = 10
+        assert bucket.time_until(100) == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_charge_is_corrected_from_usage_and_headers(self):
+        """Test reconciliation of estimated token charges."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=10000, clock=FakeClock())
+        
+        await limiter.acquire(3000)
+        assert limiter.buckets["tokens"].tokens == 7000
+        assert limiter.buckets["requests"].tokens == 59
+        
+        limiter.reconcile(estimated=3000, actual=500)
+        assert limiter.buckets["tokens"].tokens == 9500
+        
+        limiter.update_from_headers({"x-ratelimit-remaining-tokens": "1200"})
+        assert limiter.buckets["tokens"].tokens == 1200
+    
+    @pytest.mark.asyncio
+    async def test_acquire_paces_until_quota_available(self):
+        """Test that a call over quota waits instead of being sent."""
+        limiter = RateLimiter(requests_per_minute=6000)
+        limiter.buckets["requests"].consume(6000)
+        
+        waited = await limiter.acquire(1)
+        assert waited >= 0.005
+    
+    @pytest.mark.asyncio
+    async def test_acquire_gives_up_past_timeout(self):
+        """Test that a wait longer than the timeout fails at once without charging."""
+        limiter = RateLimiter(requests_per_minute=600)
+        limiter.buckets["requests"].consume(600)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire(1, timeout=0.05)
+        assert limiter.buckets["requests"].available() < 1
+        assert await limiter.acquire(1, timeout=0.5) < 0.5
+    
+    def test_shared_limiter_follows_changed_limits(self):
+        """Test that the process-wide limiter picks up new per-minute limits."""
+        limiter = get_rate_limiter("resized", "key", 60, None)
+        limiter.buckets["requests"].consume(10)
+        
+        assert get_rate_limiter("resized", "key", 120, 1000) is limiter
+        assert limiter.buckets["requests"].capacity == 120
+        assert limiter.buckets["requests"].available() == pytest.approx(50, abs=0.5)
+        assert limiter.buckets["tokens"].capacity == 1000
+        
+        get_rate_limiter("resized", "key", 30, None)
+        assert limiter.buckets["requests"].available() == pytest.approx(30)
+        assert "tokens" not in limiter.buckets
+
+
+async def serve_keep_alive(reader, writer):
+    """Minimal HTTP/1.1 server answering every request with an empty 200."""
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+class TestHTTPTransport:
+    """Test the pooled provider transport."""
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_pre_opens_pooled_connections(self):
+        """Test that warm-up leaves idle keep-alive connections in the pool."""
+        server = await asyncio.start_server(serve_keep_alive, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = HTTPTransport()
+        try:
+            client = transport.client("local", {"pool_max_connections": 4, "pool_max_keepalive": 3})
+            assert transport.client("local", {}) is client
+            
+            opened = await transport.warm_up("local", f"http://127.0.0.1:{port}/", 5)
+            stats = transport.snapshot()["local"]
+            assert opened == 3
+            assert stats["idle"] == 3 and stats["active"] == 0
+            assert stats["max_connections"] == 4
+        finally:
+            await transport.aclose()
+            server.close()
+            await server.wait_closed()
+    
+    def test_sdk_clients_share_pooled_client(self, test_config):
+        """Test that provider SDK clients are built on the shared pooled client."""
+        manager = ProviderManager(test_config)
+        provider = OpenAIProvider({"model": "gpt-4", "pool_max_connections": 7}, api_key="test-key")
+        manager.register_provider("openai", provider)
+        
+        sdk_client = provider.client
+        assert sdk_client._client is manager.transport.clients["openai"]
+        assert manager.get_transport_status()["openai"]["max_connections"] == 7
+
+
+class TestBlockingExecutor:
+    """Test the dedicated pool for blocking SDK calls."""
+    
+    @pytest.mark.asyncio
+    async def test_calls_queue_beyond_pool_size(self):
+        """Test that calls beyond the worker count queue and are counted."""
+        executor = BlockingExecutor("test", max_workers=1)
+        release = threading.Event()
+        try:
+            first = asyncio.ensure_future(executor.run(release.wait))
+            second = asyncio.ensure_future(executor.run(lambda: "done"))
+            await asyncio.sleep(0.05)
+            assert executor.snapshot() == {"workers": 1, "running": 1, "queued": 1}
+            
+            release.set()
+            assert await second == "done"
+            await first
+            assert executor.snapshot()["queued"] == 0
+        finally:
+            release.set()
+            executor.shutdown()
+
+
+class TestUsage:
+    """Test provider usage reporting."""
+    
+    def test_gemini_usage_maps_usage_metadata(self):
+        """Test that Gemini token counts are reported in the common usage shape."""
+        metadata = SimpleNamespace(
+            prompt_token_count=12, candidates_token_count=30, total_token_count=42, cached_content_token_count=8
+        )
+        assert gemini_usage(metadata) == {
+            "prompt_tokens": 12, "completion_tokens": 30, "total_tokens": 42, "cached_tokens": 8
+        }
+        assert gemini_usage(None)["total_tokens"] == 0
+    
+    def test_cached_tokens_read_from_each_provider_usage(self):
+        """Test that prompt-cache hits are found in OpenAI and Anthropic usage."""
+        assert cached_tokens({"prompt_tokens": 2000, "prompt_tokens_details": {"cached_tokens": 1536}}) == 1536
+        assert cached_tokens({"input_tokens": 40, "cache_read_input_tokens": 1800}) == 1800
+        assert cached_tokens({"prompt_tokens": 10}) == 0
+
+
+class TestDeadline:
+    """Test per-request deadline propagation."""
+    
+    @pytest.mark.asyncio
+    async def test_attempt_is_cut_short_and_slow_fallback_skipped(self, test_config):
+        """Test that the attempt gets only the remaining budget and no fallback starts."""
+        manager = ProviderManager(test_config)
+        slow = SlowProvider(delay=5.0)
+        manager.register_provider("slow", slow)
+        manager.register_provider("failing", FailingProvider())
+        manager.providers["failing"].config["retry_attempts"] = 0
+        manager.scores["mock"].record(2.0, success=True)
+        
+        with pytest.raises(DeadlineExceededError, match="waiting for provider slow"):
+            await manager.generate(
+                "Hello", provider_name="slow", fallback_providers=["mock"], deadline=Deadline(0.05)
+            )
+        assert slow.cancelled
+        assert manager.circuit_breakers["slow"].failures == 0
+        
+        with pytest.raises(DeadlineExceededError, match="mock: skipped"):
+            await manager.generate(
+                "Hello", provider_name="failing", fallback_providers=["mock"], deadline=Deadline(1.0)
+            )
+    
+    @pytest.mark.asyncio
+    async def test_fallback_runs_when_it_fits(self, test_config):
+        """Test that a fast enough fallback is still tried within the deadline."""
+        manager = ProviderManager(test_config)
+        manager.register_provider("failing", FailingProvider())
+        manager.providers["failing"].config["retry_attempts"] = 0
+        
+        result = await manager.generate(
+            "Hello", provider_name="failing", fallback_providers=["mock"], deadline=Deadline(5.0)
+        )
+        assert result["provider"] == "mock"
+
+
+class TestHealthMonitor:
+    """Test cached background health checks."""
+    
+    @pytest.mark.asyncio
+    async def test_probes_concurrently_with_timeout_and_serves_snapshot(self, test_config):
+        """Test that slow probes time out and later reads do not probe again."""
+        test_config.health_check_timeout = 0.05
+        manager = ProviderManager(test_config)
+        hanging = HangingHealthProvider()
+        manager.register_provider("hanging", hanging)
+        
+        health = await manager.health_check_all()
+        assert health["mock"] is True and health["hanging"] is False
+        assert "timed out" in manager.get_health_details()["hanging"]["error"]
+        
+        await manager.health_check_all()
+        assert hanging.probes == 1
+    
+    @pytest.mark.asyncio
+    async def test_live_traffic_updates_health_and_skips_probe(self, test_config):
+        """Test that recent traffic outcomes replace probes."""
+        test_config.health_check_timeout = 0.05
+        manager = ProviderManager(test_config)
+        hanging = HangingHealthProvider()
+        manager.register_provider("hanging", hanging)
+        
+        await manager.generate("Hello", provider_name="hanging", fallback_providers=[])
+        await manager.health_monitor.refresh(max_age=test_config.health_check_interval)
+        
+        assert hanging.probes == 0
+        assert manager.get_health_details()["hanging"]["source"] == "traffic"
+        assert manager.health_monitor.snapshot()["hanging"] is True
+
+
+class TestProviderManager:
+    """Test provider manager failover."""
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_provider(self, test_config):
+        """Test that an open provider is skipped without being called."""
+        test_config.circuit_breaker_threshold = 1
+        manager = ProviderManager(test_config)
+        failing = FailingProvider()
+        manager.register_provider("failing", failing)
+        
+        result = await manager.generate("Hello", provider_name="failing", fallback_providers=["mock"])
+        assert result["provider"] == "mock"
+        assert failing.calls == 1
+        
+        result = await manager.generate("Hello", provider_name="failing", fallback_providers=["mock"])
+        assert result["provider"] == "mock"
+        assert failing.calls == 1
+        assert manager.get_provider_status()["failing"]["state"] == "open"
+    
+    @pytest.mark.asyncio
+    async def test_hedge_wins_against_slow_primary(self, test_config):
+        """Test that a slow primary is hedged and the faster answer wins."""
+        test_config.hedge_enabled = True
+        test_config.hedge_delay = 0.01
+        test_config.hedge_budget_ratio = 1.0
+        manager = ProviderManager(test_config)
+        slow = SlowProvider(delay=5.0)
+        manager.register_provider("slow", slow)
+        
+        result = await manager.generate("Hello", provider_name="slow", fallback_providers=["mock"])
+        
+        assert result["provider"] == "mock"
+        assert slow.cancelled
+        assert manager.get_hedging_stats() == {"enabled": True, "fired": 1, "won": 1}
+        assert manager.get_provider_status()["slow"]["state"] == "closed"
+    
+    @pytest.mark.asyncio
+    async def test_hedge_not_charged_without_eligible_backup(self, test_config):
+        """Test that a hedge that cannot start a backup is not counted or charged."""
+        test_config.hedge_enabled = True
+        test_config.hedge_delay = 0.01
+        test_config.hedge_budget_ratio = 0.0
+        manager = ProviderManager(test_config)
+        manager.register_provider("slow", SlowProvider(delay=0.1))
+        manager.scores["mock"].record(5.0, success=True)
+        
+        result = await manager.generate(
+            "Hello", provider_name="slow", fallback_providers=["mock"], deadline=Deadline(1.0)
+        )
+        
+        assert result["provider"] == "slow"
+        assert manager.get_hedging_stats() == {"enabled": True, "fired": 0, "won": 0}
+        assert manager.hedge_policy.can_hedge()
+    
+    @pytest.mark.asyncio
+    async def test_no_silent_mock_fallback(self, test_config):
+        """Test that mock is not a fallback unless configured for development."""
+        test_config.dev_mock_providers = False
+        test_config.provider = "openai"
+        manager = ProviderManager(test_config)
+        manager.register_provider("failing", FailingProvider())
+        
+        with pytest.raises(RuntimeError, match="All providers failed"):
+            await manager.generate("Hello", provider_name="failing")
+    
+    def test_chain_ordered_by_live_score(self, test_config):
+        """Test that unpinned requests route to the best-scoring provider."""
+        manager = ProviderManager(test_config)
+        manager.register_provider("slow", SlowProvider(delay=0))
+        manager.register_provider("fast", SlowProvider(delay=0))
+        manager.scores["slow"].record(2.0, success=True)
+        manager.scores["fast"].record(0.2, success=True)
+        manager.scores["mock"].record(0.5, success=False)
+        
+        chain = manager.resolve_chain(fallback_providers=["slow", "fast", "mock"])
+        assert chain == ["fast", "slow", "mock"]
+        
+        chain = manager.resolve_chain(provider_name="slow", fallback_providers=["fast", "mock"])
+        assert chain == ["slow", "fast", "mock"]
+    
+    def test_template_failover_chain(self, test_config):
+        """Test that template chains override environment chains."""
+        assert test_config.get_failover_chain("draft_scaffold@1.0.0")[:3] == ["anthropic", "openai", "gemini"]
+        assert test_config.get_failover_chain()[-1] == "mock"
+    
+    def test_resolve_chain_follows_template_chain(self, test_config):
+        """Test that an unpinned request keeps the template's configured order."""
+        manager = ProviderManager(test_config)
+        for name in ("openai", "anthropic", "gemini"):
+            manager.register_provider(name, SlowProvider(delay=0))
+        
+        chain = manager.resolve_chain(template="draft_scaffold@1.0.0")
+        assert chain == ["anthropic", "openai", "gemini", "mock"]
+        
+        chain = manager.resolve_chain()
+        assert chain == ["openai", "anthropic", "gemini", "mock"]
+    
+    def test_fast_failing_provider_is_not_routed_first(self, test_config):
+        """Test that failures neither make a provider look fast nor let unmeasured ones jump ahead."""
+        manager = ProviderManager(test_config)
+        for name in ("failing", "healthy", "new"):
+            manager.register_provider(name, SlowProvider(delay=0))
+        for _ in range(5):
+            manager.scores["failing"].record(0.001, success=False)
+            manager.scores["healthy"].record(0.2, success=True)
+        manager.scores["failing"].record(0.001, success=True)
+        
+        assert manager.scores["failing"].latency == pytest.approx(0.001)
+        assert not manager.scores["failing"].healthy
+        assert manager.resolve_chain(fallback_providers=["failing", "new", "healthy"]) == ["healthy", "new", "failing"]
+        
+        manager.scores["new"].record(0.1, success=True)
+        assert manager.resolve_chain(fallback_providers=["failing", "healthy", "new"]) == ["new", "healthy", "failing"]
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_only(self, test_config):
+        """Test that 429/5xx are retried (honouring Retry-After) and 4xx is not."""
+        test_config.retry_base_delay = 0.001
+        manager = ProviderManager(test_config)
+        
+        flaky = FlakyProvider([APIStatusError(429, {"retry-after-ms": "5"}), APIStatusError(503)])
+        manager.register_provider("flaky", flaky)
+        result = await manager.generate("Hello", provider_name="flaky", fallback_providers=[])
+        assert result["content"] == "ok"
+        assert flaky.calls == 3
+        
+        bad_request = FlakyProvider([APIStatusError(400)])
+        manager.register_provider("bad", bad_request)
+        with pytest.raises(RuntimeError):
+            await manager.generate("Hello", provider_name="bad", fallback_providers=[])
+        assert bad_request.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_caller_errors_do_not_open_circuit(self, test_config):
+        """Test that bad requests and local errors do not trip the breaker, but 5xx does."""
+        test_config.circuit_breaker_threshold = 1
+        manager = ProviderManager(test_config)
+        flaky = FlakyProvider([APIStatusError(400), ValueError("client not available"), APIStatusError(503)], 0)
+        manager.register_provider("flaky", flaky)
+        
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await manager.generate("Hello", provider_name="flaky", fallback_providers=[])
+            assert manager.get_provider_status()["flaky"]["state"] == "closed"
+        
+        with pytest.raises(RuntimeError):
+            await manager.generate("Hello", provider_name="flaky", fallback_providers=[])
+        assert manager.get_provider_status()["flaky"]["state"] == "open"
+    
+    @pytest.mark.asyncio
+    async def test_retry_budget_caps_retries(self, test_config):
+        """Test that an exhausted retry budget stops retries."""
+        test_config.retry_base_delay = 0.001
+        test_config.retry_budget_max = 1.0
+        test_config.retry_budget_ratio = 0.0
+        manager = ProviderManager(test_config)
+        flaky = FlakyProvider([APIStatusError(500)] * 3)
+        manager.register_provider("flaky", flaky)
+        
+        with pytest.raises(RuntimeError):
+            await manager.generate("Hello", provider_name="flaky", fallback_providers=[])
+        assert flaky.calls == 2
+        assert manager.get_retry_status()["exhausted"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_first_token(self, test_config):
+        """Test that streaming falls back until text has been sent, then not."""
+        manager = ProviderManager(test_config)
+        manager.register_provider("failing", FailingProvider())
+        
+        events = [
+            event
+            async for event in manager.stream("Hello", provider_name="failing", fallback_providers=["mock"])
+        ]
+        assert [event["type"] for event in events[-2:]] == ["delta", "done"]
+        assert "".join(event["content"] for event in events[:-1]).startswith("Mock response")
+        assert events[-1]["provider"] == "mock"
+        assert set(events[-1]["timings"]) == {"ttft_ms", "total_ms"}
+        
+        manager.register_provider("broken", BrokenStreamProvider({}))
+        received = []
+        with pytest.raises(ConnectionError):
+            async for event in manager.stream("Hello", provider_name="broken", fallback_providers=["mock"]):
+                received.append(event)
+        assert received == [{"type": "delta", "content": "partial"}]
+    
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self, test_config):
+        """Test that concurrent duplicates share one call and survive a cancelled peer."""
+        manager = ProviderManager(test_config)
+        slow = SlowProvider(delay=0.05)
+        manager.register_provider("slow", slow)
+        
+        def request(prompt="Hello"):
+            return asyncio.ensure_future(
+                manager.generate(prompt, provider_name="slow", fallback_providers=[])
+            )
+        
+        first, second, third, other = request(), request(), request(), request("Other")
+        await asyncio.sleep(0.01)
+        first.cancel()
+        results = await asyncio.gather(second, third, other)
+        
+        assert slow.calls == 2
+        assert not slow.cancelled
+        assert results[0] == results[1] and results[0] is not results[1]
+        assert manager.get_coalescing_stats()["hits"] == 2
+        assert manager.get_coalescing_stats()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_deadline_does_not_leak_to_coalesced_callers(self, test_config):
+        """Test that a caller's deadline does not fail an identical caller without one."""
+        manager = ProviderManager(test_config)
+        slow = SlowProvider(delay=0.2)
+        manager.register_provider("slow", slow)
+        
+        hurried = asyncio.ensure_future(
+            manager.generate("Hello", provider_name="slow", fallback_providers=[], deadline=Deadline(0.05))
+        )
+        patient = asyncio.ensure_future(
+            manager.generate("Hello", provider_name="slow", fallback_providers=[])
+        )
+        
+        with pytest.raises(DeadlineExceededError):
+            await hurried
+        result = await patient
+        assert result["content"] == "slow"
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_is_bounded_by_deadline(self, test_config):
+        """Test that a request does not wait on the rate limiter past its deadline."""
+        manager = ProviderManager(test_config)
+        manager.register_provider("slow", SlowProvider(delay=0))
+        manager.rate_limiters["slow"] = RateLimiter(requests_per_minute=1)
+        manager.rate_limiters["slow"].buckets["requests"].consume(1)
+        
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(DeadlineExceededError, match="rate limit"):
+            await manager.generate("Hello", provider_name="slow", fallback_providers=[], deadline=Deadline(0.5))
+        assert asyncio.get_running_loop().time() - started < 0.5
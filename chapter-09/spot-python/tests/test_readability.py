@@ -0,0 +1,66 @@
+"""Test the readability engine against the original implementation."""
+
+import random
+import re
+
+from spot.utils.readability import ReadabilityStats
+from spot.utils.style_linter import count_syllables, flesch_kincaid_grade
+
+
+def legacy_count_syllables(text):
+    """The original count_syllables."""
+    words = re.findall(r'[a-z]+', text.lower())
+    count = 0
+    for word in words:
+        syllable_word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
+        syllable_word = re.sub(r'^y', '', syllable_word)
+        vowel_matches = re.findall(r'[aeiouy]{1,2}', syllable_word)
+        count += len(vowel_matches) if vowel_matches else 1
+    return count
+
+
+def legacy_flesch_kincaid_grade(text):
+    """The original flesch_kincaid_grade."""
+    sentences = max(1, len(re.findall(r'[.!?]+', text)))
+    words = max(1, len(re.findall(r'\b\w+\b', text)))
+    syllables = legacy_count_syllables(text)
+    grade = 0.39 * (words / sentences) + 11.8 * (syllables / words) - 15.59
+    return max(0.0, round(grade, 1))
+
+
+SAMPLES = [
+    "",
+    "Hello.",
+    "The quick brown fox jumps over the lazy dog!! Yes? Yearly yoyos... 42 apples_and pears.",
+    "Café déjà vu: naïve façades in Zürich. Don't over-engineer; it's 3x slower — ÜBER.",
+    "Accessibility improves everyone's experience\nwithout exception...and more",
+]
+
+
+class TestReadability:
+    """Test readability scores."""
+    
+    def test_flesch_kincaid_matches_legacy(self):
+        """Test that grades and syllable counts equal the original implementation."""
+        rng = random.Random(7)
+        alphabet = "abcdeiouy ABEY.!?,'-_0129éÜ\n"
+        generated = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 400))) for _ in range(200)]
+        
+        for text in SAMPLES + generated:
+            assert flesch_kincaid_grade(text) == legacy_flesch_kincaid_grade(text), text
+            assert count_syllables(text) == legacy_count_syllables(text), text
+            stats = ReadabilityStats.from_text(text)
+            assert stats.syllables == legacy_count_syllables(text), text
+    
+    def test_stats_merge_across_parts(self):
+        """Test that counts of paragraphs add up to the counts of the document."""
+        paragraphs = ["First part is here.", "Second part, considerably longer, follows!", "Done."]
+        
+        total = sum((ReadabilityStats.from_text(part) for part in paragraphs), ReadabilityStats())
+        whole = ReadabilityStats.from_text("\n\n".join(paragraphs))
+        
+        assert total == whole
+        assert whole - ReadabilityStats.from_text(paragraphs[0]) == ReadabilityStats.from_text(" ".join(paragraphs[1:]))
+        assert set(whole.scores()) == {
+            "flesch_kincaid_grade", "flesch_reading_ease", "gunning_fog", "smog_index", "coleman_liau_index",
+        }
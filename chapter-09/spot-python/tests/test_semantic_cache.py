@@ -0,0 +1,154 @@
+"""Test the semantic cache."""
+
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from spot.core.spot import SPOT
+from spot.providers.deadline import Deadline
+from spot.providers.manager import ProviderManager
+from spot.providers.messages import prompt_text
+from spot.providers.semantic_cache import Embedder, HashingEmbedder, SemanticCache
+
+
+class FailingEmbedder(Embedder):
+    """Embedder whose API is down."""
+    
+    dimensions = 8
+    
+    async def embed(self, text):
+        raise ConnectionError("embeddings API unavailable")
+
+
+class HangingEmbedder(Embedder):
+    """Embedder whose API never answers."""
+    
+    dimensions = 8
+    
+    async def embed(self, text):
+        await asyncio.sleep(10)
+
+
+class TestSemanticCache:
+    """Test semantic cache lookup and eviction."""
+    
+    @pytest.mark.asyncio
+    async def test_lookup_top_k_and_lru_eviction(self):
+        """Test that lookups rank by similarity and full caches evict the LRU row."""
+        cache = SemanticCache(HashingEmbedder(64), capacity=2, threshold=0.5)
+        first = cache.normalize(np.eye(64, dtype=np.float32)[0])
+        second = cache.normalize(np.eye(64, dtype=np.float32)[0] + np.eye(64, dtype=np.float32)[1])
+        third = cache.normalize(np.eye(64, dtype=np.float32)[2])
+        cache.insert(first, "first")
+        cache.insert(second, "second")
+        
+        matches = cache.search(first, k=2)
+        assert [value for _, value in matches] == ["first", "second"]
+        assert matches[0][0] == pytest.approx(1.0)
+        
+        cache.search(first)
+        cache.insert(third, "third")
+        assert len(cache) == 2
+        assert [value for _, value in cache.search(second, k=2)] == ["first"]
+        assert cache.search(third)[0][1] == "third"
+    
+    def test_scoped_search_ranks_only_its_scope(self):
+        """Test that closer entries of other scopes do not hide a scope's match."""
+        cache = SemanticCache(HashingEmbedder(64), capacity=8, threshold=0.5)
+        query = cache.normalize(np.eye(64, dtype=np.float32)[0])
+        for index in range(3):
+            cache.insert(query, f"other-{index}", scope="other")
+        cache.insert(cache.normalize(query + np.eye(64, dtype=np.float32)[1] * 0.5), "mine", scope="mine")
+        
+        assert [value for _, value in cache.search(query, k=2, scope="mine")] == ["mine"]
+        assert cache.search(query, k=2, scope="unknown") == []
+        assert len(cache.search(query, k=2)) == 2
+    
+    @pytest.mark.asyncio
+    async def test_manager_reuses_answer_for_similar_prompt(self, test_config):
+        """Test that a rephrased prompt is served from the semantic cache."""
+        test_config.semantic_cache_enabled = True
+        test_config.semantic_cache_threshold = 0.8
+        manager = ProviderManager(test_config)
+        
+        first = await manager.generate("What are some good names for cats?", provider_name="mock")
+        similar = await manager.generate("What are some good names for cats", provider_name="mock")
+        other_params = await manager.generate(
+            "What are some good names for cats", provider_name="mock", max_tokens=5
+        )
+        
+        assert "semantic_similarity" not in first
+        assert similar["content"] == first["content"]
+        assert similar["semantic_similarity"] >= 0.8
+        assert "semantic_similarity" not in other_params
+        assert manager.get_semantic_cache_stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_template_render_with_other_topic_is_a_miss(self, test_config):
+        """Test that renders of one template are compared by their variables, not the template text."""
+        test_config.semantic_cache_enabled = True
+        spot = SPOT(test_config)
+        
+        def input_data(topic):
+            return {"asset_type": "blog post", "topic": topic, "audience": "developers"}
+        
+        async def generate(topic):
+            return await spot.generate("draft_scaffold@1.0.0", input_data(topic), provider="mock", use_cache=False)
+        
+        # The renders embed as near duplicates, above the similarity threshold
+        template = await spot.template_manager.load_template("draft_scaffold@1.0.0")
+        embedder = HashingEmbedder(test_config.semantic_cache.dimensions)
+        renders = [
+            await spot.template_manager.render_messages(template, input_data(topic), None)
+            for topic in ("caching", "queues")
+        ]
+        first_vector, second_vector = (
+            SemanticCache.normalize(embedder.embed_sync(prompt_text(render))) for render in renders
+        )
+        assert float(first_vector @ second_vector) >= test_config.semantic_cache.threshold
+        
+        first = await generate("caching")
+        other_topic = await generate("queues")
+        same_topic = await generate("Caching")
+        
+        assert "semantic_similarity" not in first
+        assert "semantic_similarity" not in other_topic
+        assert same_topic["semantic_similarity"] == pytest.approx(1.0)
+    
+    @pytest.mark.asyncio
+    async def test_changed_system_prompt_is_a_miss(self, test_config):
+        """Test that an edited style pack (carried in the system messages) does not reuse old answers."""
+        test_config.semantic_cache_enabled = True
+        manager = ProviderManager(test_config)
+        
+        async def generate(style):
+            prompt = [
+                {"role": "system", "content": f"Brand voice: {style}"},
+                {"role": "user", "content": "Write about caching"},
+            ]
+            return await manager.generate(prompt, provider_name="mock", variables={"topic": "caching"})
+        
+        await generate("Plain")
+        edited = await generate("Playful")
+        unchanged = await generate("Plain")
+        
+        assert "semantic_similarity" not in edited
+        assert unchanged["semantic_similarity"] == pytest.approx(1.0)
+    
+    @pytest.mark.asyncio
+    async def test_embedder_failure_does_not_fail_generation(self, test_config):
+        """Test that a down or slow embedder is skipped instead of failing the request."""
+        test_config.semantic_cache_enabled = True
+        manager = ProviderManager(test_config)
+        
+        manager.semantic_cache = SemanticCache(FailingEmbedder())
+        result = await manager.generate("Hello", provider_name="mock")
+        assert result["provider"] == "mock"
+        
+        manager.semantic_cache = SemanticCache(HangingEmbedder())
+        started = asyncio.get_running_loop().time()
+        result = await manager.generate("Hello", provider_name="mock", deadline=Deadline(2.0))
+        assert result["provider"] == "mock"
+        assert asyncio.get_running_loop().time() - started < 2.0
@@ -1,7 +1,41 @@
 """Test SPOT core functionality."""
 
+import json
+
 import pytest
 from spot.core.spot import SPOT
+from spot.providers.manager import Provider
+from spot.providers.messages import anthropic_request
+
+
+class FailingProvider(Provider):
+    """Provider that always fails."""
+    
+    def __init__(self):
+        super().__init__({"model": "failing-model", "retry_attempts": 0})
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        raise ConnectionError("upstream unavailable")
+    
+    async def health_check(self):
+        return False
+
+
+class NamedProvider(Provider):
+    """Provider that answers with a valid scaffold under its own name."""
+    
+    def __init__(self, name):
+        super().__init__({"model": f"{name}-model"})
+        self.name = name
+        self.calls = 0
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        self.calls += 1
+        content = json.dumps({"title": "T", "sections": [{"heading": "H", "bullets": ["a", "b", "c"]}]})
+        return {"content": content, "usage": {}, "model": f"{self.name}-model", "provider": self.name}
+    
+    async def health_check(self):
+        return True
 
 
 class TestSPOT:
@@ -49,6 +83,100 @@ class TestSPOT:
         assert "provider" in result
         assert result["provider"] == "mock"
     
+    @pytest.mark.asyncio
+    async def test_generate_uses_cache_for_temperature_zero(self, test_config):
+        """Test that deterministic generations are cached and can bypass the cache."""
+        spot = SPOT(test_config)
+        input_data = {"content": "Test content"}
+        
+        first = await spot.generate("draft_scaffold@1.0.0", dict(input_data), provider="mock", temperature=0)
+        second = await spot.generate("draft_scaffold@1.0.0", dict(input_data), provider="mock", temperature=0)
+        bypass = await spot.generate(
+            "draft_scaffold@1.0.0", dict(input_data), provider="mock", temperature=0, use_cache=False
+        )
+        sampled = await spot.generate("draft_scaffold@1.0.0", dict(input_data), provider="mock", temperature=0.7)
+        
+        assert first["cached"] is False
+        assert second["cached"] is True and second["cache_tier"] == "memory"
+        assert second["content"] == first["content"]
+        assert bypass["cached"] is False
+        assert sampled["cached"] is False
+    
+    @pytest.mark.asyncio
+    async def test_fallback_answer_is_not_cached(self, test_config):
+        """Test that an answer from a fallback provider is not cached for the requested one."""
+        spot = SPOT(test_config)
+        spot.provider_manager.register_provider("failing", FailingProvider())
+        input_data = {"content": "Test content"}
+        
+        first = await spot.generate(
+            "draft_scaffold@1.0.0", dict(input_data), provider="failing", fallback_providers=["mock"], temperature=0
+        )
+        second = await spot.generate(
+            "draft_scaffold@1.0.0", dict(input_data), provider="failing", fallback_providers=["mock"], temperature=0
+        )
+        
+        assert first["provider"] == second["provider"] == "mock"
+        assert first["cached"] is False
+        assert second["cached"] is False
+    
+    @pytest.mark.asyncio
+    async def test_unpinned_answer_is_cached_under_routed_provider(self, test_config):
+        """Test that an unpinned request is cached when the default provider is not first in the chain."""
+        test_config.provider = "openai"
+        spot = SPOT(test_config)
+        providers = {name: NamedProvider(name) for name in ("anthropic", "openai", "gemini")}
+        for name, provider in providers.items():
+            spot.provider_manager.register_provider(name, provider)
+        input_data = {"topic": "Caching"}
+        
+        first = await spot.generate("draft_scaffold@1.0.0", dict(input_data), temperature=0)
+        second = await spot.generate("draft_scaffold@1.0.0", dict(input_data), temperature=0)
+        
+        assert first["provider"] == "anthropic"
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert providers["anthropic"].calls == 1
+        assert providers["openai"].calls == 0
+    
+    @pytest.mark.asyncio
+    async def test_render_messages_puts_stable_prefix_first(self, test_config):
+        """Test that system and style blocks precede the variable prompt."""
+        spot = SPOT(test_config)
+        template = await spot.template_manager.load_template("draft_scaffold@1.0.0")
+        style_pack = {"brand_voice": "Plain", "must_avoid": ["synergy"]}
+        
+        first = await spot.template_manager.render_messages(template, {"topic": "Python"}, style_pack)
+        second = await spot.template_manager.render_messages(template, {"topic": "Rust"}, style_pack)
+        
+        assert [message["role"] for message in first] == ["system", "system", "user"]
+        assert first[:2] == second[:2]
+        assert first[1]["cache"] is True
+        assert "Python" in first[2]["content"]
+        
+        system, messages = anthropic_request(first)
+        assert system[-1]["cache_control"] == {"type": "ephemeral"}
+        assert messages == [{"role": "user", "content": [{"type": "text", "text": first[2]["content"]}]}]
+    
+    @pytest.mark.asyncio
+    async def test_stream_generate_mock(self, test_config):
+        """Test streaming generation with mock provider."""
+        spot = SPOT(test_config)
+        
+        events = [
+            event
+            async for event in spot.stream_generate(
+                template="draft_scaffold@1.0.0",
+                input_data={"content": "Test content"},
+                provider="mock"
+            )
+        ]
+        
+        assert events[0]["type"] == "delta"
+        assert events[-1]["type"] == "done"
+        assert events[-1]["provider"] == "mock"
+        assert "ttft_ms" in events[-1]["timings"]
+    
     @pytest.mark.asyncio
     async def test_evaluate(self, test_config):
         """Test evaluation functionality."""
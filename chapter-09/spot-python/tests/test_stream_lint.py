@@ -0,0 +1,101 @@
+"""Test memory-bounded streaming lint."""
+
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from spot.utils.stream_lint import StreamingLinter, lint_file_streaming
+from spot.utils.style_linter import lint_style, load_style_pack
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Corpus size for the peak memory check in MB; raise it (e.g. to 300) to
+# check a multi-hundred-MB dump
+CORPUS_MB = int(os.environ.get("SPOT_STREAM_LINT_MB", "16"))
+
+PARAGRAPH = (
+    "Just imagine a revolutionary tool that all users love. It is accessible and inclusive, "
+    "so everyone (including people with disabilities) can turn a blind\neye to nothing. "
+    "Normal users adjust; customers don't blame the naïve café owner!\n\n"
+)
+
+PEAK_RSS_SCRIPT = """
+import resource, sys
+from spot.utils.stream_lint import lint_file_streaming
+from spot.utils.style_linter import load_style_pack
+style_pack = load_style_pack()
+report = lint_file_streaming(sys.argv[1], style_pack, chunk_size=1 << 18)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, report["reading_level"])
+"""
+
+
+def peak_rss_kb(path: Path) -> int:
+    """Peak RSS of a fresh interpreter that stream-lints ``path``."""
+    result = subprocess.run(
+        [sys.executable, "-c", PEAK_RSS_SCRIPT, str(path)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    return int(result.stdout.split()[0])
+
+
+def write_corpus(path: Path, megabytes: int) -> None:
+    """Write a corpus of about ``megabytes`` MB without holding it in memory."""
+    block = PARAGRAPH * (65536 // len(PARAGRAPH))
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(megabytes * (1 << 20) // len(block.encode("utf-8"))):
+            f.write(block)
+
+
+class TestStreamLint:
+    """Test that chunked linting equals a whole-text lint."""
+    
+    def test_chunked_report_equals_whole_text(self):
+        """Test that term hits and readability survive any chunk boundaries."""
+        style_pack = load_style_pack()
+        rng = random.Random(3)
+        text = "".join(PARAGRAPH.replace(" ", rng.choice([" ", "  ", "\n"]), rng.randint(0, 5)) for _ in range(20))
+        expected = lint_style(text, style_pack)
+        
+        for size in (1, 7, 64, 1000):
+            linter = StreamingLinter(style_pack, max_matches=None)
+            for start in range(0, len(text), size):
+                linter.feed(text[start:start + size])
+            assert linter.finish() == expected, size
+    
+    def test_tail_stays_bounded_without_whitespace(self):
+        """Test that input without whitespace does not pile up in the tail."""
+        style_pack = load_style_pack()
+        text = "x" * 20000 + "just," + "y" * 20000 + ",just," + "z" * 20000
+        expected = lint_style(text, style_pack)["matches"]
+        assert [match["start"] for match in expected] == [40006]
+        
+        for size in (1, 7, 1000):
+            linter = StreamingLinter(style_pack, max_matches=None)
+            for start in range(0, len(text), size):
+                linter.feed(text[start:start + size])
+                assert len(linter._tail) <= linter.max_term_length + 1
+            assert linter.finish()["matches"] == expected, size
+    
+    def test_file_lint_caps_matches(self, tmp_path):
+        """Test that a file lint matches lint_style apart from the capped matches."""
+        path = tmp_path / "corpus.md"
+        path.write_text(PARAGRAPH * 200, encoding="utf-8")
+        expected = lint_style(PARAGRAPH * 200, load_style_pack())
+        
+        report = lint_file_streaming(path, load_style_pack(), chunk_size=300, max_matches=10)
+        
+        assert report.pop("matches_truncated") is True
+        assert report.pop("matches") == expected.pop("matches")[:10]
+        assert report == expected
+    
+    def test_peak_memory_does_not_grow_with_file_size(self, tmp_path):
+        """Test that peak RSS stays flat from a small to a large corpus."""
+        small, large = tmp_path / "small.md", tmp_path / "large.md"
+        write_corpus(small, 1)
+        write_corpus(large, CORPUS_MB)
+        
+        growth_mb = (peak_rss_kb(large) - peak_rss_kb(small)) / 1024
+        
+        assert growth_mb < 8, f"peak RSS grew {growth_mb:.1f} MB for a {CORPUS_MB} MB corpus"
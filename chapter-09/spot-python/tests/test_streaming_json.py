@@ -0,0 +1,129 @@
+"""Test incremental JSON parsing of streamed output."""
+
+import json
+
+import pytest
+
+from spot.core.spot import SPOT
+from spot.core.streaming_json import StreamingJSONError, StreamingJSONParser
+from spot.providers.manager import Provider
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "sections": {"type": "array", "maxItems": 2, "items": {"type": "object", "required": ["heading"]}},
+    },
+    "required": ["title", "sections"],
+    "additionalProperties": False,
+}
+
+
+class ChunkedProvider(Provider):
+    """Provider that streams fixed chunks and records how many were read."""
+    
+    def __init__(self, chunks):
+        super().__init__({"model": "chunked-model", "retry_attempts": 0})
+        self.chunks = list(chunks)
+        self.sent = 0
+        self.closed = False
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        return {"content": "".join(self.chunks), "usage": {}, "model": "chunked-model", "provider": "chunked"}
+    
+    async def stream(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        try:
+            for chunk in self.chunks:
+                self.sent += 1
+                yield {"type": "delta", "content": chunk}
+            yield {"type": "done", "usage": {}, "model": "chunked-model"}
+        finally:
+            self.closed = True
+    
+    async def health_check(self):
+        return True
+
+
+class TestStreamingJSONParser:
+    """Test the incremental parser."""
+    
+    def test_valid_document_in_any_chunking(self):
+        """Test that a valid document completes however it is split."""
+        document = json.dumps({"title": "A \"quoted\" title", "sections": [{"heading": "H", "n": -1.5e3}]})
+        
+        for size in (1, 3, len(document)):
+            parser = StreamingJSONParser(SCHEMA)
+            for start in range(0, len(document), size):
+                parser.feed(document[start:start + size])
+            assert parser.complete
+    
+    def test_violations_raise_as_soon_as_seen(self):
+        """Test that each kind of violation is caught before the document ends."""
+        cases = [
+            ('{"title": "T", "sections": [{"heading": "a"}, {"heading": "b"}, {', "sections: more than 2 items"),
+            ('{"title": 5', "title: expected string, got number"),
+            ('{"title": "T", "extra"', "(root): unexpected property 'extra'"),
+            ('{"title": "T", "sections": [{}', "sections/0: missing required properties: heading"),
+            ('{"title" "T"', "(root): expected ':'"),
+        ]
+        for text, message in cases:
+            parser = StreamingJSONParser(SCHEMA)
+            with pytest.raises(StreamingJSONError) as error:
+                parser.feed(text)
+            assert str(error.value).startswith(message)
+    
+    def test_skips_fence_and_stops_at_root_close(self):
+        """Test that a code fence is skipped and trailing text is ignored."""
+        parser = StreamingJSONParser(SCHEMA)
+        parser.feed('```json\n{"title": "T", "sections": []}')
+        assert parser.complete
+        parser.feed("\n```\nHope this helps!")
+        
+        with pytest.raises(StreamingJSONError):
+            StreamingJSONParser(SCHEMA, max_preamble=10).feed("Here is a long introduction first")
+
+
+class TestStreamingValidation:
+    """Test schema-checked streaming through SPOT."""
+    
+    @pytest.mark.asyncio
+    async def test_stream_aborts_upstream_on_violation(self, test_config):
+        """Test that a stream exceeding maxItems is cancelled mid-response."""
+        spot = SPOT(test_config)
+        bullets = ", ".join(f'"b{i}"' for i in range(6))
+        chunks = ['{"title": "T", ', '"sections": [{"heading": "H", ', f'"bullets": [{bullets}', "]}]}", " trailing"]
+        chunked = ChunkedProvider(chunks)
+        spot.provider_manager.register_provider("chunked", chunked)
+        
+        received = []
+        with pytest.raises(StreamingJSONError, match="more than 5 items"):
+            async for event in spot.stream_generate(
+                "draft_scaffold@1.0.0", {"topic": "Python"}, provider="chunked"
+            ):
+                received.append(event)
+        
+        assert [event["content"] for event in received] == chunks[:2]
+        assert chunked.sent == 3
+        assert chunked.closed
+    
+    @pytest.mark.asyncio
+    async def test_stream_stops_when_document_closes(self, test_config):
+        """Test that reading stops once the root object has closed."""
+        spot = SPOT(test_config)
+        document = json.dumps({"title": "T", "sections": [{"heading": "H", "bullets": ["a", "b", "c"]}]})
+        chunked = ChunkedProvider([document[:20], document[20:], "\nLet me know if you need more!"])
+        spot.provider_manager.register_provider("chunked", chunked)
+        
+        events = [
+            event async for event in spot.stream_generate(
+                "draft_scaffold@1.0.0", {"topic": "Python"}, provider="chunked"
+            )
+        ]
+        
+        done = events[-1]
+        assert done["type"] == "done"
+        assert done["stopped_early"] is True
+        assert done["validation"] == {"valid": True, "errors": []}
+        assert chunked.sent == 2
+        assert chunked.closed
@@ -0,0 +1,41 @@
+"""Test style linting."""
+
+from spot.utils.style_linter import lint_style
+from spot.utils.term_matcher import TermMatcher
+
+
+STYLE_PACK = {
+    "reading_level": "Grade 0-20",
+    "must_use": ["all users", "accessible"],
+    "must_avoid": ["just", "lame", "crazy", "turn a blind eye"],
+    "terminology": {"users": "people", "crazy idea": "innovative idea"},
+}
+
+
+class TestTermMatching:
+    """Test single-pass term matching."""
+    
+    def test_terms_match_whole_words_only(self):
+        """Test that terms inside other words are not reported."""
+        report = lint_style("Adjust the blame; the accessible layout helps all  users.", STYLE_PACK)
+        
+        assert report["banned"] == []
+        assert report["missing_required"] == []
+        assert report["terminology"] == [{"term": "users", "preferred": "people"}]
+    
+    def test_matches_report_offsets_and_overlaps(self):
+        """Test that every hit is found with offsets, including overlapping terms."""
+        text = "Just a CRAZY idea. Don't turn a blind\neye."
+        matches = TermMatcher({
+            "must_avoid": STYLE_PACK["must_avoid"],
+            "terminology": STYLE_PACK["terminology"],
+        }).find_all(text)
+        
+        hits = [(match.term, match.kind, text[match.start:match.end]) for match in matches]
+        assert hits == [
+            ("just", "must_avoid", "Just"),
+            ("crazy idea", "terminology", "CRAZY idea"),
+            ("crazy", "must_avoid", "CRAZY"),
+            ("turn a blind eye", "must_avoid", "turn a blind\neye"),
+        ]
+        assert lint_style(text, STYLE_PACK)["banned"] == ["just", "crazy", "turn a blind eye"]
@@ -0,0 +1,34 @@
+"""Test compiled prompt templates."""
+
+from spot.core.template_engine import CompiledTemplate, CompiledText
+
+
+class TestCompiledTemplate:
+    """Test template compilation and rendering."""
+    
+    def test_render_matches_replace_loop(self):
+        """Test that rendering gives the same prompt as per-variable replacement."""
+        text = "Write a {asset_type} about {topic} for {audience}. {topic} again, {{literal}}."
+        variables = {"asset_type": "post", "topic": "Python", "audience": 7, "unused": "x"}
+        expected = text
+        for key, value in variables.items():
+            expected = expected.replace(f"{{{key}}}", str(value))
+        
+        assert CompiledText.compile(text).render({k: str(v) for k, v in variables.items()}) == expected
+    
+    def test_missing_values_stay_and_values_are_not_rescanned(self):
+        """Test that unknown placeholders are kept and values are inserted verbatim."""
+        compiled = CompiledText.compile("A {first} B {second}")
+        assert compiled.render({"first": "{second}"}) == "A {second} B {second}"
+    
+    def test_detects_undeclared_and_unused_inputs(self):
+        """Test that input declarations are checked against the placeholders."""
+        compiled = CompiledTemplate.compile({
+            "inputs": ["topic", "tone"],
+            "user": "About {topic}; flag as [REVIEW:{reason}].",
+        })
+        
+        assert compiled.undeclared == ("reason",)
+        assert compiled.unused == ("tone",)
+        assert len(compiled.warnings()) == 2
+        assert compiled.render({"topic": "tests"}) == "About tests; flag as [REVIEW:{reason}]."
@@ -0,0 +1,57 @@
+"""Test template loading and caching."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from spot.core.config import TemplateConfig
+from spot.core.spot import TemplateManager
+
+
+def write_template(path, user):
+    """Write a minimal template file."""
+    path.write_text(json.dumps({"id": "t", "version": "1.0.0", "inputs": ["topic"], "user": user}))
+
+
+class TestTemplateCache:
+    """Test the TTL and mtime aware template cache."""
+    
+    @pytest.mark.asyncio
+    async def test_revalidates_after_ttl_and_reloads_changed_file(self, tmp_path):
+        """Test that edits are picked up after the TTL without a restart."""
+        path = tmp_path / "t@1.0.0.json"
+        write_template(path, "About {topic}")
+        manager = TemplateManager(tmp_path, TemplateConfig(cache_ttl=10))
+        now = [0.0]
+        manager._clock = lambda: now[0]
+        
+        first = await manager.load_template("t@1.0.0")
+        write_template(path, "Changed: {topic}")
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        assert await manager.load_template("t@1.0.0") is first
+        
+        now[0] = 11
+        reloaded = await manager.load_template("t@1.0.0")
+        assert reloaded["user"] == "Changed: {topic}"
+        assert await manager.render_template(reloaded, {"topic": "x"}) == "Changed: x"
+        
+        now[0] = 22
+        assert await manager.load_template("t@1.0.0") is reloaded
+        stats = manager.snapshot()
+        assert (stats["misses"], stats["reloads"], stats["revalidations"], stats["hits"]) == (1, 1, 1, 2)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_first_loads_share_one_read(self, tmp_path):
+        """Test that simultaneous loads of an uncached template are coalesced."""
+        write_template(tmp_path / "t@1.0.0.json", "About {topic}")
+        manager = TemplateManager(tmp_path)
+        
+        templates = await asyncio.gather(*(manager.load_template("t@1.0.0") for _ in range(5)))
+        assert all(template is templates[0] for template in templates)
+        assert manager.snapshot()["misses"] == 1
+        assert manager.snapshot()["coalesced"] == 4
+        
+        with pytest.raises(FileNotFoundError):
+            await manager.load_template("missing@1.0.0")
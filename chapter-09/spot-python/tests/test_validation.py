@@ -0,0 +1,67 @@
+"""Test output validation against template schemas."""
+
+import json
+
+import pytest
+
+from spot.core.spot import SPOT
+from spot.core.validation import OutputValidator, extract_json
+from spot.providers.manager import Provider
+from spot.providers.messages import prompt_text
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}, "sections": {"type": "array", "maxItems": 2}},
+    "required": ["title", "sections"],
+}
+
+
+class ScriptedProvider(Provider):
+    """Provider that answers with queued responses and records prompts."""
+    
+    def __init__(self, responses):
+        super().__init__({"model": "scripted-model", "retry_attempts": 0})
+        self.responses = list(responses)
+        self.prompts = []
+    
+    async def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+        self.prompts.append(prompt)
+        return {"content": self.responses.pop(0), "usage": {}, "model": "scripted-model", "provider": "scripted"}
+    
+    async def health_check(self):
+        return True
+
+
+class TestOutputValidator:
+    """Test compiled output validators."""
+    
+    def test_extracts_fenced_json_and_reports_errors(self):
+        """Test that fenced output is parsed and schema errors are located."""
+        validator = OutputValidator(SCHEMA)
+        fenced = '```json\n{"title": "T", "sections": [1, 2, 3]}\n```'
+        
+        assert extract_json(fenced) == {"title": "T", "sections": [1, 2, 3]}
+        result = validator.validate(fenced)
+        assert not result.valid
+        assert result.errors[0].startswith("sections:")
+        assert validator.validate('Sure! {"title": "T", "sections": []}').valid
+        assert "not valid JSON" in validator.validate("no json here").errors[0]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_output_gets_one_repair_prompt(self, test_config):
+        """Test that an invalid response is re-prompted once with its errors."""
+        test_config.template_repair_output = True
+        spot = SPOT(test_config)
+        valid = json.dumps({"title": "T", "sections": [{"heading": "H", "bullets": ["a", "b", "c"]}]})
+        scripted = ScriptedProvider(["not json", valid])
+        spot.provider_manager.register_provider("scripted", scripted)
+        
+        result = await spot.generate(
+            "draft_scaffold@1.0.0", {"topic": "Python"}, provider="scripted", use_cache=False
+        )
+        
+        assert result["validation"] == {"valid": True, "errors": []}
+        assert result["repaired"] is True
+        assert len(scripted.prompts) == 2
+        assert "does not match the required JSON schema" in prompt_text(scripted.prompts[1])
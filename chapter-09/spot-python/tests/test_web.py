@@ -0,0 +1,91 @@
+"""Test the web application helpers."""
+
+import asyncio
+
+import anyio
+import pytest
+
+from spot.web.app import ClientDisconnected, aclose_shielded, cancel_on_disconnect
+
+
+class DisconnectingRequest:
+    """Request stand-in whose client goes away after a delay."""
+    
+    def __init__(self, after: float):
+        self.after = after
+    
+    async def receive(self):
+        await asyncio.sleep(self.after)
+        return {"type": "http.disconnect"}
+
+
+class TestCancelOnDisconnect:
+    """Test cancelling work when the HTTP client disconnects."""
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_in_flight_work(self):
+        """Test that the awaited work is cancelled once the client is gone."""
+        cancelled = asyncio.Event()
+        
+        async def provider_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        with pytest.raises(ClientDisconnected):
+            await cancel_on_disconnect(DisconnectingRequest(0.01), provider_call())
+        assert cancelled.is_set()
+    
+    @pytest.mark.asyncio
+    async def test_result_returned_while_connected(self):
+        """Test that finished work is returned unchanged."""
+        async def provider_call():
+            return {"content": "ok"}
+        
+        assert await cancel_on_disconnect(DisconnectingRequest(10), provider_call()) == {"content": "ok"}
+    
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self):
+        """Test that cancelling the caller raises CancelledError, not ClientDisconnected."""
+        cancelled = asyncio.Event()
+        
+        async def provider_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        waiter = asyncio.ensure_future(cancel_on_disconnect(DisconnectingRequest(10), provider_call()))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert cancelled.is_set()
+
+
+class TestStreamCleanup:
+    """Test closing upstream streams when a response is cancelled."""
+    
+    @pytest.mark.asyncio
+    async def test_stream_closes_inside_cancelled_scope(self):
+        """Test that the upstream stream finishes closing although the caller is cancelled."""
+        closed = asyncio.Event()
+        
+        async def provider_stream():
+            try:
+                yield {"type": "delta", "content": "partial"}
+                await asyncio.sleep(10)
+            finally:
+                # Closing the upstream connection takes an await
+                await asyncio.sleep(0.01)
+                closed.set()
+        
+        events = provider_stream()
+        await events.__anext__()
+        with anyio.CancelScope() as scope:
+            scope.cancel()
+            await aclose_shielded(events)
+        assert closed.is_set()